@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from ninja import NinjaAPI
 
@@ -8,7 +9,7 @@ from src.api.v1.auth.handlers import router as auth_router
 
 api = NinjaAPI(
     title="HR Platform API",
-    version="1.0.0",
+    version=settings.API_VERSION,
     description="API для поиска вакансий, откликов, профилей и авторизации",
 )
 
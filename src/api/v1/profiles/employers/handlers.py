@@ -1,7 +1,8 @@
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponseBadRequest
 from ninja import Query, Router
 from ninja.security import django_auth_superuser
 
+from src.core.exceptions import InvalidCursor
 from src.api.schemas import APIResponseSchema, ListPaginatedResponse
 from src.api.v1.profiles.employers.schemas import EmployerProfileOut
 from src.apps.profiles.filters import EmployerFilter
@@ -21,18 +22,33 @@ def get_employer_list(
     request: HttpRequest,
     filters: Query[EmployerFilter],
     pagination_in: Query[PaginationIn],
-) -> APIResponseSchema[ListPaginatedResponse[EmployerProfileOut]]:
+) -> (
+    APIResponseSchema[ListPaginatedResponse[EmployerProfileOut]]
+    | HttpResponseBadRequest
+):
     service = container.resolve(BaseEmployerService)
-    profile_list = service.get_list(
-        filters=filters,
-        offset=pagination_in.offset,
-        limit=pagination_in.limit,
-    )
+    next_cursor = None
+    if pagination_in.cursor is not None:
+        try:
+            profile_list, next_cursor = service.get_list_by_cursor(
+                filters=filters,
+                cursor=pagination_in.cursor,
+                limit=pagination_in.limit,
+            )
+        except InvalidCursor as e:
+            return HttpResponseBadRequest(content=e.message)
+    else:
+        profile_list = service.get_list(
+            filters=filters,
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+        )
     profile_count = service.get_total_count(filters=filters)
     pg_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
         total=profile_count,
+        next_cursor=next_cursor,
     )
     data = ListPaginatedResponse(
         items=[EmployerProfileOut.from_entity(p) for p in profile_list],
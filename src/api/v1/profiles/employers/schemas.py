@@ -1,6 +1,7 @@
 from ninja import Schema
 from pydantic import ConfigDict
 
+from src.apps.notifications.models import NotificationMode
 from src.apps.profiles.entities.employers import EmployerEntity
 
 
@@ -10,6 +11,7 @@ class EmployerProfileOut(Schema):
     last_name: str
     email: str
     company_name: str = ''
+    notification_mode: NotificationMode = NotificationMode.INSTANT
 
     @classmethod
     def from_entity(cls, entity: EmployerEntity) -> 'EmployerProfileOut':
@@ -4,6 +4,7 @@ from ninja.security import django_auth
 
 from src.core.exceptions import (
     CandidateDoesNotExist,
+    InvalidCursor,
     NotFound,
     VacancyDoesNotExist,
 )
@@ -15,6 +16,10 @@ from src.apps.profiles.usecases.apply_to_vacancy import ApplyToVacancyUseCase
 from src.apps.profiles.usecases.update_profile import (
     UpdateJobSeekerProfileUseCase,
 )
+from src.apps.vacancies.services.recommendations import (
+    BaseRecommendationService,
+)
+from src.api.v1.vacancies.schemas import VacancyOut
 from src.common.container import container
 from src.common.filters.pagination import PaginationIn, PaginationOut
 
@@ -30,14 +35,28 @@ def get_profile_list(
     request: HttpRequest,
     pagination_in: Query[PaginationIn],
     filters: Query[JobSeekerFilters],
-) -> APIResponseSchema[ListPaginatedResponse[JobSeekerProfileOut]]:
+) -> (
+    APIResponseSchema[ListPaginatedResponse[JobSeekerProfileOut]]
+    | HttpResponseBadRequest
+):
     service = container.resolve(BaseJobSeekerService)
-    profile_entities = service.get_list(
-        filters=filters,
-        offset=pagination_in.offset,
-        limit=pagination_in.limit,
-    )
-    total_profile_count = service.get_total_count(filters=filters)
+    next_cursor = None
+    if pagination_in.cursor is not None:
+        try:
+            profile_entities, next_cursor = service.get_list_by_cursor(
+                filters=filters,
+                cursor=pagination_in.cursor,
+                limit=pagination_in.limit,
+            )
+        except InvalidCursor as e:
+            return HttpResponseBadRequest(content=e.message)
+    else:
+        profile_entities = service.get_list(
+            filters=filters,
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+        )
+    total_profile_count = service.get_estimated_count(filters=filters)
     schemas = [
         JobSeekerProfileOut.from_entity(entity) for entity in profile_entities
     ]
@@ -46,7 +65,9 @@ def get_profile_list(
         pagination=PaginationOut(
             offset=pagination_in.offset,
             limit=pagination_in.limit,
-            total=total_profile_count,
+            total=total_profile_count.value,
+            total_is_exact=total_profile_count.exact,
+            next_cursor=next_cursor,
         ),
     )
     response = APIResponseSchema(data=profiles_list)
@@ -93,6 +114,51 @@ def get_my_profile(
     return response
 
 
+@router.get(
+    '/me/recommendations',
+    response=APIResponseSchema[ListPaginatedResponse[VacancyOut]],
+    auth=django_auth,
+    description="""
+        Open vacancies requiring any skill of the current jobseeker,
+        best rated first. Pages are requested by the 'next_cursor'
+        of the previous response
+    """,
+)
+def get_my_recommendations(
+    request: HttpRequest,
+    pagination_in: Query[PaginationIn],
+) -> (
+    APIResponseSchema[ListPaginatedResponse[VacancyOut]]
+    | HttpResponseBadRequest
+):
+    jobseeker_service = container.resolve(BaseJobSeekerService)
+    service = container.resolve(BaseRecommendationService)
+    try:
+        profile = jobseeker_service.get_by_user_id(
+            user_id=request.user.id  # type: ignore
+        )
+    except NotFound:
+        raise Http404
+    try:
+        vacancy_entities, next_cursor = service.get_recommendations(
+            candidate=profile,
+            cursor=pagination_in.cursor,
+            limit=pagination_in.limit,
+        )
+    except InvalidCursor as e:
+        return HttpResponseBadRequest(content=e.message)
+    recommendations = ListPaginatedResponse(
+        items=[VacancyOut.from_entity(entity) for entity in vacancy_entities],
+        pagination=PaginationOut(
+            offset=0,
+            limit=pagination_in.limit,
+            total=service.get_count(candidate=profile),
+            next_cursor=next_cursor,
+        ),
+    )
+    return APIResponseSchema(data=recommendations)
+
+
 @router.patch('/{id}', response=APIResponseSchema[JobSeekerProfileOut])
 def update_profile(
     request: HttpRequest,
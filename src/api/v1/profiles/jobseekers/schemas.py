@@ -1,6 +1,7 @@
 from ninja import Field, Schema
 from typing import Optional
 
+from src.apps.notifications.models import NotificationMode
 from src.apps.profiles.entities.jobseekers import JobSeekerEntity
 
 
@@ -25,18 +26,20 @@ class JobSeekerProfileUpdate(Schema):
     experience: int | None = None
     skills: list[str] = Field(default_factory=list)
     allow_notifications: bool | None = None
+    notification_mode: NotificationMode | None = None
 
 
 class JobSeekerProfileOut(Schema):
     id: int
     first_name: str
     last_name: str
-    age: int = 0
+    age: int | None = None
     about_me: str
     phone: str = ''
     experience: int = 0
     skills: list[str]
     allow_notifications: bool = False
+    notification_mode: NotificationMode = NotificationMode.INSTANT
     resume_url: Optional[str] = None
 
     @classmethod
@@ -1,12 +1,15 @@
-from django.http import HttpRequest, HttpResponseBadRequest
+from django.http import Http404, HttpRequest, HttpResponseBadRequest
 from ninja import Query, Router
 from ninja.security import django_auth
 
-from src.core.exceptions import ApplicationException
+from src.core.exceptions import (
+    ApplicationException,
+    InvalidCursor,
+    NotFound,
+    VacancyAccessDenied,
+)
 from src.api.schemas import APIResponseSchema, ListPaginatedResponse
 from src.api.v1.profiles.jobseekers.schemas import JobSeekerProfileOut
-from src.apps.profiles.filters import JobSeekerFilters
-from src.apps.profiles.services.base import BaseJobSeekerService
 from src.apps.vacancies.entities import VacancyEntity
 from src.apps.vacancies.filters import VacancyFilters
 from src.apps.vacancies.services.vacancy import BaseVacancyService
@@ -14,13 +17,18 @@ from src.apps.vacancies.usecases.create_vacancy import CreateVacancyUseCase
 from src.apps.vacancies.usecases.filter_candidates import (
     FilterCandidatesInVacancyUseCase,
 )
+from src.apps.vacancies.usecases.find_matches import (
+    FindCandidateMatchesUseCase,
+)
 
 from src.common.container import container
 from src.common.filters.pagination import PaginationIn, PaginationOut
+from src.common.utils.cache import cache_handler
 
 from .schemas import VacancyIn, VacancyOut
 
 from src.apps.vacancies.models import Vacancy
+from src.apps.profiles.models.employers import EmployerProfile
 from src.apps.profiles.models.jobseekers import JobSeekerProfile
 from src.apps.vacancies.models import VacancyInterest
 
@@ -30,25 +38,41 @@ router = Router(tags=['vacancies'])
 
 
 @router.get('', response=APIResponseSchema[ListPaginatedResponse[VacancyOut]])
+@cache_handler(route='vacancy-list', tags=lambda response: ['vacancy-list'])
 def get_vacancy_list(
     request: HttpRequest,
     pagination_in: Query[PaginationIn],
     filters: Query[VacancyFilters],
-) -> APIResponseSchema[ListPaginatedResponse[VacancyOut]]:
+) -> (
+    APIResponseSchema[ListPaginatedResponse[VacancyOut]] | HttpResponseBadRequest
+):
     service = container.resolve(BaseVacancyService)
-    vacancy_entity_list = service.get_list(
-        offset=pagination_in.offset,
-        limit=pagination_in.limit,
-        filters=filters,
-    )
-    vacancy_count = service.get_total_count(filters=filters)
+    next_cursor = None
+    if pagination_in.cursor is not None:
+        try:
+            vacancy_entity_list, next_cursor = service.get_list_by_cursor(
+                cursor=pagination_in.cursor,
+                limit=pagination_in.limit,
+                filters=filters,
+            )
+        except InvalidCursor as e:
+            return HttpResponseBadRequest(content=e.message)
+    else:
+        vacancy_entity_list = service.get_list(
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+            filters=filters,
+        )
+    vacancy_count = service.get_estimated_count(filters=filters)
     vacancy_list = [
         VacancyOut.from_entity(vacancy) for vacancy in vacancy_entity_list
     ]
     pagination_out = PaginationOut(
-        total=vacancy_count,
+        total=vacancy_count.value,
+        total_is_exact=vacancy_count.exact,
         offset=pagination_in.offset,
         limit=pagination_in.limit,
+        next_cursor=next_cursor,
     )
     response = APIResponseSchema(
         data=ListPaginatedResponse(
@@ -59,6 +83,26 @@ def get_vacancy_list(
     return response
 
 
+@router.get('/{id}', response=APIResponseSchema[VacancyOut])
+@cache_handler(
+    route='vacancy-detail',
+    tags=lambda response: [
+        f'vacancy:{response.data.id}',
+        f'employer:{response.data.employer.id}',
+    ],
+)
+def get_vacancy(
+    request: HttpRequest,
+    id: int,
+) -> APIResponseSchema[VacancyOut]:
+    service = container.resolve(BaseVacancyService)
+    try:
+        vacancy = service.get(id=id)
+    except NotFound:
+        raise Http404
+    return APIResponseSchema(data=VacancyOut.from_entity(vacancy))
+
+
 @router.post('', response=APIResponseSchema[VacancyOut])
 def create_vacancy(
     request: HttpRequest,
@@ -92,17 +136,19 @@ def filter_candidates_in_vacancy(
     id: int,
 ) -> APIResponseSchema[ListPaginatedResponse[JobSeekerProfileOut]]:
     usecase = container.resolve(FilterCandidatesInVacancyUseCase)
-    jobseeker_service = container.resolve(BaseJobSeekerService)
-    total = jobseeker_service.get_total_count(
-        filters=JobSeekerFilters(vacancy_id=id)
-    )
-    candidates = usecase.execute(
-        vacancy_id=id,
-        offset=pagination_in.offset,
-        limit=pagination_in.limit,
-    )
+    try:
+        candidates, total = usecase.execute(
+            vacancy_id=id,
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+        )
+    except NotFound:
+        raise Http404
     data = ListPaginatedResponse(
-        items=candidates,
+        items=[
+            JobSeekerProfileOut.from_entity(candidate)
+            for candidate in candidates
+        ],
         pagination=PaginationOut(
             total=total,
             offset=pagination_in.offset,
@@ -112,6 +158,57 @@ def filter_candidates_in_vacancy(
     response = APIResponseSchema(data=data)
     return response
 
+
+@router.get(
+    '/{id}/matches',
+    response=APIResponseSchema[ListPaginatedResponse[JobSeekerProfileOut]],
+    description="""
+        Jobseekers who have not applied to the vacancy yet, allow
+        notifications and match its requirements best.
+        Available to the employer of the vacancy only
+    """,
+    auth=django_auth,
+)
+def find_candidate_matches(
+    request: HttpRequest,
+    pagination_in: Query[PaginationIn],
+    id: int,
+) -> (
+    APIResponseSchema[ListPaginatedResponse[JobSeekerProfileOut]]
+    | HttpResponseBadRequest
+):
+    employer_id = (
+        EmployerProfile.objects.filter(user=request.user)
+        .values_list('id', flat=True)
+        .first()
+    )
+    if employer_id is None:
+        return HttpResponseBadRequest("Только работодатели могут искать кандидатов")
+    usecase = container.resolve(FindCandidateMatchesUseCase)
+    try:
+        candidates, total = usecase.execute(
+            vacancy_id=id,
+            employer_id=employer_id,
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+        )
+    except NotFound:
+        raise Http404
+    except VacancyAccessDenied:
+        return HttpResponseBadRequest("Это не ваша вакансия")
+    data = ListPaginatedResponse(
+        items=[
+            JobSeekerProfileOut.from_entity(candidate)
+            for candidate in candidates
+        ],
+        pagination=PaginationOut(
+            total=total,
+            offset=pagination_in.offset,
+            limit=pagination_in.limit,
+        ),
+    )
+    return APIResponseSchema(data=data)
+
 @router.post('/{id}/apply', response=APIResponseSchema[dict], auth=django_auth)
 def apply_to_vacancy(
     request: HttpRequest,
@@ -173,7 +270,9 @@ def update_vacancy(
         setattr(vacancy, field, value)
     vacancy.save()
 
-    return APIResponseSchema(data=VacancyOut.from_entity(vacancy.to_entity()))
+    return APIResponseSchema(
+        data=VacancyOut.from_entity(vacancy.to_entity(with_candidates=True))
+    )
 
 @router.delete('/{id}', response=APIResponseSchema[dict], auth=django_auth)
 def delete_vacancy(request: HttpRequest, id: int):
@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import DigestEntry, OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ('id', 'task', 'created_at', 'sent_at', 'attempts')
+    list_filter = ('task',)
+    readonly_fields = ('created_at',)
+
+
+@admin.register(DigestEntry)
+class DigestEntryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model_type', 'object_id', 'subject', 'created_at')
+    list_filter = ('model_type',)
+    readonly_fields = ('created_at',)
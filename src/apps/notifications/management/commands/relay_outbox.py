@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.common.container import container
+from src.apps.notifications.services.outbox import BaseOutboxService
+
+
+class Command(BaseCommand):
+    help = 'Sends pending outbox messages to the broker'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep relaying every --interval seconds',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait once the outbox is drained',
+        )
+
+    def handle(self, *args, loop: bool, interval: float, **options):
+        service: BaseOutboxService = container.resolve(BaseOutboxService)
+        while True:
+            sent = service.relay()
+            if sent:
+                self.stdout.write(f'Sent {sent} outbox messages')
+            if not loop:
+                break
+            if not sent:
+                service.purge()
+                time.sleep(interval)
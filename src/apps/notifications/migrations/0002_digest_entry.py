@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:47
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DigestEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_type', models.CharField(max_length=50)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('subject', models.CharField(blank=True, max_length=255)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+            ],
+            options={
+                'verbose_name_plural': 'digest entries',
+                'indexes': [models.Index(fields=['model_type', 'object_id', 'created_at'], name='notifications_digest_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_digest_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='digestentry',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.db import models
+from django.utils import timezone
+
+
+class NotificationMode(models.TextChoices):
+    INSTANT = 'instant', 'Instant'
+    # Notifications are collected and sent together, see DigestEntry
+    DIGEST = 'digest', 'Digest'
+
+
+class OutboxMessage(models.Model):
+    """
+    Celery task call written in the transaction of the change it is about,
+    it is sent to the broker by the relay once committed (see services)
+    """
+
+    task = models.CharField(
+        max_length=255,
+    )
+    kwargs = models.JSONField(
+        default=dict,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+    )
+    last_error = models.TextField(
+        blank=True,
+        default='',
+    )
+
+    class Meta:
+        ordering = ('id',)
+        indexes = (
+            # The relay only reads pending messages in the order of ids
+            models.Index(
+                fields=['id'],
+                condition=models.Q(sent_at__isnull=True),
+                name='notifications_outbox_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.task} #{self.id}'
+
+
+class DigestEntry(models.Model):
+    """
+    Notification of a recipient in the digest mode waiting to be sent
+    together with the others (see services)
+    """
+
+    model_type = models.CharField(
+        max_length=50,
+    )
+    object_id = models.PositiveBigIntegerField()
+    subject = models.CharField(
+        max_length=255,
+        blank=True,
+    )
+    message = models.TextField()
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+    )
+    # Set while a flush sends the entry or after its digest was deferred
+    claimed_until = models.DateTimeField(
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name_plural = 'digest entries'
+        indexes = (
+            models.Index(
+                fields=['model_type', 'object_id', 'created_at'],
+                name='notifications_digest_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.model_type} #{self.object_id}: {self.subject}'
@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import timedelta
+from logging import Logger
+from typing import Iterable, TypeVar
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from src.common.services.base import BaseNotificationService
+from src.common.services.exceptions import (
+    NotificationDeferred,
+    NotificationServiceException,
+)
+from src.common.services.notifications import idempotency_key
+from src.common.utils.metrics import increment_metric
+from src.common.utils.orm import get_orm_models
+from src.apps.notifications.models import DigestEntry
+
+
+ET = TypeVar('ET')
+
+
+class BaseDigestService(ABC):
+    @abstractmethod
+    def add(self, object: ET, subject: str, message: str) -> None:
+        """Collects a notification of 'object' for its next digest"""
+
+    @abstractmethod
+    def add_group(
+        self,
+        objects: Iterable[ET],
+        message: str,
+        subject: str | None = None,
+    ) -> None:
+        """Collects a group notification for the digests of 'objects'"""
+
+    @abstractmethod
+    def flush(self) -> int:
+        """Sends the digests which are due, returns the number sent"""
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ORMDigestService(BaseDigestService):
+    """
+    Keeps collected notifications in the DigestEntry table. A digest is due
+    when its oldest notification waited for 'window' seconds or it has
+    'max_events' notifications, then they are sent by 'notification_service'
+    as one. Recipients are claimed with SKIP LOCKED like the outbox relay,
+    their digests are sent after the claim is committed. Deferred or failed
+    digests are claimed again after their delay
+    """
+
+    logger: Logger
+    notification_service: BaseNotificationService
+    window: int = settings.NOTIFICATION_DIGEST_WINDOW
+    max_events: int = settings.NOTIFICATION_DIGEST_MAX_EVENTS
+    batch_size: int = settings.NOTIFICATION_DIGEST_BATCH_SIZE
+    claim_timeout: int = settings.NOTIFICATION_DIGEST_CLAIM_TIMEOUT
+    retry_delay: int = settings.NOTIFICATION_RETRY_DELAY
+
+    def add(self, object: ET, subject: str, message: str) -> None:
+        DigestEntry.objects.create(
+            model_type=object.__class__.__name__,
+            object_id=object.id,
+            subject=subject,
+            message=message,
+        )
+        increment_metric('notifications:digested')
+
+    def add_group(
+        self,
+        objects: Iterable[ET],
+        message: str,
+        subject: str | None = None,
+    ) -> None:
+        entries = DigestEntry.objects.bulk_create(
+            DigestEntry(
+                model_type=obj.__class__.__name__,
+                object_id=obj.id,
+                subject=subject or '',
+                message=message,
+            )
+            for obj in objects
+        )
+        increment_metric('notifications:digested', len(entries))
+
+    def flush(self) -> int:
+        now = timezone.now()
+        due = (
+            DigestEntry.objects.filter(
+                Q(claimed_until__isnull=True) | Q(claimed_until__lte=now)
+            )
+            .values('model_type', 'object_id')
+            .annotate(first_at=Min('created_at'), events=Count('id'))
+            .filter(
+                Q(first_at__lte=now - timedelta(seconds=self.window))
+                | Q(events__gte=self.max_events)
+            )
+            .order_by('first_at')[: self.batch_size]
+        )
+        sent = 0
+        for recipient in due:
+            entries = self._claim(
+                model_type=recipient['model_type'],
+                object_id=recipient['object_id'],
+            )
+            if not entries:
+                continue
+            ids = [entry.id for entry in entries]
+            # Entries of digests which were not sent are kept for later
+            # flushes, other recipients are not held up by them
+            try:
+                sent += self._send(entries)
+            except NotificationDeferred as e:
+                self._release(ids, delay=e.retry_after)
+                continue
+            except (OSError, NotificationServiceException) as e:
+                self.logger.warning(
+                    msg='Notification digest failed',
+                    extra={'info': f'recipient: {recipient}, error: {e}'},
+                )
+                self._release(ids, delay=self.retry_delay)
+                continue
+            DigestEntry.objects.filter(id__in=ids).delete()
+        if sent:
+            increment_metric('notifications:digests', sent)
+            self.logger.info(
+                'Notification digests sent',
+                extra={'info': f'digests: {sent}'},
+            )
+        return sent
+
+    def _claim(self, model_type: str, object_id: int) -> list[DigestEntry]:
+        """
+        Claims the entries of a recipient for 'claim_timeout' seconds,
+        they are sent once the locks are released
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            entries = list(
+                DigestEntry.objects.filter(
+                    Q(claimed_until__isnull=True) | Q(claimed_until__lte=now),
+                    model_type=model_type,
+                    object_id=object_id,
+                )
+                .order_by('id')
+                .select_for_update(skip_locked=True)
+            )
+            DigestEntry.objects.filter(
+                id__in=[entry.id for entry in entries]
+            ).update(claimed_until=now + timedelta(seconds=self.claim_timeout))
+        return entries
+
+    def _release(self, ids: list[int], delay: float) -> None:
+        DigestEntry.objects.filter(id__in=ids).update(
+            claimed_until=timezone.now() + timedelta(seconds=delay)
+        )
+
+    def _send(self, entries: list[DigestEntry]) -> int:
+        object = get_orm_models(
+            model_type=entries[0].model_type,
+            list_ids=[entries[0].object_id],
+            first=True,
+        )
+        if object is None:
+            return 0
+        with idempotency_key(f'digest:{entries[0].id}'):
+            self.notification_service.send_notification(
+                object=object,
+                subject=f'You have {len(entries)} new notifications',
+                message='\n\n'.join(
+                    f'{entry.subject}\n{entry.message}'
+                    if entry.subject
+                    else entry.message
+                    for entry in entries
+                ),
+            )
+        return 1
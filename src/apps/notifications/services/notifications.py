@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import Iterable, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+
+from src.common.services.base import BaseNotificationService
+from src.common.utils.iterables import chunked
+from src.apps.notifications.models import NotificationMode
+from src.apps.notifications.services.digests import BaseDigestService
+from src.apps.notifications.services.outbox import BaseOutboxService
+
+
+ET = TypeVar('ET')
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class OutboxNotificationService(BaseNotificationService[ET]):
+    """
+    Writes notifications to the outbox in the current transaction,
+    so they are only sent if it is committed. The relay calls the
+    notification 'task' (CeleryNotificationService) with them,
+    groups are written by chunks of 'chunk_size' recipients.
+    Each of them gets an idempotency key in case it is relayed twice
+    """
+
+    outbox_service: BaseOutboxService
+    task: str
+    chunk_size: int = settings.NOTIFICATION_CHUNK_SIZE
+
+    def send_notification(
+        self,
+        message: str,
+        subject: str,
+        object: ET,
+    ) -> None:
+        self.outbox_service.publish(
+            task=self.task,
+            message=message,
+            subject=subject,
+            object_id=object.id,
+            model_type=object.__class__.__name__,
+            idempotency_key=uuid4().hex,
+        )
+
+    def send_notification_group(
+        self,
+        message: str,
+        objects: Iterable[ET],
+        subject: str | None = None,
+    ) -> None:
+        for chunk in chunked(objects, self.chunk_size):
+            self.outbox_service.publish(
+                task=self.task,
+                message=message,
+                subject=subject,
+                object_ids=[obj.id for obj in chunk],
+                model_type=chunk[0].__class__.__name__,
+                group=True,
+                idempotency_key=uuid4().hex,
+            )
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class DigestNotificationService(BaseNotificationService[ET]):
+    """
+    Collects notifications of recipients who chose the digest mode
+    for their digests, others are sent by 'notification_service' at once
+    """
+
+    notification_service: BaseNotificationService
+    digest_service: BaseDigestService
+
+    def send_notification(
+        self,
+        message: str,
+        subject: str,
+        object: ET,
+    ) -> None:
+        if self._is_digested(object):
+            self.digest_service.add(
+                object=object, subject=subject, message=message
+            )
+            return
+        self.notification_service.send_notification(
+            message=message,
+            subject=subject,
+            object=object,
+        )
+
+    def send_notification_group(
+        self,
+        message: str,
+        objects: Iterable[ET],
+        subject: str | None = None,
+    ) -> None:
+        instant, digested = [], []
+        for obj in objects:
+            (digested if self._is_digested(obj) else instant).append(obj)
+        # Sent first, so a retried group does not collect digests twice
+        if instant:
+            self.notification_service.send_notification_group(
+                message=message,
+                objects=instant,
+                subject=subject,
+            )
+        if digested:
+            self.digest_service.add_group(
+                objects=digested, message=message, subject=subject
+            )
+
+    @staticmethod
+    def _is_digested(object: ET) -> bool:
+        mode = getattr(object, 'notification_mode', NotificationMode.INSTANT)
+        return mode == NotificationMode.DIGEST
@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import timedelta
+from logging import Logger
+from typing import Any
+
+from celery import current_app
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from src.apps.notifications.models import OutboxMessage
+
+
+class BaseOutboxService(ABC):
+    @abstractmethod
+    def publish(self, task: str, **kwargs: Any) -> None:
+        """
+        Writes a call of the Celery 'task' in the current transaction,
+        it is sent to the broker by 'relay' once committed
+        """
+
+    @abstractmethod
+    def relay(self) -> int:
+        """Sends a batch of pending calls, returns the number sent"""
+
+    @abstractmethod
+    def purge(self) -> int:
+        """Deletes old sent calls, returns the number deleted"""
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ORMOutboxService(BaseOutboxService):
+    """
+    Keeps task calls in the OutboxMessage table. Relays lock their batches
+    with SELECT ... FOR UPDATE SKIP LOCKED, so several of them can run
+    at once. A call is retried by later relays until it is sent or fails
+    'max_attempts' times
+    """
+
+    logger: Logger
+    batch_size: int = settings.OUTBOX_BATCH_SIZE
+    max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS
+    retention: int = settings.OUTBOX_RETENTION
+
+    def publish(self, task: str, **kwargs: Any) -> None:
+        OutboxMessage.objects.create(task=task, kwargs=kwargs)
+
+    def relay(self) -> int:
+        sent = 0
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.filter(
+                    sent_at__isnull=True,
+                    attempts__lt=self.max_attempts,
+                )
+                .order_by('id')
+                .select_for_update(skip_locked=True)[: self.batch_size]
+            )
+            for message in messages:
+                try:
+                    current_app.tasks[message.task].apply_async(
+                        kwargs=message.kwargs
+                    )
+                except Exception as e:
+                    # The broker is likely unavailable, the rest of the batch
+                    # is left to the next relay
+                    message.attempts += 1
+                    message.last_error = repr(e)
+                    self.logger.warning(
+                        msg=f'Outbox message {message.id} was not sent',
+                        extra={'info': f'task: {message.task}, error: {e!r}'},
+                    )
+                    break
+                message.sent_at = timezone.now()
+                sent += 1
+            OutboxMessage.objects.bulk_update(
+                messages, fields=['sent_at', 'attempts', 'last_error']
+            )
+        return sent
+
+    def purge(self) -> int:
+        sent_before = timezone.now() - timedelta(seconds=self.retention)
+        deleted, _ = OutboxMessage.objects.filter(
+            sent_at__lt=sent_before
+        ).delete()
+        return deleted
@@ -0,0 +1,29 @@
+from celery import shared_task
+
+from src.apps.notifications.services.digests import BaseDigestService
+from src.apps.notifications.services.outbox import BaseOutboxService
+
+
+@shared_task(ignore_result=True)
+def relay_outbox() -> None:
+    """
+    Sends pending outbox messages to the broker batch by batch
+    and purges old sent ones, scheduled by Celery beat
+    """
+    # The container imports use cases which publish to the outbox
+    from src.common.container import container
+
+    service: BaseOutboxService = container.resolve(BaseOutboxService)
+    while service.relay():
+        pass
+    service.purge()
+
+
+@shared_task(ignore_result=True)
+def flush_notification_digests() -> None:
+    """Sends notification digests which are due, scheduled by Celery beat"""
+    from src.common.container import container
+
+    service: BaseDigestService = container.resolve(BaseDigestService)
+    while service.flush():
+        pass
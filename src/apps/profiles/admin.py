@@ -2,6 +2,7 @@ from django.contrib import admin
 
 from .models.jobseekers import JobSeekerProfile
 from .models.employers import EmployerProfile
+from .models.skills import Skill
 
 
 
@@ -12,3 +13,12 @@ class EmployeeProfileAdmin(admin.ModelAdmin):
         'first_name',
         'last_name',
     ]
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'name',
+    ]
+    search_fields = ['name']
@@ -8,6 +8,7 @@ class BaseProfileEntity:
     first_name: str | None = None
     last_name: str | None = None
     email: str | None = None
+    notification_mode: str | None = None
 
     @abstractmethod
     def to_dict(self) -> dict: ...
@@ -14,4 +14,5 @@ class EmployerEntity(BaseProfileEntity):
             'last_name': self.last_name,
             'email': self.email,
             'company_name': self.company_name,
+            'notification_mode': self.notification_mode,
         }
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from datetime import date
 
 from .base import BaseProfileEntity
 
@@ -6,11 +7,14 @@ from .base import BaseProfileEntity
 @dataclass
 class JobSeekerEntity(BaseProfileEntity):
     age: int | None = None
+    birth_date: date | None = None
     phone: str | None = None
     about_me: str | None = None
     experience: int | None = None
     skills: list[str] = field(default_factory=list)
+    skill_ids: list[int] = field(default_factory=list)
     allow_notifications: bool = False
+    resume_url: str | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -24,4 +28,6 @@ class JobSeekerEntity(BaseProfileEntity):
             'experience': self.experience,
             'skills': self.skills,
             'allow_notifications': self.allow_notifications,
+            'notification_mode': self.notification_mode,
+            'resume_url': self.resume_url,
         }
@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field
 
+from src.common.filters.skills import SkillMatch
+
 
 class JobSeekerFilters(BaseModel):
     skills: list[str] = Field(default_factory=list)
+    skills_match: SkillMatch = SkillMatch.ALL
+    skills_min_match: int = 0
     age__gte: int = 18
     experience__gte: int = 0
     vacancy_id: int = 0
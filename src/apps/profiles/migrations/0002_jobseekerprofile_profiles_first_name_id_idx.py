@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobseekerprofile',
+            index=models.Index(fields=['-first_name', 'id'], name='profiles_first_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:11
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_jobseekerprofile_profiles_first_name_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobseekerprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='profiles_skills_idx'),
+        ),
+    ]
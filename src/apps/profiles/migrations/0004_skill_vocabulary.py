@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:23
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+SKILL_IDS_TRIGGER = '''
+CREATE FUNCTION profiles_skill_ids(names varchar[]) RETURNS integer[] AS $$
+BEGIN
+    INSERT INTO profiles_skill (name)
+    SELECT DISTINCT lower(skill) FROM unnest(names) AS skill
+    ON CONFLICT (name) DO NOTHING;
+    RETURN ARRAY(
+        SELECT id FROM profiles_skill
+        WHERE name IN (SELECT lower(skill) FROM unnest(names) AS skill)
+        ORDER BY id
+    );
+END
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION profiles_jobseekerprofile_skill_ids_update() RETURNS trigger AS $$
+BEGIN
+    NEW.skill_ids := profiles_skill_ids(NEW.skills);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER profiles_jobseekerprofile_skill_ids_trigger
+BEFORE INSERT OR UPDATE OF skills
+ON profiles_jobseekerprofile
+FOR EACH ROW EXECUTE FUNCTION profiles_jobseekerprofile_skill_ids_update();
+'''
+
+DROP_SKILL_IDS_TRIGGER = '''
+DROP TRIGGER profiles_jobseekerprofile_skill_ids_trigger
+ON profiles_jobseekerprofile;
+DROP FUNCTION profiles_jobseekerprofile_skill_ids_update();
+DROP FUNCTION profiles_skill_ids(varchar[]);
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_skills_gin_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=50, unique=True)),
+            ],
+            options={
+                'ordering': ('name',),
+            },
+        ),
+        migrations.AddField(
+            model_name='jobseekerprofile',
+            name='skill_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), default=list, editable=False, size=None),
+        ),
+        migrations.RunSQL(
+            sql=SKILL_IDS_TRIGGER,
+            reverse_sql=DROP_SKILL_IDS_TRIGGER,
+        ),
+        migrations.AddIndex(
+            model_name='jobseekerprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skill_ids'], name='profiles_skill_ids_idx'),
+        ),
+    ]
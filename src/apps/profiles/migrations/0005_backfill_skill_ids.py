@@ -0,0 +1,37 @@
+from django.db import migrations
+from django.db.models import F
+
+
+BATCH_SIZE = 1000
+
+
+def backfill_skill_ids(apps, schema_editor):
+    JobSeekerProfile = apps.get_model('profiles', 'JobSeekerProfile')
+    last_id = 0
+    while True:
+        ids = list(
+            JobSeekerProfile.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+        # Updating the skills fires the trigger which sets skill_ids
+        JobSeekerProfile.objects.filter(id__in=ids).update(skills=F('skills'))
+        last_id = ids[-1]
+
+
+class Migration(migrations.Migration):
+    # Every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ('profiles', '0004_skill_vocabulary'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_skill_ids,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:34
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_backfill_skill_ids'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobseekerprofile',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('allow_notifications', True)), fields=['skill_ids'], name='profiles_sourcing_idx'),
+        ),
+    ]
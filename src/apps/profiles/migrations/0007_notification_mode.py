@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_sourcing_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employerprofile',
+            name='notification_mode',
+            field=models.CharField(choices=[('instant', 'Instant'), ('digest', 'Digest')], default='instant', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='jobseekerprofile',
+            name='notification_mode',
+            field=models.CharField(choices=[('instant', 'Instant'), ('digest', 'Digest')], default='instant', max_length=10),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from django.db import models
 from src.apps.users.models import CustomUser
+from src.apps.notifications.models import NotificationMode
 from src.apps.profiles.entities.base import BaseProfileEntity
 
 from src.common.models.base import TimedBaseModel
@@ -24,6 +25,11 @@ class BaseProfile(TimedBaseModel):
         blank=True,
         verbose_name="Город"
     )
+    notification_mode = models.CharField(
+        max_length=10,
+        choices=NotificationMode.choices,
+        default=NotificationMode.INSTANT,
+    )
 
     class Meta:
         abstract = True
@@ -8,6 +8,9 @@ from .base import BaseProfile
 class EmployerProfile(BaseProfile):
     company_name = models.CharField(max_length=50)
 
+    # Keyset pagination order, backed by the primary key index
+    CURSOR_ORDERING = ('id',)
+
     def to_entity(self) -> EmployerEntity:
         return EmployerEntity(
             id=self.id,  # type: ignore
@@ -15,6 +18,7 @@ class EmployerProfile(BaseProfile):
             first_name=self.first_name,
             last_name=self.last_name,
             company_name=self.company_name,
+            notification_mode=self.notification_mode,
         )
 
     @classmethod
@@ -1,9 +1,13 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator, FileExtensionValidator
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 
 from src.apps.profiles.entities.jobseekers import JobSeekerEntity
 
+from src.common.models.base import TrackedFieldsMixin
+from src.common.models.fields import ReturningArrayField
+
 from .base import BaseProfile
 
 from django.core.exceptions import ValidationError
@@ -11,7 +15,7 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 
-class JobSeekerProfile(BaseProfile):
+class JobSeekerProfile(TrackedFieldsMixin, BaseProfile):
     phone = models.CharField(
         max_length=25,
         blank=False,
@@ -38,6 +42,13 @@ class JobSeekerProfile(BaseProfile):
         models.CharField(max_length=30),
         blank=False,
     )
+    # Sorted ids of the skills in the Skill vocabulary,
+    # maintained by a database trigger (see migrations)
+    skill_ids = ReturningArrayField(
+        models.IntegerField(),
+        default=list,
+        editable=False,
+    )
     allow_notifications = models.BooleanField(
         default=False,
     )
@@ -56,12 +67,39 @@ class JobSeekerProfile(BaseProfile):
         if self.resume and self.resume.size > 10 * 1024 * 1024:  # 10 МБ
             raise ValidationError("Резюме не должно превышать 10 МБ")
 
+    # Keyset pagination order, must be unique and match Meta.ordering
+    CURSOR_ORDERING = ('-first_name', 'id')
+    # Match scores are recomputed when these fields change
+    tracked_fields = ('skills', 'experience')
+
     class Meta:
         ordering = ('-first_name',)
+        indexes = (
+            models.Index(
+                fields=['-first_name', 'id'],
+                name='profiles_first_name_id_idx',
+            ),
+            GinIndex(fields=['skills'], name='profiles_skills_idx'),
+            GinIndex(fields=['skill_ids'], name='profiles_skill_ids_idx'),
+            # Only jobseekers allowing notifications are sourced for vacancies
+            GinIndex(
+                fields=['skill_ids'],
+                condition=models.Q(allow_notifications=True),
+                name='profiles_sourcing_idx',
+            ),
+        )
 
     def save(self, *args, **kwargs):
-        self.skills = [skill.lower() for skill in self.skills]
-        return super().save(*args, **kwargs)
+        self.skills = list(dict.fromkeys(skill.lower() for skill in self.skills))
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        # Inserts return skill_ids, after updates of the skills it is
+        # deferred and loaded once accessed
+        if adding:
+            return
+        if update_fields is None or 'skills' in update_fields:
+            self.__dict__.pop('skill_ids', None)
 
     def to_entity(self) -> JobSeekerEntity:
         return JobSeekerEntity(
@@ -74,7 +112,9 @@ class JobSeekerProfile(BaseProfile):
             about_me=self.about_me,
             experience=self.experience,
             skills=self.skills,
+            skill_ids=self.skill_ids,
             phone=self.phone,
+            notification_mode=self.notification_mode,
             resume_url=self.resume.url if self.resume else None,
         )
 
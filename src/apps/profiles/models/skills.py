@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class Skill(models.Model):
+    """
+    Vocabulary of skills, profiles and vacancies keep their skills
+    as sorted arrays of ids of the vocabulary as well (see 'skill_ids').
+    Skills are added by a database trigger once they are used
+    """
+
+    id = models.AutoField(primary_key=True)
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+    )
+
+    class Meta:
+        ordering = ('name',)
+
+    def __str__(self):
+        return self.name
@@ -16,6 +16,10 @@ class BaseJobSeekerService(BaseProfileService):
     def get_by_user_id(self, user_id: int) -> JobSeekerEntity:
         ...
 
+    @abstractmethod
+    def get_by_ids(self, ids: list[int]) -> list[JobSeekerEntity]:
+        """Returns the existing jobseekers in the order of 'ids'"""
+
 
 class BaseEmployerService(BaseProfileService):
     ...
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from functools import partial
+from logging import Logger
+from typing import Iterable
+
+from src.common.services.counters import TotalCount
+from src.common.utils.cache import EntityCache
+from src.apps.profiles.entities.employers import EmployerEntity
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.profiles.filters import EmployerFilter, JobSeekerFilters
+
+from .base import BaseEmployerService, BaseJobSeekerService
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class CachedEmployerService(BaseEmployerService):
+    """Caches employers by id in 'entity_cache', other calls are delegated"""
+
+    logger: Logger
+    employer_service: BaseEmployerService
+    entity_cache: EntityCache
+
+    def get_list(
+        self,
+        filters: EmployerFilter,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[EmployerEntity]:
+        return self.employer_service.get_list(
+            filters=filters, offset=offset, limit=limit
+        )
+
+    def get_list_by_cursor(
+        self,
+        filters: EmployerFilter,
+        cursor: str,
+        limit: int = 20,
+    ) -> tuple[list[EmployerEntity], str | None]:
+        return self.employer_service.get_list_by_cursor(
+            filters=filters, cursor=cursor, limit=limit
+        )
+
+    def get_total_count(self, filters: EmployerFilter) -> int:
+        return self.employer_service.get_total_count(filters=filters)
+
+    def get_estimated_count(self, filters: EmployerFilter) -> TotalCount:
+        return self.employer_service.get_estimated_count(filters=filters)
+
+    def get_all(self, filters: EmployerFilter) -> Iterable[EmployerEntity]:
+        return self.employer_service.get_all(filters=filters)
+
+    def get(self, id: int) -> EmployerEntity | None:
+        return self.entity_cache.get_or_load(
+            id, partial(self.employer_service.get, id=id)
+        )
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class CachedJobSeekerService(BaseJobSeekerService):
+    """Caches jobseekers by id in 'entity_cache', other calls are delegated"""
+
+    logger: Logger
+    jobseeker_service: BaseJobSeekerService
+    entity_cache: EntityCache
+
+    def get_list(
+        self,
+        filters: JobSeekerFilters,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[JobSeekerEntity]:
+        return self.jobseeker_service.get_list(
+            filters=filters, offset=offset, limit=limit
+        )
+
+    def get_list_by_cursor(
+        self,
+        filters: JobSeekerFilters,
+        cursor: str,
+        limit: int = 20,
+    ) -> tuple[list[JobSeekerEntity], str | None]:
+        return self.jobseeker_service.get_list_by_cursor(
+            filters=filters, cursor=cursor, limit=limit
+        )
+
+    def get_total_count(self, filters: JobSeekerFilters) -> int:
+        return self.jobseeker_service.get_total_count(filters=filters)
+
+    def get_estimated_count(self, filters: JobSeekerFilters) -> TotalCount:
+        return self.jobseeker_service.get_estimated_count(filters=filters)
+
+    def get_all(
+        self,
+        filters: JobSeekerFilters = JobSeekerFilters(allow_notifications=True),
+    ) -> Iterable[JobSeekerEntity]:
+        return self.jobseeker_service.get_all(filters=filters)
+
+    def get(self, id: int) -> JobSeekerEntity | None:
+        return self.entity_cache.get_or_load(
+            id, partial(self.jobseeker_service.get, id=id)
+        )
+
+    def get_by_ids(self, ids: list[int]) -> list[JobSeekerEntity]:
+        return self.jobseeker_service.get_by_ids(ids=ids)
+
+    def get_by_user_id(self, user_id: int) -> JobSeekerEntity:
+        return self.jobseeker_service.get_by_user_id(user_id=user_id)
+
+    def update(self, entity: JobSeekerEntity) -> JobSeekerEntity:
+        return self.jobseeker_service.update(entity=entity)
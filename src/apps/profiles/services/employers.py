@@ -4,6 +4,7 @@ from typing import Iterable
 from django.db.models import Q
 
 from src.core.exceptions import NotFound
+from src.common.utils.cursor import paginate_by_cursor
 from src.apps.profiles.entities.employers import EmployerEntity
 from src.apps.profiles.models.employers import EmployerProfile
 from src.apps.profiles.filters import EmployerFilter
@@ -51,6 +52,18 @@ class ORMEmployerService(BaseEmployerService):
         employers = EmployerProfile.objects.filter(query)[offset : offset + limit]
         return [employer.to_entity() for employer in employers]
 
+    def get_list_by_cursor(
+        self, filters: EmployerFilter, cursor: str, limit: int
+    ) -> tuple[list[EmployerEntity], str | None]:
+        query = self._build_queryset(filters)
+        employers, next_cursor = paginate_by_cursor(
+            queryset=EmployerProfile.objects.filter(query),
+            ordering=EmployerProfile.CURSOR_ORDERING,
+            cursor=cursor,
+            limit=limit,
+        )
+        return [employer.to_entity() for employer in employers], next_cursor
+
     def get_total_count(self, filters: EmployerFilter) -> int:
         query = self._build_queryset(filters)
         total_count = EmployerProfile.objects.filter(query).count()
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from logging import Logger
 from typing import Iterable
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 
 from src.core.exceptions import CandidateDoesNotExist, NotFound
-from src.apps.vacancies.models import Vacancy
+from src.common.services.counters import BaseCounterService, TotalCount
+from src.common.filters.skills import build_skills_query
+from src.common.utils.cursor import paginate_by_cursor
 from src.apps.profiles.entities.jobseekers import JobSeekerEntity
 from src.apps.profiles.models.jobseekers import JobSeekerProfile
 from src.apps.profiles.filters import JobSeekerFilters
@@ -15,6 +19,8 @@ from .base import BaseJobSeekerService
 @dataclass(eq=False, repr=False, slots=True)
 class ORMJobSeekerService(BaseJobSeekerService):
     logger: Logger
+    counter_service: BaseCounterService
+    iterator_chunk_size: int = settings.ITERATOR_CHUNK_SIZE
 
     def _get_model_or_raise_exception(
         self,
@@ -42,33 +48,54 @@ class ORMJobSeekerService(BaseJobSeekerService):
     def _build_queryset(self, filters: JobSeekerFilters) -> Q:
         query = Q()
         if filters.age__gte:
-            query &= Q(age__gte=filters.age__gte)
+            # age is not stored, so compare birth dates instead,
+            # profiles without a birth date are not filtered out
+            today = timezone.now().date()
+            try:
+                born_before = today.replace(year=today.year - filters.age__gte)
+            except ValueError:  # 29th of February
+                born_before = today.replace(
+                    year=today.year - filters.age__gte, day=28
+                )
+            query &= Q(birth_date__lte=born_before) | Q(birth_date__isnull=True)
         if filters.experience__gte:
             query &= Q(experience__gte=filters.experience__gte)
         if filters.skills:
-            skills = [skill.lower() for skill in filters.skills]
-            query &= Q(skills__contains=skills)
+            query &= build_skills_query(
+                field='skills',
+                skills=filters.skills,
+                match=filters.skills_match,
+                min_match=filters.skills_min_match,
+            )
         if filters.allow_notifications:
             query &= Q(allow_notifications=filters.allow_notifications)
         return query
 
+    def _get_queryset(
+        self, filters: JobSeekerFilters
+    ) -> QuerySet[JobSeekerProfile]:
+        query = self._build_queryset(filters=filters)
+        if filters.vacancy_id:
+            query &= Q(interested_in=filters.vacancy_id)
+        return JobSeekerProfile.objects.filter(query)
+
     def get_list(
         self, filters: JobSeekerFilters, offset: int = 0, limit: int = 20
     ) -> list[JobSeekerEntity]:
-        query = self._build_queryset(filters=filters)
-        if filters.vacancy_id:
-            vacancy = Vacancy.objects.prefetch_related(
-                'interested_candidates'
-            ).get(id=filters.vacancy_id)
-            profile_list = vacancy.interested_candidates.filter(query)[
-                offset : offset + limit
-            ]
-        else:
-            profile_list = JobSeekerProfile.objects.filter(query)[
-                offset : offset + limit
-            ]
+        profile_list = self._get_queryset(filters)[offset : offset + limit]
         return [profile.to_entity() for profile in profile_list]
 
+    def get_list_by_cursor(
+        self, filters: JobSeekerFilters, cursor: str, limit: int = 20
+    ) -> tuple[list[JobSeekerEntity], str | None]:
+        profile_list, next_cursor = paginate_by_cursor(
+            queryset=self._get_queryset(filters),
+            ordering=JobSeekerProfile.CURSOR_ORDERING,
+            cursor=cursor,
+            limit=limit,
+        )
+        return [profile.to_entity() for profile in profile_list], next_cursor
+
     def get(self, id: int) -> JobSeekerEntity | None:
         try:
             profile = self._get_model_or_raise_exception(id=id)
@@ -76,17 +103,30 @@ class ORMJobSeekerService(BaseJobSeekerService):
             raise CandidateDoesNotExist(id)
         return profile.to_entity()
 
+    def get_by_ids(self, ids: list[int]) -> list[JobSeekerEntity]:
+        profiles = JobSeekerProfile.objects.in_bulk(ids)
+        return [profiles[id].to_entity() for id in ids if id in profiles]
+
     def get_all(
         self,
         filters: JobSeekerFilters = JobSeekerFilters(allow_notifications=True),
     ) -> Iterable[JobSeekerEntity]:
         query = self._build_queryset(filters=filters)
-        for jobseeker in JobSeekerProfile.objects.filter(query):
+        # Profiles are streamed, only 'iterator_chunk_size' are held at once
+        profiles = JobSeekerProfile.objects.filter(query).iterator(
+            chunk_size=self.iterator_chunk_size
+        )
+        for jobseeker in profiles:
             yield jobseeker.to_entity()
 
     def get_total_count(self, filters: JobSeekerFilters) -> int:
-        query = self._build_queryset(filters)
-        return JobSeekerProfile.objects.filter(query).count()
+        return self._get_queryset(filters).count()
+
+    def get_estimated_count(self, filters: JobSeekerFilters) -> TotalCount:
+        return self.counter_service.count(
+            queryset=self._get_queryset(filters),
+            filters=filters,
+        )
 
     def update(self, entity: JobSeekerEntity) -> JobSeekerEntity:
         profile = self._get_model_or_raise_exception(id=entity.id)
@@ -0,0 +1,36 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from src.apps.profiles.models.employers import EmployerProfile
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.common.utils.cache import get_entity_cache, invalidate_tags_on_commit
+
+
+@receiver([post_save, post_delete], sender=EmployerProfile)
+def invalidate_employer(sender, instance: EmployerProfile, **kwargs) -> None:
+    # Employer data is embedded into every vacancy of the list
+    invalidate_tags_on_commit(f'employer:{instance.pk}', 'vacancy-list')
+    # Cached vacancies embed the employer as well
+    vacancy_ids = list(instance.vacancies.values_list('id', flat=True))
+    transaction.on_commit(
+        partial(get_entity_cache('employer').delete, instance.pk)
+    )
+    transaction.on_commit(
+        partial(get_entity_cache('vacancy').delete, *vacancy_ids)
+    )
+
+
+@receiver([post_save, post_delete], sender=JobSeekerProfile)
+def invalidate_jobseeker(sender, instance: JobSeekerProfile, **kwargs) -> None:
+    # Rankings of the vacancies the jobseeker applied to depend on the profile
+    vacancy_ids = instance.interested_in.values_list('id', flat=True)
+    invalidate_tags_on_commit(
+        f'jobseeker:{instance.pk}',
+        *(f'ranking:{vacancy_id}' for vacancy_id in vacancy_ids),
+    )
+    transaction.on_commit(
+        partial(get_entity_cache('jobseeker').delete, instance.pk)
+    )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from django.db import transaction
+
 from src.core.exceptions import (
     CandidateDoesNotExist,
     NotFound,
@@ -20,19 +22,21 @@ class ApplyToVacancyUseCase:
         if not vacancy:
             raise VacancyDoesNotExist(vacancy_id)
 
-        try:
-            self.vacancy_service.add_candidate(
-                candidate_id=candidate_id,
-                vacancy_id=vacancy_id,
-            )
-        except NotFound:
-            raise CandidateDoesNotExist(candidate_id)
-
         employer = vacancy.employer
-        self.notification_service.send_notification(
-            object=employer,
-            message=(
-                f'Someone applied for your vacancy with title: {vacancy.title}'
-            ),
-            subject=f'{employer.first_name} {employer.last_name}',
-        )
+        # The notification is written to the outbox with the application
+        with transaction.atomic():
+            try:
+                self.vacancy_service.add_candidate(
+                    candidate_id=candidate_id,
+                    vacancy_id=vacancy_id,
+                )
+            except NotFound:
+                raise CandidateDoesNotExist(candidate_id)
+            self.notification_service.send_notification(
+                object=employer,
+                message=(
+                    'Someone applied for your vacancy with title: '
+                    f'{vacancy.title}'
+                ),
+                subject=f'{employer.first_name} {employer.last_name}',
+            )
@@ -1,6 +1,17 @@
 from django.contrib import admin
 from .models import Vacancy, VacancyInterest
 from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.services.statuses import BaseApplicationStatusService
+from src.common.container import container
+
+
+def transition_status(modeladmin, request, queryset, status):
+    # Одним запросом, кандидаты уведомляются пакетно в фоне
+    changed_ids = container.resolve(BaseApplicationStatusService).transition(
+        interest_ids=queryset.values_list('id', flat=True), status=status
+    )
+    modeladmin.message_user(request, f"Обновлено откликов: {len(changed_ids)}")
+
 
 # Inline для откликов на странице вакансии
 class VacancyInterestInline(admin.TabularInline):
@@ -10,16 +21,19 @@ class VacancyInterestInline(admin.TabularInline):
     readonly_fields = ('candidate', 'created_at')
     actions = ['mark_viewed', 'mark_invited', 'mark_rejected']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('candidate')
+
     def mark_viewed(self, request, queryset):
-        queryset.update(status='viewed')
+        transition_status(self, request, queryset, 'viewed')
     mark_viewed.short_description = "Отметить как просмотренные"
 
     def mark_invited(self, request, queryset):
-        queryset.update(status='invited')
+        transition_status(self, request, queryset, 'invited')
     mark_invited.short_description = "Пригласить на собеседование"
 
     def mark_rejected(self, request, queryset):
-        queryset.update(status='rejected')
+        transition_status(self, request, queryset, 'rejected')
     mark_rejected.short_description = "Отклонить"
 
 # Админка для вакансий
@@ -62,21 +76,22 @@ class VacancyInterestAdmin(admin.ModelAdmin):
     search_fields = ('candidate__user__email', 'vacancy__title')
     actions = ['mark_viewed', 'mark_invited', 'mark_rejected']
     raw_id_fields = ('candidate', 'vacancy')
+    list_select_related = ('candidate__user', 'vacancy')
 
     def candidate_email(self, obj):
         return obj.candidate.user.email
     candidate_email.short_description = "Email кандидата"
 
     def mark_viewed(self, request, queryset):
-        queryset.update(status='viewed')
+        transition_status(self, request, queryset, 'viewed')
     mark_viewed.short_description = "Отметить как просмотренные"
 
     def mark_invited(self, request, queryset):
-        queryset.update(status='invited')
+        transition_status(self, request, queryset, 'invited')
     mark_invited.short_description = "Пригласить на собеседование"
 
     def mark_rejected(self, request, queryset):
-        queryset.update(status='rejected')
+        transition_status(self, request, queryset, 'rejected')
     mark_rejected.short_description = "Отклонить"
 
 # Админка для профилей кандидатов (с годом рождения)
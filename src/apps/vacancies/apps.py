@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VacanciesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.apps.vacancies'
+
+    def ready(self) -> None:
+        from . import signals  # noqa
@@ -25,6 +25,7 @@ class VacancyEntity:
     is_remote: bool | None = None
     created_at: datetime = field(default_factory=datetime.now)
     required_skills: list[str] = field(default_factory=list)
+    skill_ids: list[int] = field(default_factory=list)
 
     def to_dict(self, related: bool = False) -> dict:
         data = {
@@ -4,13 +4,18 @@ from pydantic import BaseModel, Field
 from ninja import FilterSchema
 from typing import Optional
 
+from src.common.filters.skills import SkillMatch
+
 
 class VacancyFilters(BaseModel):
     search: str = ''
     is_remote: bool | None = None
     required_experience__gte: int = 0
     created_at__gte: datetime | None = None
+    # Matched against both hard and soft skills of the vacancy
     required_skills: list[str] = Field(default_factory=list)
+    skills_match: SkillMatch = SkillMatch.ALL
+    skills_min_match: int = 0
     location: str = ''
     company_name: str = ''
     salary__gte: int = 0
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_jobseekerprofile_profiles_first_name_id_idx'),
+        ('vacancies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['created_at', 'id'], name='vacancies_created_at_id_idx'),
+        ),
+    ]
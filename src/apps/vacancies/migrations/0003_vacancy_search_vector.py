@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:09
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER = '''
+CREATE FUNCTION vacancies_vacancy_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.stack, '')), 'B') ||
+        setweight(to_tsvector(
+            'simple',
+            array_to_string(NEW.hard_skills || NEW.soft_skills, ' ')
+        ), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vacancies_vacancy_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, description, stack, hard_skills, soft_skills
+ON vacancies_vacancy
+FOR EACH ROW EXECUTE FUNCTION vacancies_vacancy_search_vector_update();
+
+UPDATE vacancies_vacancy SET title = title;
+'''
+
+DROP_SEARCH_VECTOR_TRIGGER = '''
+DROP TRIGGER vacancies_vacancy_search_vector_trigger ON vacancies_vacancy;
+DROP FUNCTION vacancies_vacancy_search_vector_update();
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_jobseekerprofile_profiles_first_name_id_idx'),
+        ('vacancies', '0002_vacancy_vacancies_created_at_id_idx'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='vacancy',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            sql=SEARCH_VECTOR_TRIGGER,
+            reverse_sql=DROP_SEARCH_VECTOR_TRIGGER,
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='vacancies_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='vacancies_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:11
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_skills_gin_index'),
+        ('vacancies', '0003_vacancy_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='skills',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('hard_skills'), models.F('soft_skills'), function='array_cat'), output_field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), size=None)),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='vacancies_skills_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:23
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+SKILL_IDS_TRIGGER = '''
+CREATE FUNCTION vacancies_vacancy_skill_ids_update() RETURNS trigger AS $$
+BEGIN
+    NEW.skill_ids := profiles_skill_ids(NEW.hard_skills);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vacancies_vacancy_skill_ids_trigger
+BEFORE INSERT OR UPDATE OF hard_skills
+ON vacancies_vacancy
+FOR EACH ROW EXECUTE FUNCTION vacancies_vacancy_skill_ids_update();
+'''
+
+DROP_SKILL_IDS_TRIGGER = '''
+DROP TRIGGER vacancies_vacancy_skill_ids_trigger ON vacancies_vacancy;
+DROP FUNCTION vacancies_vacancy_skill_ids_update();
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_skill_vocabulary'),
+        ('vacancies', '0004_skills_gin_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='skill_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), default=list, editable=False, size=None),
+        ),
+        migrations.RunSQL(
+            sql=SKILL_IDS_TRIGGER,
+            reverse_sql=DROP_SKILL_IDS_TRIGGER,
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skill_ids'], name='vacancies_skill_ids_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.db.models import F
+
+
+BATCH_SIZE = 1000
+
+
+def backfill_skill_ids(apps, schema_editor):
+    Vacancy = apps.get_model('vacancies', 'Vacancy')
+    last_id = 0
+    while True:
+        ids = list(
+            Vacancy.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+        # Updating the hard skills fires the trigger which sets skill_ids
+        Vacancy.objects.filter(id__in=ids).update(hard_skills=F('hard_skills'))
+        last_id = ids[-1]
+
+
+class Migration(migrations.Migration):
+    # Every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ('profiles', '0005_backfill_skill_ids'),
+        ('vacancies', '0005_vacancy_skill_ids'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_skill_ids,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
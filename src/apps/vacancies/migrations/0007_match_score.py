@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_backfill_skill_ids'),
+        ('vacancies', '0006_backfill_skill_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_scores', to='profiles.jobseekerprofile')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_scores', to='vacancies.vacancy')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['vacancy', '-score', 'candidate'], name='vacancies_match_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('vacancy', 'candidate'), name='vacancies_match_score_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,107 @@
+from django.db import migrations
+from django.db.models import (
+    Case,
+    F,
+    FloatField,
+    Func,
+    IntegerField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThanOrEqual
+
+
+BATCH_SIZE = 1000
+
+# Default weights of ScoreCalculator when the scores were introduced,
+# the rating is frozen here so later changes of the app do not alter
+# this migration
+REQUIRED_EXPERIENCE_SCORE = 7.0
+SKILL_MATCHED_SCORE = 2.0
+SKILL_DIDNT_MATCH_SCORE = 2.0
+
+
+class ArrayIntersectionCount(Func):
+    template = 'cardinality(ARRAY(SELECT unnest(%(expressions)s)))'
+    arg_joiner = ') INTERSECT SELECT unnest('
+    output_field = IntegerField()
+
+
+def to_float(value: float) -> Cast:
+    return Cast(Value(value), FloatField())
+
+
+def get_rating_expression():
+    candidate_skill_ids = F('candidate__skill_ids')
+    candidate_experience = F('candidate__experience')
+    vacancy_required_experience = F('vacancy__required_experience')
+    matched = ArrayIntersectionCount(
+        candidate_skill_ids, F('vacancy__skill_ids')
+    )
+    total = Func(
+        candidate_skill_ids,
+        function='cardinality',
+        output_field=IntegerField(),
+    )
+    skills_score = matched * to_float(SKILL_MATCHED_SCORE) + (
+        total - matched
+    ) * to_float(SKILL_DIDNT_MATCH_SCORE)
+    experience_score = Case(
+        When(
+            GreaterThanOrEqual(
+                candidate_experience, vacancy_required_experience
+            ),
+            then=to_float(REQUIRED_EXPERIENCE_SCORE)
+            + (candidate_experience - vacancy_required_experience),
+        ),
+        default=to_float(0),
+        output_field=FloatField(),
+    )
+    return skills_score + experience_score
+
+
+def backfill_match_scores(apps, schema_editor):
+    VacancyInterest = apps.get_model('vacancies', 'VacancyInterest')
+    MatchScore = apps.get_model('vacancies', 'MatchScore')
+    score = get_rating_expression()
+    last_id = 0
+    while True:
+        rows = list(
+            VacancyInterest.objects.filter(id__gt=last_id)
+            .annotate(score=score)
+            .order_by('id')
+            .values_list('id', 'vacancy_id', 'candidate_id', 'score')[
+                :BATCH_SIZE
+            ]
+        )
+        if not rows:
+            break
+        MatchScore.objects.bulk_create(
+            [
+                MatchScore(
+                    vacancy_id=vacancy_id,
+                    candidate_id=candidate_id,
+                    score=score,
+                )
+                for _, vacancy_id, candidate_id, score in rows
+            ],
+            ignore_conflicts=True,
+        )
+        last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+    # Every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ('vacancies', '0007_match_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_match_scores,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_match_scores(apps, schema_editor):
+    VacancyInterest = apps.get_model('vacancies', 'VacancyInterest')
+    MatchScore = apps.get_model('vacancies', 'MatchScore')
+    MatchScore.objects.update(
+        interest_id=Subquery(
+            VacancyInterest.objects.filter(
+                vacancy_id=OuterRef('vacancy_id'),
+                candidate_id=OuterRef('candidate_id'),
+            ).values('id')[:1]
+        )
+    )
+    # Scores of withdrawn applications
+    MatchScore.objects.filter(interest__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0008_backfill_match_scores'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='matchscore',
+            name='interest',
+            field=models.OneToOneField(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='match_score', to='vacancies.vacancyinterest'),
+        ),
+        migrations.RunPython(
+            link_match_scores,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
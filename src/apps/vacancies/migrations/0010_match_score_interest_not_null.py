@@ -0,0 +1,19 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Kept apart from the data migration, PostgreSQL does not alter tables
+    # with pending trigger events in the same transaction
+
+    dependencies = [
+        ('vacancies', '0009_match_score_interest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='matchscore',
+            name='interest',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='match_score', to='vacancies.vacancyinterest'),
+        ),
+    ]
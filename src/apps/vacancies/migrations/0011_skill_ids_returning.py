@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:05
+
+import src.common.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0010_match_score_interest_not_null'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vacancy',
+            name='skill_ids',
+            field=src.common.models.fields.ReturningArrayField(base_field=models.IntegerField(), default=list, editable=False, size=None),
+        ),
+    ]
@@ -1,12 +1,16 @@
 from django.db import models
+from django.db.models import F, Func
+from django.utils import timezone
 from django.utils.text import slugify
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 from src.apps.vacancies.entities import VacancyEntity
 from src.apps.profiles.models.jobseekers import JobSeekerProfile
 from src.apps.profiles.models.employers import EmployerProfile
-from src.common.models.base import TimedBaseModel
-from django.core.mail import send_mail
+from src.common.models.base import TimedBaseModel, TrackedFieldsMixin
+from src.common.models.fields import ReturningArrayField
 
 
 class AvailableManager(models.Manager):
@@ -14,7 +18,7 @@ class AvailableManager(models.Manager):
         return Vacancy.objects.filter(open=True)
 
 
-class Vacancy(TimedBaseModel):
+class Vacancy(TrackedFieldsMixin, TimedBaseModel):
     stack = models.CharField(
         max_length=255,
         blank=True,
@@ -80,6 +84,21 @@ class Vacancy(TimedBaseModel):
         verbose_name="Soft skills",
         help_text="Мягкие навыки (коммуникация, лидерство, тайм-менеджмент)"
     )
+    # Hard and soft skills together, used for indexed skill filtering
+    skills = models.GeneratedField(
+        expression=Func(
+            F('hard_skills'), F('soft_skills'), function='array_cat'
+        ),
+        output_field=ArrayField(models.CharField(max_length=50)),
+        db_persist=True,
+    )
+    # Sorted ids of the required (hard) skills in the Skill vocabulary,
+    # maintained by a database trigger (see migrations)
+    skill_ids = ReturningArrayField(
+        models.IntegerField(),
+        default=list,
+        editable=False,
+    )
     # Other fields
     open = models.BooleanField(
         default=True,
@@ -89,25 +108,77 @@ class Vacancy(TimedBaseModel):
         null=False,
         unique_for_date='created_at',
     )
+    # Maintained by a database trigger (see migrations), weighted:
+    # title (A), stack and skills (B), description (C)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+    )
     # Managers
     objects = models.Manager()
     available = AvailableManager()
 
+    # Keyset pagination order, must be unique and match Meta.ordering
+    CURSOR_ORDERING = ('created_at', 'id')
+    # Text search configuration used by the search_vector trigger
+    SEARCH_CONFIG = 'simple'
+    # Match scores are recomputed when these fields change
+    tracked_fields = ('hard_skills', 'required_experience')
+
     class Meta:
         ordering = ('created_at',)
-        indexes = (models.Index(fields=['slug']),)
+        indexes = (
+            models.Index(fields=['slug']),
+            models.Index(
+                fields=['created_at', 'id'],
+                name='vacancies_created_at_id_idx',
+            ),
+            GinIndex(
+                fields=['search_vector'],
+                name='vacancies_search_vector_idx',
+            ),
+            GinIndex(
+                fields=['title'],
+                name='vacancies_title_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+            GinIndex(fields=['skills'], name='vacancies_skills_idx'),
+            GinIndex(fields=['skill_ids'], name='vacancies_skill_ids_idx'),
+        )
         verbose_name_plural = 'vacancies'
 
     def __str__(self):
         return self.title
 
+    @property
+    def required_skills(self) -> list[str]:
+        # Entities and schemas call hard skills 'required skills'
+        return self.hard_skills
+
+    @required_skills.setter
+    def required_skills(self, skills: list[str]) -> None:
+        self.hard_skills = skills
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
         if not self.slug:
             self.slug = self.id  # type: ignore
-        self.required_skills = [skill.lower() for skill in self.required_skills]
-        return super().save(*args, **kwargs)
+        self.hard_skills = list(
+            dict.fromkeys(skill.lower() for skill in self.hard_skills)
+        )
+        self.soft_skills = list(
+            dict.fromkeys(skill.lower() for skill in self.soft_skills)
+        )
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        # Inserts return skill_ids, after updates of the skills it is
+        # deferred and loaded once accessed
+        if adding:
+            return
+        if update_fields is None or 'hard_skills' in update_fields:
+            self.__dict__.pop('skill_ids', None)
 
     @classmethod
     def from_entity(cls, entity: VacancyEntity) -> 'Vacancy':
@@ -127,12 +198,22 @@ class Vacancy(TimedBaseModel):
         )
         return model
 
-    def to_entity(self) -> VacancyEntity:
-        candidates = self.interested_candidates.all()
+    def to_entity(self, with_candidates: bool = False) -> VacancyEntity:
+        """
+        Converts the model to an entity. The employer is expected to be
+        loaded with select_related and interested candidates are only
+        hydrated on request (prefetch them to avoid a query per vacancy)
+        """
+        if with_candidates:
+            candidates = [
+                cand.to_entity() for cand in self.interested_candidates.all()
+            ]
+        else:
+            candidates = []
         entity = VacancyEntity(
             id=self.id,  # type: ignore
             employer=self.employer.to_entity(),
-            interested_candidates=[cand.to_entity() for cand in candidates],
+            interested_candidates=candidates,
             title=self.title,
             description=self.description,
             company_name=self.company_name,
@@ -140,12 +221,14 @@ class Vacancy(TimedBaseModel):
             required_experience=self.required_experience,
             location=self.location,
             required_skills=self.required_skills,
+            skill_ids=self.skill_ids,
             updated_at=self.updated_at,
             created_at=self.created_at,
         )
         return entity
-    
-class VacancyInterest(models.Model):
+
+
+class VacancyInterest(TrackedFieldsMixin, models.Model):
     cover_letter = models.TextField(
     blank=True,
     verbose_name="Сопроводительное письмо"
@@ -163,6 +246,8 @@ class VacancyInterest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ('status',)
+
     class Meta:
         unique_together = ('vacancy', 'candidate')
         verbose_name = 'Отклик на вакансию'
@@ -171,28 +256,69 @@ class VacancyInterest(models.Model):
     def __str__(self):
         return f"{self.candidate} → {self.vacancy.title} ({self.status})"
 
-    def save(self, *args, **kwargs):
-        old_status = None
-        if self.pk:
-            old_status = VacancyInterest.objects.get(pk=self.pk).status
-        super().save(*args, **kwargs)
+    def get_status_notification(self) -> tuple[str, str] | None:
+        """
+        Returns the subject and the message notifying the candidate
+        of the current status, None if it is not notified
+        """
+        subject = f"Обновление по вакансии \"{self.vacancy.title}\""
+        if self.status == 'invited':
+            message = f"Поздравляем! Вас пригласили на собеседование в {self.vacancy.company_name}.\nСвяжитесь с работодателем для деталей."
+        elif self.status == 'rejected':
+            message = f"К сожалению, по вакансии \"{self.vacancy.title}\" выбрали другого кандидата.\nУдачи в поиске!"
+        elif self.status == 'viewed':
+            message = f"Ваш отклик на вакансию \"{self.vacancy.title}\" просмотрен работодателем."
+        else:
+            return None
+        return subject, message
 
+    @staticmethod
+    def is_status_change_notified(
+        old_status: str | None, status: str
+    ) -> bool:
         # Уведомление кандидату при смене статуса
-        if old_status and old_status != self.status and old_status != 'new':
-            subject = f"Обновление по вакансии \"{self.vacancy.title}\""
-            if self.status == 'invited':
-                message = f"Поздравляем! Вас пригласили на собеседование в {self.vacancy.company_name}.\nСвяжитесь с работодателем для деталей."
-            elif self.status == 'rejected':
-                message = f"К сожалению, по вакансии \"{self.vacancy.title}\" выбрали другого кандидата.\nУдачи в поиске!"
-            elif self.status == 'viewed':
-                message = f"Ваш отклик на вакансию \"{self.vacancy.title}\" просмотрен работодателем."
-            else:
-                return
-
-            send_mail(
-                subject,
-                message,
-                'no-reply@yourplatform.com',  # поменять на реальный email отправителя
-                [self.candidate.user.email],
-                fail_silently=False,
-            )
+        return old_status not in (None, 'new', status)
+
+
+class MatchScore(models.Model):
+    """
+    Rating of an interested candidate for the vacancy, computed by the
+    ScoreCalculator in the background (see tasks) so candidates are ranked
+    by the index on (vacancy, -score, candidate).
+    Scores are deleted along with their applications
+    """
+
+    interest = models.OneToOneField(
+        VacancyInterest,
+        on_delete=models.CASCADE,
+        related_name='match_score',
+    )
+    vacancy = models.ForeignKey(
+        Vacancy,
+        on_delete=models.CASCADE,
+        related_name='match_scores',
+    )
+    candidate = models.ForeignKey(
+        JobSeekerProfile,
+        on_delete=models.CASCADE,
+        related_name='match_scores',
+    )
+    score = models.FloatField()
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=['vacancy', 'candidate'],
+                name='vacancies_match_score_unique',
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=['vacancy', '-score', 'candidate'],
+                name='vacancies_match_score_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.candidate_id} → {self.vacancy_id}: {self.score}'
@@ -19,3 +19,12 @@ class BaseVacancyService(BaseService):
         offset: int,
         limit: int,
     ) -> list[JobSeekerEntity]: ...
+
+    @abstractmethod
+    def get_candidates_for_ranking(
+        self, vacancy_id: int
+    ) -> list[JobSeekerEntity]:
+        """
+        Returns every interested candidate with the fields used for scoring
+        (id, skill_ids and experience) only
+        """
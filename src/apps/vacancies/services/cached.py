@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from functools import partial
+from logging import Logger
+from typing import Iterable
+
+from src.common.services.counters import TotalCount
+from src.common.utils.cache import EntityCache
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.vacancies.filters import VacancyFilters
+from src.apps.vacancies.entities import VacancyEntity
+
+from .base import BaseVacancyService
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class CachedVacancyService(BaseVacancyService):
+    """
+    Caches vacancies without candidates by id in 'entity_cache', other calls
+    are delegated. Lists and their totals are cached with the responses
+    of the list route, which are tagged with 'vacancy-list'
+    """
+
+    logger: Logger
+    vacancy_service: BaseVacancyService
+    entity_cache: EntityCache
+
+    def get_list(
+        self,
+        filters: VacancyFilters,
+        offset: int = 0,
+        limit: int = 20,
+        with_candidates: bool = False,
+    ) -> list[VacancyEntity]:
+        return self.vacancy_service.get_list(
+            filters=filters,
+            offset=offset,
+            limit=limit,
+            with_candidates=with_candidates,
+        )
+
+    def get_list_by_cursor(
+        self,
+        filters: VacancyFilters,
+        cursor: str,
+        limit: int = 20,
+    ) -> tuple[list[VacancyEntity], str | None]:
+        return self.vacancy_service.get_list_by_cursor(
+            filters=filters, cursor=cursor, limit=limit
+        )
+
+    def get_total_count(self, filters: VacancyFilters) -> int:
+        return self.vacancy_service.get_total_count(filters=filters)
+
+    def get_estimated_count(self, filters: VacancyFilters) -> TotalCount:
+        return self.vacancy_service.get_estimated_count(filters=filters)
+
+    def get(self, id: int, with_candidates: bool = False) -> VacancyEntity:
+        if with_candidates:
+            return self.vacancy_service.get(id=id, with_candidates=True)
+        return self.entity_cache.get_or_load(
+            id, partial(self.vacancy_service.get, id=id)
+        )
+
+    def get_all(self, filters: VacancyFilters) -> Iterable[VacancyEntity]:
+        return self.vacancy_service.get_all(filters=filters)
+
+    def create(self, entity: VacancyEntity, employer_id: int) -> VacancyEntity:
+        return self.vacancy_service.create(
+            entity=entity, employer_id=employer_id
+        )
+
+    def add_candidate(self, candidate_id: int, vacancy_id: int) -> None:
+        self.vacancy_service.add_candidate(
+            candidate_id=candidate_id, vacancy_id=vacancy_id
+        )
+
+    def get_list_candidates(
+        self,
+        vacancy_id: int,
+        offset: int,
+        limit: int,
+    ) -> list[JobSeekerEntity]:
+        return self.vacancy_service.get_list_candidates(
+            vacancy_id=vacancy_id, offset=offset, limit=limit
+        )
+
+    def get_candidates_for_ranking(
+        self, vacancy_id: int
+    ) -> list[JobSeekerEntity]:
+        return self.vacancy_service.get_candidates_for_ranking(
+            vacancy_id=vacancy_id
+        )
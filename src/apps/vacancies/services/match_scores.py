@@ -0,0 +1,129 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from logging import Logger
+from typing import Iterable
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from src.common.utils.iterables import chunked
+from src.apps.vacancies.models import MatchScore, VacancyInterest
+from src.apps.vacancies.services.score import ScoreCalculator
+
+
+class BaseMatchScoreService(ABC):
+    @abstractmethod
+    def update(
+        self,
+        vacancy_ids: Iterable[int] | None = None,
+        candidate_ids: Iterable[int] | None = None,
+    ) -> list[int]:
+        """
+        Recomputes match scores of the applications to 'vacancy_ids'
+        made by 'candidate_ids', None stands for any of them.
+        Returns ids of the vacancies whose scores were updated
+        """
+
+    @abstractmethod
+    def get_ranked_ids(
+        self,
+        vacancy_id: int,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        """
+        Returns ids of the candidates of the vacancy from 'offset'
+        to 'offset + limit' by their match scores, best first
+        """
+
+    @abstractmethod
+    def get_total_count(self, vacancy_id: int) -> int:
+        """Returns the number of scored applications to the vacancy"""
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ORMMatchScoreService(BaseMatchScoreService):
+    """
+    Scores applications in the database with the rating expression of the
+    ScoreCalculator and upserts them into MatchScore by 'batch_size'
+    """
+
+    logger: Logger
+    score_calculator: ScoreCalculator
+    batch_size: int = settings.MATCH_SCORE_BATCH_SIZE
+
+    @staticmethod
+    def _get_filters(
+        vacancy_ids: Iterable[int] | None,
+        candidate_ids: Iterable[int] | None,
+    ) -> Q:
+        filters = Q()
+        if vacancy_ids is not None:
+            filters &= Q(vacancy_id__in=list(vacancy_ids))
+        if candidate_ids is not None:
+            filters &= Q(candidate_id__in=list(candidate_ids))
+        return filters
+
+    def update(
+        self,
+        vacancy_ids: Iterable[int] | None = None,
+        candidate_ids: Iterable[int] | None = None,
+    ) -> list[int]:
+        score = self.score_calculator.get_rating_expression(
+            candidate_skill_ids=F('candidate__skill_ids'),
+            candidate_experience=F('candidate__experience'),
+            vacancy_skill_ids=F('vacancy__skill_ids'),
+            vacancy_required_experience=F('vacancy__required_experience'),
+        )
+        rows = (
+            VacancyInterest.objects.filter(
+                self._get_filters(vacancy_ids, candidate_ids)
+            )
+            .annotate(score=score)
+            .order_by('id')
+            .values_list('id', 'vacancy_id', 'candidate_id', 'score')
+            .iterator(chunk_size=self.batch_size)
+        )
+        updated_vacancy_ids = set()
+        for batch in chunked(rows, self.batch_size):
+            computed_at = timezone.now()
+            MatchScore.objects.bulk_create(
+                [
+                    MatchScore(
+                        interest_id=interest_id,
+                        vacancy_id=vacancy_id,
+                        candidate_id=candidate_id,
+                        score=score,
+                        computed_at=computed_at,
+                    )
+                    for interest_id, vacancy_id, candidate_id, score in batch
+                ],
+                update_conflicts=True,
+                unique_fields=['vacancy', 'candidate'],
+                update_fields=['score', 'computed_at'],
+            )
+            updated_vacancy_ids.update(
+                vacancy_id for _, vacancy_id, _, _ in batch
+            )
+        self.logger.info(
+            'Match scores updated',
+            extra={'info': {'vacancies': len(updated_vacancy_ids)}},
+        )
+        return sorted(updated_vacancy_ids)
+
+    def get_ranked_ids(
+        self,
+        vacancy_id: int,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        queryset = (
+            MatchScore.objects.filter(vacancy_id=vacancy_id)
+            .order_by('-score', 'candidate_id')
+            .values_list('candidate_id', flat=True)
+        )
+        return list(queryset[offset : offset + limit])
+
+    def get_total_count(self, vacancy_id: int) -> int:
+        return MatchScore.objects.filter(vacancy_id=vacancy_id).count()
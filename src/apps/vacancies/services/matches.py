@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import partial
+
+from django.conf import settings
+from django.db.models import F, Value
+
+from src.common.utils.cache import get_or_compute
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.services.score import ScoreCalculator
+
+
+class BaseCandidateMatcher(ABC):
+    @abstractmethod
+    def match(self, vacancy: VacancyEntity) -> list[int]:
+        """
+        Returns ids of the best matching jobseekers who have not applied
+        to the vacancy, best first
+        """
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class SQLCandidateMatcher(BaseCandidateMatcher):
+    """
+    Shortlists up to 'shortlist_size' jobseekers who allow notifications,
+    have the required experience and any of the required skills by the
+    partial GIN index on their 'skill_ids', so a single query is bounded
+    whatever the number of profiles is. The shortlist is rated with the
+    rating expression of the ScoreCalculator and the best 'size' are returned
+    """
+
+    score_calculator: ScoreCalculator
+    size: int = settings.CANDIDATE_MATCHES_SIZE
+    shortlist_size: int = settings.CANDIDATE_MATCHES_SHORTLIST_SIZE
+
+    def match(self, vacancy: VacancyEntity) -> list[int]:
+        if not vacancy.skill_ids:
+            return []
+        shortlist = (
+            JobSeekerProfile.objects.filter(
+                allow_notifications=True,
+                skill_ids__overlap=vacancy.skill_ids,
+                experience__gte=vacancy.required_experience,
+            )
+            .exclude(interested_in=vacancy.id)
+            .values('id')[: self.shortlist_size]
+        )
+        score = self.score_calculator.get_rating_expression(
+            candidate_skill_ids=F('skill_ids'),
+            candidate_experience=F('experience'),
+            vacancy_skill_ids=vacancy.skill_ids,
+            vacancy_required_experience=Value(vacancy.required_experience),
+        )
+        queryset = (
+            JobSeekerProfile.objects.filter(id__in=shortlist)
+            .annotate(score=score)
+            .order_by('-score', 'id')
+            .values_list('id', flat=True)
+        )
+        return list(queryset[: self.size])
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class CachedCandidateMatcher(BaseCandidateMatcher):
+    """
+    Caches matches of a vacancy under the 'matches:<vacancy_id>' tag,
+    which is invalidated when the requirements of the vacancy change
+    or somebody applies to it. Changes of profiles are seen after 'timeout'
+    """
+
+    matcher: BaseCandidateMatcher
+    timeout: int = settings.CANDIDATE_MATCHES_CACHE_TIMEOUT
+
+    def match(self, vacancy: VacancyEntity) -> list[int]:
+        return get_or_compute(
+            key=f'matches:{vacancy.id}',
+            compute=partial(self.matcher.match, vacancy=vacancy),
+            timeout=self.timeout,
+            tags=[f'matches:{vacancy.id}'],
+            metric='matches',
+        )
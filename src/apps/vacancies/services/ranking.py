@@ -0,0 +1,167 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from django.conf import settings
+from django.db.models import F, Value
+
+from src.common.utils.cache import get_or_compute
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.services.base import BaseVacancyService
+from src.apps.vacancies.services.match_scores import BaseMatchScoreService
+from src.apps.vacancies.services.score import ScoreCalculator
+
+
+class BaseCandidateRanker(ABC):
+    @abstractmethod
+    def rank(
+        self,
+        vacancy: VacancyEntity,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        """
+        Returns ids of interested candidates ranked from 'offset'
+        to 'offset + limit', best first
+        """
+
+    @abstractmethod
+    def get_total_count(self, vacancy: VacancyEntity) -> int:
+        """Returns the number of candidates ranked for the vacancy"""
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ScoreCandidateRanker(BaseCandidateRanker):
+    """
+    Scores every interested candidate at once with the ScoreCalculator
+    and sorts the best of them, candidates with equal scores are ordered by id
+    """
+
+    vacancy_service: BaseVacancyService
+    score_calculator: ScoreCalculator
+
+    def rank(
+        self,
+        vacancy: VacancyEntity,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        candidates = self.vacancy_service.get_candidates_for_ranking(
+            vacancy_id=vacancy.id
+        )
+        count = offset + limit
+        if not candidates or count <= 0:
+            return []
+        scores = self.score_calculator.get_candidates_ratings(
+            vacancy=vacancy, candidates=candidates
+        )
+        ids = np.fromiter(
+            (candidate.id for candidate in candidates),
+            dtype=np.int64,
+            count=len(candidates),
+        )
+        if count < len(candidates):
+            # Only candidates scoring as high as the count-th best are sorted,
+            # ties with it are kept to be ordered by id
+            kth = len(candidates) - count
+            threshold = np.partition(scores, kth)[kth]
+            best = scores >= threshold
+            scores, ids = scores[best], ids[best]
+        order = np.lexsort((ids, -scores))[offset:count]
+        return ids[order].tolist()
+
+    def get_total_count(self, vacancy: VacancyEntity) -> int:
+        return JobSeekerProfile.objects.filter(interested_in=vacancy.id).count()
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class SQLCandidateRanker(BaseCandidateRanker):
+    """
+    Scores interested candidates in the database with the rating expression
+    of the ScoreCalculator, so sorting and pagination happen there too
+    """
+
+    score_calculator: ScoreCalculator
+
+    def rank(
+        self,
+        vacancy: VacancyEntity,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        score = self.score_calculator.get_rating_expression(
+            candidate_skill_ids=F('skill_ids'),
+            candidate_experience=F('experience'),
+            vacancy_skill_ids=vacancy.skill_ids,
+            vacancy_required_experience=Value(vacancy.required_experience),
+        )
+        queryset = (
+            JobSeekerProfile.objects.filter(interested_in=vacancy.id)
+            .annotate(score=score)
+            .order_by('-score', 'id')
+            .values_list('id', flat=True)
+        )
+        return list(queryset[offset : offset + limit])
+
+    def get_total_count(self, vacancy: VacancyEntity) -> int:
+        return JobSeekerProfile.objects.filter(interested_in=vacancy.id).count()
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class PrecomputedCandidateRanker(BaseCandidateRanker):
+    """
+    Ranks candidates by their match scores maintained in the background,
+    applications are ranked once their scores are computed
+    """
+
+    match_score_service: BaseMatchScoreService
+
+    def rank(
+        self,
+        vacancy: VacancyEntity,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        return self.match_score_service.get_ranked_ids(
+            vacancy_id=vacancy.id, offset=offset, limit=limit
+        )
+
+    def get_total_count(self, vacancy: VacancyEntity) -> int:
+        # Applications are counted once they are ranked
+        return self.match_score_service.get_total_count(vacancy_id=vacancy.id)
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class CachedCandidateRanker(BaseCandidateRanker):
+    """
+    Caches the best 'size' candidates of a vacancy under the
+    'ranking:<vacancy_id>' tag, deeper pages are ranked by 'ranker' directly
+    """
+
+    ranker: BaseCandidateRanker
+    size: int = settings.CANDIDATE_RANKING_CACHE_SIZE
+    timeout: int = settings.CANDIDATE_RANKING_CACHE_TIMEOUT
+
+    def rank(
+        self,
+        vacancy: VacancyEntity,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[int]:
+        if offset + limit > self.size:
+            return self.ranker.rank(vacancy=vacancy, offset=offset, limit=limit)
+        ranked_ids = get_or_compute(
+            key=f'ranking:{vacancy.id}',
+            compute=partial(
+                self.ranker.rank, vacancy=vacancy, offset=0, limit=self.size
+            ),
+            timeout=self.timeout,
+            tags=[f'ranking:{vacancy.id}'],
+            metric='ranking',
+        )
+        return ranked_ids[offset : offset + limit]
+
+    def get_total_count(self, vacancy: VacancyEntity) -> int:
+        return self.ranker.get_total_count(vacancy=vacancy)
@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from logging import Logger
+
+from django.db.models import F, QuerySet, Value
+
+from src.common.utils.cursor import paginate_by_cursor
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.models import Vacancy
+from src.apps.vacancies.services.score import ScoreCalculator
+
+
+class BaseRecommendationService(ABC):
+    @abstractmethod
+    def get_recommendations(
+        self,
+        candidate: JobSeekerEntity,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[list[VacancyEntity], str | None]:
+        """
+        Returns open vacancies requiring any skill of the candidate,
+        best rated first, and a cursor of the next page or None
+        if the page is the last one. Vacancies the candidate has already
+        applied to are not recommended
+        """
+
+    @abstractmethod
+    def get_count(self, candidate: JobSeekerEntity) -> int:
+        """Returns the number of vacancies recommended to the candidate"""
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ORMRecommendationService(BaseRecommendationService):
+    """
+    Looks vacancies up by the GIN index on their 'skill_ids' (an inverted
+    index from a skill to the vacancies requiring it) and rates them with
+    the rating expression of the ScoreCalculator, pages are keyset paginated
+    by the rating and id
+    """
+
+    logger: Logger
+    score_calculator: ScoreCalculator
+
+    # Keyset pagination order, must be unique
+    CURSOR_ORDERING = ('-score', 'id')
+
+    def _get_queryset(self, candidate: JobSeekerEntity) -> QuerySet[Vacancy]:
+        return Vacancy.available.filter(
+            skill_ids__overlap=candidate.skill_ids
+        ).exclude(interested_candidates=candidate.id)
+
+    def get_recommendations(
+        self,
+        candidate: JobSeekerEntity,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[list[VacancyEntity], str | None]:
+        if not candidate.skill_ids:
+            return [], None
+        score = self.score_calculator.get_rating_expression(
+            candidate_skill_ids=candidate.skill_ids,
+            candidate_experience=Value(candidate.experience or 0),
+            vacancy_skill_ids=F('skill_ids'),
+            vacancy_required_experience=F('required_experience'),
+        )
+        queryset = (
+            self._get_queryset(candidate)
+            .select_related('employer')
+            .annotate(score=score)
+        )
+        vacancy_list, next_cursor = paginate_by_cursor(
+            queryset=queryset,
+            ordering=self.CURSOR_ORDERING,
+            cursor=cursor,
+            limit=limit,
+        )
+        return [vacancy.to_entity() for vacancy in vacancy_list], next_cursor
+
+    def get_count(self, candidate: JobSeekerEntity) -> int:
+        if not candidate.skill_ids:
+            return 0
+        return self._get_queryset(candidate).count()
@@ -1,3 +1,20 @@
+from itertools import chain
+
+import numpy as np
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import (
+    Case,
+    Expression,
+    FloatField,
+    Func,
+    IntegerField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThanOrEqual
+
+from src.common.filters.skills import ArrayIntersectionCount
 from src.apps.profiles.entities.jobseekers import JobSeekerEntity
 from src.apps.vacancies.entities import VacancyEntity
 
@@ -34,13 +51,12 @@ class ScoreCalculator:
         candidate_skills: list[str],
         vacancy_required_skills: list[str],
     ) -> float:
-        score = 0
-        for skill in candidate_skills:
-            if skill in vacancy_required_skills:
-                score += self.skill_matched_score
-            else:
-                score += self.skill_didnt_match_score
-        return score
+        required_skills = set(vacancy_required_skills)
+        matched = sum(1 for skill in candidate_skills if skill in required_skills)
+        return (
+            matched * self.skill_matched_score
+            + (len(candidate_skills) - matched) * self.skill_didnt_match_score
+        )
 
     def get_candidate_rating(
         self,
@@ -59,3 +75,142 @@ class ScoreCalculator:
             vacancy_required_experience=vacancy.required_experience,
         )
         return rating
+
+    def get_ratings(
+        self,
+        vacancies: list[VacancyEntity],
+        candidates: list[JobSeekerEntity],
+    ) -> np.ndarray:
+        """
+        Rate every candidate for every vacancy at once, returns a matrix
+        of shape (vacancies, candidates) equal to get_candidate_rating.
+        Skills are compared by their ids in the Skill vocabulary ('skill_ids'),
+        column 0 of the required skills stands for skills none of the vacancies
+        require
+        """
+        if not vacancies:
+            return np.zeros((0, len(candidates)))
+        vocabulary = np.unique(
+            np.fromiter(
+                chain.from_iterable(vacancy.skill_ids for vacancy in vacancies),
+                dtype=np.int64,
+            )
+        )
+        required = np.zeros((len(vacancies), len(vocabulary) + 1), dtype=bool)
+        for row, vacancy in enumerate(vacancies):
+            columns = np.searchsorted(
+                vocabulary, np.asarray(vacancy.skill_ids, dtype=np.int64)
+            )
+            required[row, columns + 1] = True
+
+        # Skills of all candidates are flattened, 'owners' maps them back
+        skill_lists = [candidate.skill_ids for candidate in candidates]
+        lengths = np.fromiter(
+            map(len, skill_lists), dtype=np.int64, count=len(skill_lists)
+        )
+        skill_ids = np.fromiter(
+            chain.from_iterable(skill_lists),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        skills = np.searchsorted(vocabulary, skill_ids)
+        known = skills < len(vocabulary)
+        known[known] = vocabulary[skills[known]] == skill_ids[known]
+        skills = np.where(known, skills + 1, 0)
+        owners = np.repeat(np.arange(len(candidates)), lengths)
+        matched = np.stack(
+            [
+                np.bincount(
+                    owners,
+                    weights=required[row, skills],
+                    minlength=len(candidates),
+                )
+                for row in range(len(vacancies))
+            ]
+        )
+        skills_score = (
+            matched * self.skill_matched_score
+            + (lengths - matched) * self.skill_didnt_match_score
+        )
+
+        candidate_experience = np.fromiter(
+            (candidate.experience or 0 for candidate in candidates),
+            dtype=np.int64,
+            count=len(candidates),
+        )
+        required_experience = np.fromiter(
+            (vacancy.required_experience for vacancy in vacancies),
+            dtype=np.int64,
+            count=len(vacancies),
+        )[:, np.newaxis]
+        experience_score = self.required_experience_score
+        if self.incr_score_if_experience_higher:
+            experience_score = experience_score + (
+                candidate_experience - required_experience
+            )
+        experience_score = np.where(
+            candidate_experience >= required_experience,
+            experience_score,
+            0,
+        )
+        return skills_score + experience_score
+
+    def get_candidates_ratings(
+        self,
+        vacancy: VacancyEntity,
+        candidates: list[JobSeekerEntity],
+    ) -> np.ndarray:
+        return self.get_ratings(vacancies=[vacancy], candidates=candidates)[0]
+
+    def get_rating_expression(
+        self,
+        candidate_skill_ids: Expression | list[int],
+        candidate_experience: Expression,
+        vacancy_skill_ids: Expression | list[int],
+        vacancy_required_experience: Expression,
+    ) -> Expression:
+        """
+        Database expression equal to get_candidate_rating, skills are
+        compared by their ids. Weights are cast to double precision
+        to do the same floating point arithmetic as Python.
+        Skill ids of either side may be given as a list of a known entity
+        """
+        candidate_skill_ids = self._to_int_array(candidate_skill_ids)
+        vacancy_skill_ids = self._to_int_array(vacancy_skill_ids)
+        matched = ArrayIntersectionCount(candidate_skill_ids, vacancy_skill_ids)
+        total = Func(
+            candidate_skill_ids,
+            function='cardinality',
+            output_field=IntegerField(),
+        )
+        matched_score = self._to_float(self.skill_matched_score)
+        didnt_match_score = self._to_float(self.skill_didnt_match_score)
+        skills_score = matched * matched_score + (total - matched) * (
+            didnt_match_score
+        )
+        experience_score = self._to_float(self.required_experience_score)
+        if self.incr_score_if_experience_higher:
+            experience_score = experience_score + (
+                candidate_experience - vacancy_required_experience
+            )
+        experience_score = Case(
+            When(
+                GreaterThanOrEqual(
+                    candidate_experience, vacancy_required_experience
+                ),
+                then=experience_score,
+            ),
+            default=self._to_float(0),
+            output_field=FloatField(),
+        )
+        return skills_score + experience_score
+
+    @staticmethod
+    def _to_float(value: float) -> Expression:
+        return Cast(Value(value), FloatField())
+
+    @staticmethod
+    def _to_int_array(skill_ids: Expression | list[int]) -> Expression:
+        if isinstance(skill_ids, list):
+            return Cast(Value(skill_ids), ArrayField(IntegerField()))
+        return skill_ids
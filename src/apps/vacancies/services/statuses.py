@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from logging import Logger
+from typing import Iterable
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from src.common.utils.cache import invalidate_tags_on_commit
+from src.apps.notifications.services.outbox import BaseOutboxService
+from src.apps.vacancies.models import VacancyInterest
+from src.apps.vacancies.tasks import notify_application_status
+
+
+class BaseApplicationStatusService(ABC):
+    @abstractmethod
+    def transition(self, interest_ids: Iterable[int], status: str) -> list[int]:
+        """
+        Sets 'status' of the applications 'interest_ids' and notifies
+        their candidates. Returns ids of the applications which changed
+        """
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class ORMApplicationStatusService(BaseApplicationStatusService):
+    """
+    Updates applications in one UPDATE ... RETURNING statement which
+    also returns their old statuses, notified candidates are written to the
+    outbox as a single notify_application_status job in the same transaction
+    """
+
+    logger: Logger
+    outbox_service: BaseOutboxService
+
+    def transition(self, interest_ids: Iterable[int], status: str) -> list[int]:
+        table = connection.ops.quote_name(VacancyInterest._meta.db_table)
+        # The joined copy of the table still holds the old statuses
+        sql = (
+            f'UPDATE {table} AS interest '
+            'SET status = %s, updated_at = %s '
+            f'FROM {table} AS old '
+            'WHERE interest.id = old.id AND interest.id = ANY(%s) '
+            'AND interest.status <> %s '
+            'RETURNING interest.id, interest.vacancy_id, '
+            'interest.candidate_id, old.status'
+        )
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql, [status, timezone.now(), list(interest_ids), status]
+                )
+                rows = cursor.fetchall()
+            notified_ids = [
+                id
+                for id, _, _, old_status in rows
+                if VacancyInterest.is_status_change_notified(
+                    old_status=old_status, status=status
+                )
+            ]
+            if notified_ids:
+                self.outbox_service.publish(
+                    task=notify_application_status.name,
+                    interest_ids=notified_ids,
+                    status=status,
+                )
+            # Bulk updates do not send the signals which invalidate these
+            invalidate_tags_on_commit(
+                *{f'vacancy:{vacancy_id}' for _, vacancy_id, _, _ in rows},
+                *{f'jobseeker:{candidate_id}' for _, _, candidate_id, _ in rows},
+            )
+        self.logger.info(
+            'Application statuses changed',
+            extra={
+                'info': f'status: {status}, changed: {len(rows)}, '
+                f'notified: {len(notified_ids)}'
+            },
+        )
+        return [id for id, _, _, _ in rows]
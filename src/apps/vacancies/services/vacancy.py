@@ -2,10 +2,20 @@ from dataclasses import dataclass
 from logging import Logger
 from typing import Iterable
 
-from django.db.models import Q
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Greatest
 
 from src.core.exceptions import NotFound
+from src.common.services.counters import BaseCounterService, TotalCount
+from src.common.filters.skills import build_skills_query
+from src.common.utils.cursor import paginate_by_cursor
 from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
 from src.apps.profiles.services.jobseekers import ORMJobSeekerService
 from src.apps.profiles.services.employers import ORMEmployerService
 from src.apps.vacancies.filters import VacancyFilters
@@ -20,19 +30,19 @@ class ORMVacancyService(BaseVacancyService):
     logger: Logger
     employer_service: ORMEmployerService
     jobseeker_service: ORMJobSeekerService
+    counter_service: BaseCounterService
 
     def _get_model_or_raise_exception(
         self,
         message: str | None = None,
         related: bool = False,
+        with_candidates: bool = False,
         **lookup_parameters,
     ) -> Vacancy:
         try:
             if related:
-                vacancy = (
-                    Vacancy.objects.select_related('employer')
-                    .prefetch_related('interested_candidates')
-                    .get(**lookup_parameters)
+                vacancy = self._get_queryset(with_candidates).get(
+                    **lookup_parameters
                 )
             else:
                 vacancy = Vacancy.objects.get(**lookup_parameters)
@@ -45,16 +55,22 @@ class ORMVacancyService(BaseVacancyService):
     def _build_queryset(self, filters: VacancyFilters) -> Q:
         query = Q(open=True)
         if filters.search:
-            query &= Q(title__icontains=filters.search)
-            query &= Q(description__icontains=filters.search)
+            # Full text match or a similar title, the latter tolerates typos
+            search_query = self._get_search_query(filters.search)
+            query &= Q(search_vector=search_query) | Q(
+                title__trigram_similar=filters.search
+            )
         if filters.is_remote is not None:
             query &= Q(is_remote=filters.is_remote)
         if filters.required_experience__gte:
             query &= Q(required_experience__gte=filters.required_experience__gte)
         if filters.required_skills:
-            # ?Icontains does not work with ArrayField
-            skills = [skill.lower() for skill in filters.required_skills]
-            query &= Q(required_skills__contains=skills)
+            query &= build_skills_query(
+                field='skills',
+                skills=filters.required_skills,
+                match=filters.skills_match,
+                min_match=filters.skills_min_match,
+            )
         if filters.created_at__gte:
             query &= Q(created_at__gte=filters.created_at__gte)
         if filters.location:
@@ -69,36 +85,89 @@ class ORMVacancyService(BaseVacancyService):
             query &= Q(stack__icontains=filters.stack)
         if filters.relocation is not None:
             query &= Q(relocation=filters.relocation)
-        if filters.employment_type:
-            query &= Q(employment_type=filters.employment_type)
         return query
 
+    def _get_search_query(self, search: str) -> SearchQuery:
+        return SearchQuery(
+            search,
+            search_type='websearch',
+            config=Vacancy.SEARCH_CONFIG,
+        )
+
+    def _order_by_relevance(
+        self, queryset: QuerySet[Vacancy], search: str
+    ) -> QuerySet[Vacancy]:
+        rank = Greatest(
+            SearchRank(F('search_vector'), self._get_search_query(search)),
+            TrigramSimilarity('title', search),
+        )
+        return queryset.annotate(rank=rank).order_by(
+            '-rank', *Vacancy.CURSOR_ORDERING
+        )
+
+    def _get_queryset(self, with_candidates: bool = False) -> QuerySet[Vacancy]:
+        queryset = Vacancy.objects.select_related('employer')
+        if with_candidates:
+            queryset = queryset.prefetch_related('interested_candidates')
+        return queryset
+
     def get_list(
         self,
         filters: VacancyFilters,
         offset: int = 0,
         limit: int = 20,
+        with_candidates: bool = False,
     ) -> list[VacancyEntity]:
         query = self._build_queryset(filters=filters)
-        vacancy_list = Vacancy.objects.filter(query)[offset : offset + limit]
-        return [vacancy.to_entity() for vacancy in vacancy_list]
+        queryset = self._get_queryset(with_candidates).filter(query)
+        if filters.search:
+            queryset = self._order_by_relevance(queryset, filters.search)
+        vacancy_list = queryset[offset : offset + limit]
+        return [
+            vacancy.to_entity(with_candidates=with_candidates)
+            for vacancy in vacancy_list
+        ]
+
+    def get_list_by_cursor(
+        self,
+        filters: VacancyFilters,
+        cursor: str,
+        limit: int = 20,
+    ) -> tuple[list[VacancyEntity], str | None]:
+        # Keyset pages keep the cursor order, search results are not ranked
+        query = self._build_queryset(filters=filters)
+        vacancy_list, next_cursor = paginate_by_cursor(
+            queryset=self._get_queryset().filter(query),
+            ordering=Vacancy.CURSOR_ORDERING,
+            cursor=cursor,
+            limit=limit,
+        )
+        return [vacancy.to_entity() for vacancy in vacancy_list], next_cursor
 
     def get_total_count(self, filters: VacancyFilters) -> int:
         query = self._build_queryset(filters=filters)
         vacancy_count = Vacancy.available.filter(query).count()
         return vacancy_count
 
-    def get(self, id: int) -> VacancyEntity:
+    def get_estimated_count(self, filters: VacancyFilters) -> TotalCount:
+        query = self._build_queryset(filters=filters)
+        return self.counter_service.count(
+            queryset=Vacancy.available.filter(query),
+            filters=filters,
+        )
+
+    def get(self, id: int, with_candidates: bool = False) -> VacancyEntity:
         vacancy = self._get_model_or_raise_exception(
             id=id,
-            related=False,
+            related=True,
+            with_candidates=with_candidates,
             message=f"Vacancy with id '{id}' not found",
         )
-        return vacancy.to_entity()
+        return vacancy.to_entity(with_candidates=with_candidates)
 
     def get_all(self, filters: VacancyFilters) -> Iterable[VacancyEntity]:
         query = self._build_queryset(filters=filters)
-        for vacancy in Vacancy.objects.filter(query):
+        for vacancy in self._get_queryset().filter(query):
             yield vacancy.to_entity()
 
     def create(
@@ -111,7 +180,7 @@ class ORMVacancyService(BaseVacancyService):
         )
         new_vacancy = Vacancy(employer=employer)
         for field, val in entity.to_dict().items():
-            if val is not None or field not in ['pk', 'id']:
+            if val is not None and field not in ['pk', 'id']:
                 setattr(new_vacancy, field, val)
         new_vacancy.save()
         return new_vacancy.to_entity()
@@ -123,7 +192,6 @@ class ORMVacancyService(BaseVacancyService):
         vacancy = self._get_model_or_raise_exception(
             id=vacancy_id,
             message=f"Vacancy with id '{vacancy_id}' not found",
-            related=True,
         )
         vacancy.interested_candidates.add(candidate.id)  # type: ignore
 
@@ -134,5 +202,17 @@ class ORMVacancyService(BaseVacancyService):
         limit: int = 20,
     ) -> list[JobSeekerEntity]:
         vacancy = Vacancy.objects.get(id=vacancy_id)
-        candidates = vacancy.interested_candidates.all()[offset:limit]
+        candidates = vacancy.interested_candidates.all()
+        candidates = candidates[offset : offset + limit]
         return [c.to_entity() for c in candidates]
+
+    def get_candidates_for_ranking(
+        self, vacancy_id: int
+    ) -> list[JobSeekerEntity]:
+        rows = JobSeekerProfile.objects.filter(
+            interested_in=vacancy_id
+        ).values_list('id', 'skill_ids', 'experience')
+        return [
+            JobSeekerEntity(id=id, skill_ids=skill_ids, experience=experience)
+            for id, skill_ids, experience in rows
+        ]
@@ -0,0 +1,134 @@
+from functools import partial
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from src.common.container import container
+from src.common.utils.cache import get_entity_cache, invalidate_tags_on_commit
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.models import Vacancy, VacancyInterest
+from src.apps.vacancies.tasks import (
+    notify_application_status,
+    update_match_scores,
+)
+from src.apps.notifications.services.outbox import BaseOutboxService
+
+
+def schedule_match_scores_update(
+    vacancy_ids: Iterable[int] | None = None,
+    candidate_ids: Iterable[int] | None = None,
+) -> None:
+    # Written to the outbox, so scores are only updated for committed changes
+    container.resolve(BaseOutboxService).publish(
+        task=update_match_scores.name,
+        vacancy_ids=None if vacancy_ids is None else list(vacancy_ids),
+        candidate_ids=None if candidate_ids is None else list(candidate_ids),
+    )
+
+
+@receiver([post_save, post_delete], sender=Vacancy)
+def invalidate_vacancy(sender, instance: Vacancy, **kwargs) -> None:
+    invalidate_tags_on_commit(
+        f'vacancy:{instance.pk}', f'ranking:{instance.pk}', 'vacancy-list'
+    )
+    transaction.on_commit(
+        partial(get_entity_cache('vacancy').delete, instance.pk)
+    )
+
+
+@receiver([post_save, post_delete], sender=VacancyInterest)
+def invalidate_vacancy_interest(
+    sender,
+    instance: VacancyInterest,
+    **kwargs,
+) -> None:
+    invalidate_tags_on_commit(
+        f'vacancy:{instance.vacancy_id}',
+        f'ranking:{instance.vacancy_id}',
+        f'matches:{instance.vacancy_id}',
+        f'jobseeker:{instance.candidate_id}',
+    )
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_save, sender=JobSeekerProfile)
+def update_changed_match_scores(
+    sender,
+    instance: Vacancy | JobSeekerProfile,
+    created: bool,
+    **kwargs,
+) -> None:
+    # New vacancies and profiles have no applications yet
+    if created or not instance.get_changed_fields():
+        return
+    if sender is Vacancy:
+        invalidate_tags_on_commit(f'matches:{instance.pk}')
+        schedule_match_scores_update(vacancy_ids=[instance.pk])
+    else:
+        schedule_match_scores_update(candidate_ids=[instance.pk])
+
+
+@receiver(post_save, sender=VacancyInterest)
+def create_match_score(
+    sender,
+    instance: VacancyInterest,
+    created: bool,
+    **kwargs,
+) -> None:
+    if created:
+        schedule_match_scores_update(
+            vacancy_ids=[instance.vacancy_id],
+            candidate_ids=[instance.candidate_id],
+        )
+
+
+@receiver(post_save, sender=VacancyInterest)
+def notify_status_change(
+    sender,
+    instance: VacancyInterest,
+    created: bool,
+    **kwargs,
+) -> None:
+    if created or 'status' not in instance.get_changed_fields():
+        return
+    if not VacancyInterest.is_status_change_notified(
+        old_status=instance.get_loaded_value('status'),
+        status=instance.status,
+    ):
+        return
+    # Sent from the outbox once the change is committed
+    container.resolve(BaseOutboxService).publish(
+        task=notify_application_status.name,
+        interest_ids=[instance.pk],
+        status=instance.status,
+    )
+
+
+@receiver(m2m_changed, sender=Vacancy.interested_candidates.through)
+def add_interested_candidates(
+    sender,
+    instance: Vacancy | JobSeekerProfile,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs,
+) -> None:
+    # Applications added through the relation are bulk created without
+    # post_save, removed ones are deleted along with their match scores
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        vacancy_ids, candidate_ids = pk_set, {instance.pk}
+    else:
+        vacancy_ids, candidate_ids = {instance.pk}, pk_set
+    invalidate_tags_on_commit(
+        *(f'vacancy:{vacancy_id}' for vacancy_id in vacancy_ids),
+        *(f'ranking:{vacancy_id}' for vacancy_id in vacancy_ids),
+        *(f'matches:{vacancy_id}' for vacancy_id in vacancy_ids),
+        *(f'jobseeker:{candidate_id}' for candidate_id in candidate_ids),
+    )
+    schedule_match_scores_update(
+        vacancy_ids=vacancy_ids, candidate_ids=candidate_ids
+    )
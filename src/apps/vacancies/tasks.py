@@ -0,0 +1,114 @@
+from itertools import groupby
+from operator import attrgetter
+
+from celery import shared_task
+
+from src.core.exceptions import NotFound
+from src.common.filters.skills import SkillMatch
+from src.common.services.notifications import CeleryNotificationService
+from src.common.utils.cache import invalidate_tags
+from src.apps.profiles.filters import JobSeekerFilters
+from src.apps.profiles.services.base import BaseJobSeekerService
+from src.apps.vacancies.services.base import BaseVacancyService
+from src.apps.vacancies.models import VacancyInterest
+from src.apps.vacancies.services.match_scores import BaseMatchScoreService
+
+
+@shared_task(ignore_result=True)
+def update_match_scores(
+    vacancy_ids: list[int] | None = None,
+    candidate_ids: list[int] | None = None,
+) -> None:
+    """
+    Recomputes match scores of the applications to 'vacancy_ids'
+    made by 'candidate_ids' and invalidates rankings of their vacancies
+    """
+    # The container imports use cases which schedule these tasks
+    from src.common.container import container
+
+    service: BaseMatchScoreService = container.resolve(BaseMatchScoreService)
+    updated_vacancy_ids = service.update(
+        vacancy_ids=vacancy_ids, candidate_ids=candidate_ids
+    )
+    invalidate_tags(*(f'ranking:{id}' for id in updated_vacancy_ids))
+
+
+@shared_task(ignore_result=True)
+def notify_matching_jobseekers(vacancy_id: int) -> None:
+    """
+    Notifies jobseekers who allow notifications and have any of the skills
+    required by the vacancy, they are streamed from the database
+    to the notification service
+    """
+    from src.common.container import container
+
+    vacancy_service: BaseVacancyService = container.resolve(BaseVacancyService)
+    jobseeker_service: BaseJobSeekerService = container.resolve(
+        BaseJobSeekerService
+    )
+    # Workers send notifications to Celery directly, not through the outbox
+    notification_service: CeleryNotificationService = container.resolve(
+        CeleryNotificationService
+    )
+    try:
+        vacancy = vacancy_service.get(id=vacancy_id)
+    except NotFound:
+        return
+    if not vacancy or not vacancy.required_skills:
+        return
+    jobseekers = jobseeker_service.get_all(
+        filters=JobSeekerFilters(
+            allow_notifications=True,
+            skills=vacancy.required_skills,
+            skills_match=SkillMatch.ANY,
+        )
+    )
+    notification_service.send_notification_group(
+        message=f'New vacancy "{vacancy.title}" requires skills that you have!',
+        objects=jobseekers,
+    )
+
+
+@shared_task(ignore_result=True)
+def notify_application_status(interest_ids: list[int], status: str) -> None:
+    """
+    Notifies candidates of applications 'interest_ids' that they got
+    'status', applications changed again since then are skipped.
+    Candidates of the same vacancy get the same message as a group
+    """
+    from src.common.container import container
+
+    notification_service: CeleryNotificationService = container.resolve(
+        CeleryNotificationService
+    )
+    interests = (
+        VacancyInterest.objects.filter(id__in=interest_ids, status=status)
+        .select_related('vacancy', 'candidate')
+        .only(
+            'status',
+            'vacancy__title',
+            'vacancy__company_name',
+            'candidate__id',
+        )
+        .order_by('vacancy_id', 'id')
+    )
+    for _, vacancy_interests in groupby(
+        interests.iterator(), key=attrgetter('vacancy_id')
+    ):
+        vacancy_interests = list(vacancy_interests)
+        notification = vacancy_interests[0].get_status_notification()
+        if notification is None:
+            continue
+        subject, message = notification
+        if len(vacancy_interests) == 1:
+            notification_service.send_notification(
+                object=vacancy_interests[0].candidate,
+                subject=subject,
+                message=message,
+            )
+            continue
+        notification_service.send_notification_group(
+            message=message,
+            objects=[interest.candidate for interest in vacancy_interests],
+            subject=subject,
+        )
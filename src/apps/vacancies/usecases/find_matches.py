@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from src.core.exceptions import VacancyAccessDenied, VacancyDoesNotExist
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.profiles.services.base import BaseJobSeekerService
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.services.base import BaseVacancyService
+from src.apps.vacancies.services.matches import BaseCandidateMatcher
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class FindCandidateMatchesUseCase:
+    vacancy_service: BaseVacancyService
+    jobseeker_service: BaseJobSeekerService
+    candidate_matcher: BaseCandidateMatcher
+
+    def execute(
+        self,
+        vacancy_id: int,
+        employer_id: int,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[JobSeekerEntity], int]:
+        """
+        Returns a page of jobseekers matching the vacancy who have not
+        applied to it and the total number of matches.
+        Only the employer of the vacancy may source candidates for it
+        """
+        vacancy: VacancyEntity | None = self.vacancy_service.get(id=vacancy_id)
+        if not vacancy:
+            raise VacancyDoesNotExist(vacancy_id)
+        if vacancy.employer is None or vacancy.employer.id != employer_id:
+            raise VacancyAccessDenied(vacancy_id)
+        matched_ids = self.candidate_matcher.match(vacancy=vacancy)
+        candidates = self.jobseeker_service.get_by_ids(
+            ids=matched_ids[offset : offset + limit]
+        )
+        return candidates, len(matched_ids)
@@ -2,16 +2,39 @@ from logging import Logger, getLogger
 from typing import Any
 
 import punq
+from django.conf import settings
 
 from src.common.services.base import (
     BaseNotificationService,
 )
+from src.common.services.counters import (
+    BaseCounterService,
+    EstimatedCounterService,
+)
 from src.common.services.notifications import (
     CeleryNotificationService,
     ComposedNotificationService,
     EmailNotificationService,
+    GuardedNotificationService,
     PhoneNotificationService,
 )
+from src.common.utils.cache import TokenBucket, get_entity_cache
+from src.apps.notifications.services.digests import (
+    BaseDigestService,
+    ORMDigestService,
+)
+from src.apps.notifications.services.notifications import (
+    DigestNotificationService,
+    OutboxNotificationService,
+)
+from src.apps.notifications.services.outbox import (
+    BaseOutboxService,
+    ORMOutboxService,
+)
+from src.apps.profiles.services.cached import (
+    CachedEmployerService,
+    CachedJobSeekerService,
+)
 from src.apps.profiles.services.employers import ORMEmployerService
 from src.apps.profiles.services.jobseekers import ORMJobSeekerService
 
@@ -19,6 +42,9 @@ from src.apps.vacancies.usecases.create_vacancy import CreateVacancyUseCase
 from src.apps.vacancies.usecases.filter_candidates import (
     FilterCandidatesInVacancyUseCase,
 )
+from src.apps.vacancies.usecases.find_matches import (
+    FindCandidateMatchesUseCase,
+)
 
 from src.apps.profiles.usecases.apply_to_vacancy import ApplyToVacancyUseCase
 from src.apps.profiles.usecases.update_profile import (
@@ -28,11 +54,36 @@ from src.apps.profiles.services.base import (
     BaseEmployerService,
     BaseJobSeekerService,
 )
+from src.apps.vacancies.services.cached import CachedVacancyService
 from src.apps.vacancies.services.vacancy import (
     BaseVacancyService,
     ORMVacancyService,
 )
+from src.apps.vacancies.services.matches import (
+    BaseCandidateMatcher,
+    CachedCandidateMatcher,
+    SQLCandidateMatcher,
+)
+from src.apps.vacancies.services.match_scores import (
+    BaseMatchScoreService,
+    ORMMatchScoreService,
+)
+from src.apps.vacancies.services.recommendations import (
+    BaseRecommendationService,
+    ORMRecommendationService,
+)
+from src.apps.vacancies.services.ranking import (
+    BaseCandidateRanker,
+    CachedCandidateRanker,
+    PrecomputedCandidateRanker,
+    ScoreCandidateRanker,
+    SQLCandidateRanker,
+)
 from src.apps.vacancies.services.score import ScoreCalculator
+from src.apps.vacancies.services.statuses import (
+    BaseApplicationStatusService,
+    ORMApplicationStatusService,
+)
 
 
 class Container:
@@ -51,50 +102,154 @@ class Container:
         container.register(Logger, instance=lg)
 
         # Notification Service
-        celery_notification_service = CeleryNotificationService(
-            notification_service=ComposedNotificationService(
-                notification_services=(
-                    EmailNotificationService(lg),
-                    PhoneNotificationService(lg),
+        composed_notification_service = ComposedNotificationService(
+            notification_services=tuple(
+                GuardedNotificationService(
+                    notification_service=service,
+                    channel=channel,
+                    rate_limiter=TokenBucket(
+                        **settings.NOTIFICATION_RATE_LIMITS[channel]
+                    ),
+                )
+                for channel, service in (
+                    ('email', EmailNotificationService(lg)),
+                    ('phone', PhoneNotificationService(lg)),
                 )
+            )
+        )
+        digest_service = ORMDigestService(
+            logger=lg,
+            notification_service=composed_notification_service,
+        )
+        container.register(BaseDigestService, instance=digest_service)
+        celery_notification_service = CeleryNotificationService(
+            notification_service=DigestNotificationService(
+                notification_service=composed_notification_service,
+                digest_service=digest_service,
             ),
             logger=lg,
         )
         container.register(
-            BaseNotificationService,
+            CeleryNotificationService,
             instance=celery_notification_service,
         )
 
+        # Outbox Service
+        outbox_service = ORMOutboxService(logger=lg)
+        container.register(BaseOutboxService, instance=outbox_service)
+        # Notifications of requests are sent once their transaction commits
+        container.register(
+            BaseNotificationService,
+            instance=OutboxNotificationService(
+                outbox_service=outbox_service,
+                task=celery_notification_service.name,
+            ),
+        )
+
+        # Counter Service
+        counter_service = EstimatedCounterService(logger=lg)
+        container.register(BaseCounterService, instance=counter_service)
+
         # JobSeeker Profile Service
-        orm_jobseeker_service = ORMJobSeekerService(logger=lg)
+        orm_jobseeker_service = ORMJobSeekerService(
+            logger=lg,
+            counter_service=counter_service,
+        )
+        cached_jobseeker_service = CachedJobSeekerService(
+            jobseeker_service=orm_jobseeker_service,
+            entity_cache=get_entity_cache('jobseeker'),
+            logger=lg,
+        )
         container.register(
             BaseJobSeekerService,
-            instance=orm_jobseeker_service,
+            instance=cached_jobseeker_service,
         )
 
         # Employer Profile Service
         orm_employer_service = ORMEmployerService(logger=lg)
+        cached_employer_service = CachedEmployerService(
+            employer_service=orm_employer_service,
+            entity_cache=get_entity_cache('employer'),
+            logger=lg,
+        )
         container.register(
             BaseEmployerService,
-            instance=orm_employer_service,
+            instance=cached_employer_service,
         )
 
         # Vacancy Service
         orm_vacancy_service = ORMVacancyService(
             jobseeker_service=orm_jobseeker_service,
             employer_service=orm_employer_service,
+            # Totals are cached with the tagged list responses
+            counter_service=EstimatedCounterService(logger=lg, timeout=None),
+            logger=lg,
+        )
+        cached_vacancy_service = CachedVacancyService(
+            vacancy_service=orm_vacancy_service,
+            entity_cache=get_entity_cache('vacancy'),
             logger=lg,
         )
         container.register(
             BaseVacancyService,
-            instance=orm_vacancy_service,
+            instance=cached_vacancy_service,
+        )
+        score_calculator = ScoreCalculator()
+        container.register(ScoreCalculator, instance=score_calculator)
+
+        # Match Score Service
+        match_score_service = ORMMatchScoreService(
+            logger=lg,
+            score_calculator=score_calculator,
+        )
+        container.register(BaseMatchScoreService, instance=match_score_service)
+
+        # Recommendation Service
+        recommendation_service = ORMRecommendationService(
+            logger=lg,
+            score_calculator=score_calculator,
+        )
+        container.register(
+            BaseRecommendationService,
+            instance=recommendation_service,
+        )
+
+        # Candidate Ranker
+        if settings.CANDIDATE_RANKING_BACKEND == 'precomputed':
+            ranker = PrecomputedCandidateRanker(
+                match_score_service=match_score_service
+            )
+        elif settings.CANDIDATE_RANKING_BACKEND == 'sql':
+            ranker = SQLCandidateRanker(score_calculator=score_calculator)
+        else:
+            ranker = ScoreCandidateRanker(
+                vacancy_service=orm_vacancy_service,
+                score_calculator=score_calculator,
+            )
+        candidate_ranker = CachedCandidateRanker(ranker=ranker)
+        container.register(BaseCandidateRanker, instance=candidate_ranker)
+
+        # Application Status Service
+        application_status_service = ORMApplicationStatusService(
+            logger=lg,
+            outbox_service=outbox_service,
+        )
+        container.register(
+            BaseApplicationStatusService,
+            instance=application_status_service,
+        )
+
+        # Candidate Matcher
+        candidate_matcher = CachedCandidateMatcher(
+            matcher=SQLCandidateMatcher(score_calculator=score_calculator)
         )
-        container.register(ScoreCalculator, instance=ScoreCalculator())
+        container.register(BaseCandidateMatcher, instance=candidate_matcher)
 
         # Use Cases
         container.register(CreateVacancyUseCase)
         container.register(ApplyToVacancyUseCase)
         container.register(FilterCandidatesInVacancyUseCase)
+        container.register(FindCandidateMatchesUseCase)
         container.register(UpdateJobSeekerProfileUseCase)
 
         return container
@@ -4,9 +4,15 @@ from pydantic import BaseModel
 class PaginationIn(BaseModel):
     offset: int = 0
     limit: int = 20
+    # Opt-in keyset pagination: pass an empty cursor to get the first page
+    # and then the 'next_cursor' of the previous response
+    cursor: str | None = None
 
 
 class PaginationOut(BaseModel):
     offset: int
     limit: int
     total: int
+    # False when the total is a planner estimate for a large result
+    total_is_exact: bool = True
+    next_cursor: str | None = None
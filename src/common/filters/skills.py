@@ -0,0 +1,46 @@
+from enum import Enum
+
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import CharField, F, Func, IntegerField, Q, Value
+from django.db.models.lookups import GreaterThanOrEqual
+
+
+class SkillMatch(str, Enum):
+    ALL = 'all'
+    ANY = 'any'
+
+
+class ArrayIntersectionCount(Func):
+    """Number of distinct elements two arrays have in common"""
+
+    template = 'cardinality(ARRAY(SELECT unnest(%(expressions)s)))'
+    arg_joiner = ') INTERSECT SELECT unnest('
+    output_field = IntegerField()
+
+
+def build_skills_query(
+    field: str,
+    skills: list[str],
+    match: SkillMatch = SkillMatch.ALL,
+    min_match: int = 0,
+) -> Q:
+    """
+    Build a condition over the array 'field' which is served by its GIN index:
+    - ALL: the field contains every skill (@>)
+    - ANY: the field has at least one of the skills (&&)
+    - ANY with min_match: at least 'min_match' of the skills,
+      the overlap still narrows rows down through the index
+    """
+    skills = [skill.lower() for skill in skills]
+    if not skills:
+        return Q()
+    if match == SkillMatch.ALL:
+        return Q(**{f'{field}__contains': skills})
+    query = Q(**{f'{field}__overlap': skills})
+    if min_match > 1:
+        matched = ArrayIntersectionCount(
+            F(field),
+            Value(skills, output_field=ArrayField(CharField())),
+        )
+        query &= Q(GreaterThanOrEqual(matched, min_match))
+    return query
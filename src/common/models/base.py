@@ -1,4 +1,6 @@
+from copy import copy
 from datetime import timezone
+from typing import Any, Iterable
 
 from django.db import models
 
@@ -38,3 +40,61 @@ class TimedBaseModel(models.Model):
         elapsed_time = now - self.created_at
         # Determine time unit based on elapsed time
         return get_elapsed_time_with_message(elapsed_time)
+
+
+class TrackedFieldsMixin(models.Model):
+    """
+    Remembers values of 'tracked_fields' as they were loaded from
+    or saved to the database, see 'get_changed_fields'
+    """
+
+    tracked_fields: tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._remember_tracked_fields(kwargs.get('update_fields'))
+
+    def get_changed_fields(self) -> set[str]:
+        """
+        Returns tracked fields changed since the instance was loaded,
+        every tracked field of a new instance is considered changed.
+        Signals sent while saving still see the changes
+        """
+        loaded = getattr(self, '_tracked_values', None)
+        if loaded is None:
+            return set(self.tracked_fields)
+        return {
+            field
+            for field, value in loaded.items()
+            if getattr(self, field) != value
+        }
+
+    def get_loaded_value(self, field: str) -> Any:
+        """
+        Returns the value of a tracked field as it was loaded,
+        None for new instances
+        """
+        loaded = getattr(self, '_tracked_values', None) or {}
+        return loaded.get(field)
+
+    def _remember_tracked_fields(
+        self, fields: Iterable[str] | None = None
+    ) -> None:
+        fields = self.tracked_fields if fields is None else set(fields)
+        deferred = self.get_deferred_fields()
+        values = getattr(self, '_tracked_values', None) or {}
+        values.update(
+            (field, copy(getattr(self, field)))
+            for field in self.tracked_fields
+            if field in fields and field not in deferred
+        )
+        self._tracked_values = values
@@ -0,0 +1,10 @@
+from django.contrib.postgres.fields import ArrayField
+
+
+class ReturningArrayField(ArrayField):
+    """
+    Array column set by a database trigger, its value is read back
+    by INSERT ... RETURNING along with the primary key
+    """
+
+    db_returning = True
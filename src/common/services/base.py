@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, TypeVar, Any, Generic
 
+from src.common.services.counters import TotalCount
+
 
 ET = TypeVar('ET')
 
@@ -9,9 +11,22 @@ class BaseService(Generic[ET], ABC):
     @abstractmethod
     def get_list(self, filters: Any, offset: int, limit: int) -> list[ET]: ...
 
+    @abstractmethod
+    def get_list_by_cursor(
+        self, filters: Any, cursor: str, limit: int
+    ) -> tuple[list[ET], str | None]:
+        """Returns the page after 'cursor' and a cursor of the next page"""
+
     @abstractmethod
     def get_total_count(self, filters: Any) -> int: ...
 
+    def get_estimated_count(self, filters: Any) -> TotalCount:
+        """
+        Returns the total count which may be estimated for large results,
+        see TotalCount.exact
+        """
+        return TotalCount(value=self.get_total_count(filters=filters))
+
     @abstractmethod
     def get(self, id: int) -> ET | None: ...
 
@@ -30,5 +45,9 @@ class BaseNotificationService(Generic[ET], ABC):
 
     @abstractmethod
     def send_notification_group(
-        self, message: str, objects: Iterable[ET]
-    ) -> None: ...
+        self,
+        message: str,
+        objects: Iterable[ET],
+        subject: str | None = None,
+    ) -> None:
+        """Sends 'message' titled 'subject' or the name of each object"""
@@ -0,0 +1,118 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from logging import Logger
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True, slots=True)
+class TotalCount:
+    value: int
+    exact: bool = True
+
+
+class BaseCounterService(ABC):
+    @abstractmethod
+    def count(
+        self,
+        queryset: QuerySet,
+        filters: BaseModel | None = None,
+    ) -> TotalCount: ...
+
+
+class ExactCounterService(BaseCounterService):
+    def count(
+        self,
+        queryset: QuerySet,
+        filters: BaseModel | None = None,
+    ) -> TotalCount:
+        return TotalCount(value=queryset.count())
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class EstimatedCounterService(BaseCounterService):
+    """
+    Counts rows exactly only when the planner expects a small result,
+    larger results are estimated with table statistics (no filters)
+    or EXPLAIN (with filters). Counts are cached for 'timeout' seconds
+    under a key built from the normalized filters, None disables the cache
+    for totals cached along with their tagged responses
+    """
+
+    logger: Logger
+    threshold: int = settings.COUNT_ESTIMATE_THRESHOLD
+    timeout: int | None = settings.COUNT_CACHE_TIMEOUT
+
+    def _get_cache_key(
+        self, queryset: QuerySet, filters: BaseModel | None
+    ) -> str:
+        if filters is not None:
+            raw = json.dumps(filters.model_dump(mode='json'), sort_keys=True)
+        else:
+            raw = str(queryset.query)
+        digest = hashlib.md5(raw.encode()).hexdigest()
+        return f'count:{queryset.model._meta.label_lower}:{digest}'
+
+    def _estimate_from_statistics(self, queryset: QuerySet) -> int | None:
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables which were never analyzed
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+    def _estimate_from_plan(self, queryset: QuerySet) -> int:
+        sql, params = queryset.query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def _estimate(self, queryset: QuerySet) -> int | None:
+        if connections[queryset.db].vendor != 'postgresql':
+            return None
+        try:
+            estimate = None
+            if not queryset.query.where:
+                estimate = self._estimate_from_statistics(queryset)
+            if estimate is None:
+                estimate = self._estimate_from_plan(queryset)
+        except (DatabaseError, KeyError, IndexError, TypeError) as e:
+            self.logger.warning(
+                'Could not estimate row count',
+                extra={'info': f'{queryset.model.__name__}: {e}'},
+            )
+            return None
+        return estimate
+
+    def count(
+        self,
+        queryset: QuerySet,
+        filters: BaseModel | None = None,
+    ) -> TotalCount:
+        queryset = queryset.order_by()
+        if self.timeout is not None:
+            cache_key = self._get_cache_key(queryset, filters)
+            total = cache.get(cache_key)
+            if total is not None:
+                return total
+        estimate = self._estimate(queryset)
+        if estimate is None or estimate < self.threshold:
+            total = TotalCount(value=queryset.count())
+        else:
+            total = TotalCount(value=estimate, exact=False)
+        if self.timeout is not None:
+            cache.set(cache_key, total, self.timeout)
+        return total
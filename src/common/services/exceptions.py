@@ -15,3 +15,16 @@ class NotificationServiceException(ApplicationException):
 
     def __str__(self) -> str:
         return self.message
+
+
+class NotificationDeferred(NotificationServiceException):
+    """Recipients were rate limited, they may be notified after 'retry_after'"""
+
+    def __init__(self, channel: str, count: int, retry_after: float) -> None:
+        super().__init__(
+            f'{count} {channel} notifications were deferred '
+            f'for {retry_after:.0f} seconds'
+        )
+        self.channel: str = channel
+        self.count: int = count
+        self.retry_after: float = retry_after
@@ -1,16 +1,33 @@
-from dataclasses import dataclass
-from typing import Iterable, TypeVar
-from logging import Logger
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Callable, Iterable, Iterator, TypeVar
+from logging import Logger, getLogger
 
-from django.core.mail import send_mail, send_mass_mail
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
 
-from celery import Task
+from celery import Task, chord, group, shared_task
 
 from src.core.exceptions import ApplicationException
 from src.common.models.exeptions import IncorrectModelTypeError
+from src.common.utils.cache import TokenBucket
+from src.common.utils.iterables import chunked
+from src.common.utils.metrics import increment_metric
 from src.common.utils.orm import get_orm_models
-from src.common.services.exceptions import NotificationServiceException
+from src.common.services.exceptions import (
+    NotificationDeferred,
+    NotificationServiceException,
+)
 
 from .base import BaseNotificationService
 
@@ -20,7 +37,27 @@ ET = TypeVar('ET')
 
 @dataclass(unsafe_hash=True)
 class EmailNotificationService(BaseNotificationService[ET]):
+    """
+    Sends emails over a connection kept open by each worker process,
+    groups are sent by 'batch_size' messages with send_messages.
+    A batch which failed on a broken connection is resent once over a new
+    one. Counts 'email:sent', 'email:failed', 'email:batches',
+    'email:reconnects' and 'email:send-ms' metrics for the throughput
+    """
+
     logger: Logger
+    batch_size: int = settings.EMAIL_BATCH_SIZE
+    _connection: BaseEmailBackend | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    # The connection is not shared with processes forked after opening it
+    _pid: int | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    # Threads sending at once take turns on the connection
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, compare=False, repr=False
+    )
 
     def send_notification(
         self,
@@ -39,21 +76,25 @@ class EmailNotificationService(BaseNotificationService[ET]):
             raise NotificationServiceException(
                 f'{subject} does not have an email'
             )
-        send_mail(
-            message=message,
-            subject=subject,
-            from_email=from_email,
-            recipient_list=[email],
-            fail_silently=False,
+        self._send(
+            [
+                EmailMessage(
+                    subject=subject,
+                    body=message,
+                    from_email=from_email,
+                    to=[email],
+                )
+            ]
         )
 
     def send_notification_group(
         self,
         message: str,
         objects: Iterable[ET],
+        subject: str | None = None,
         from_email: str = settings.EMAIL_FROM,
     ) -> None:
-        data = []
+        emails = []
         for obj in objects:
             try:
                 email = obj.email
@@ -63,12 +104,55 @@ class EmailNotificationService(BaseNotificationService[ET]):
                     extra={'info': f'cls: {obj.__class__}, id: {obj.id}'},
                 )
                 continue
-            data.append((str(obj), message, from_email, (email,)))
-        send_mass_mail(
-            data,
-            fail_silently=False,
-        )
+            emails.append(
+                EmailMessage(
+                    subject=subject or str(obj),
+                    body=message,
+                    from_email=from_email,
+                    to=[email],
+                )
+            )
+        for batch in chunked(emails, self.batch_size):
+            self._send(batch)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except OSError:
+                pass
+        self._connection = None
 
+    def _get_connection(self) -> BaseEmailBackend:
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = get_connection(fail_silently=False)
+            self._connection.open()
+            self._pid = os.getpid()
+        return self._connection
+
+    def _send(self, emails: list[EmailMessage]) -> None:
+        start = time.perf_counter()
+        with self._lock:
+            try:
+                sent = self._get_connection().send_messages(emails)
+            except OSError as e:  # SMTPException and connection errors
+                self.logger.warning(
+                    msg='Email connection failed, reconnecting',
+                    extra={'info': f'emails: {len(emails)}, error: {e}'},
+                )
+                increment_metric('email:reconnects')
+                self.close()
+                try:
+                    sent = self._get_connection().send_messages(emails)
+                except OSError:
+                    self.close()
+                    increment_metric('email:failed', len(emails))
+                    raise
+        increment_metric('email:batches')
+        increment_metric('email:sent', sent or 0)
+        increment_metric(
+            'email:send-ms', round((time.perf_counter() - start) * 1000)
+        )
 
 @dataclass(unsafe_hash=True)
 class PhoneNotificationService(BaseNotificationService[ET]):
@@ -96,6 +180,7 @@ class PhoneNotificationService(BaseNotificationService[ET]):
         self,
         message: str,
         objects: Iterable[ET],
+        subject: str | None = None,
     ) -> None:
         for obj in objects:
             try:
@@ -111,7 +196,15 @@ class PhoneNotificationService(BaseNotificationService[ET]):
 
 @dataclass(unsafe_hash=True)
 class ComposedNotificationService(BaseNotificationService[ET]):
+    """
+    Sends notifications through all of the services at once in threads,
+    so it takes as long as the slowest of them. Recipients of a group are
+    loaded once by chunks of 'chunk_size' which every service gets.
+    Errors are raised after all of the services finished
+    """
+
     notification_services: tuple[BaseNotificationService, ...]
+    chunk_size: int = settings.NOTIFICATION_CHUNK_SIZE
 
     def send_notification(
         self,
@@ -119,30 +212,197 @@ class ComposedNotificationService(BaseNotificationService[ET]):
         subject: str,
         object: ET,
     ) -> None:
-        for service in self.notification_services:
-            service.send_notification(
+        self._dispatch(
+            lambda service: service.send_notification(
                 message=message,
                 subject=subject,
                 object=object,
             )
+        )
 
     def send_notification_group(
         self,
         message: str,
         objects: Iterable[ET],
+        subject: str | None = None,
     ) -> None:
-        for service in self.notification_services:
-            service.send_notification_group(
-                message=message,
-                objects=objects,
+        for chunk in chunked(objects, self.chunk_size):
+            self._dispatch(
+                lambda service: service.send_notification_group(
+                    message=message,
+                    objects=chunk,
+                    subject=subject,
+                )
+            )
+
+    def _dispatch(
+        self, send: Callable[[BaseNotificationService], None]
+    ) -> None:
+        if len(self.notification_services) == 1:
+            send(self.notification_services[0])
+            return
+        with ThreadPoolExecutor(
+            max_workers=len(self.notification_services)
+        ) as executor:
+            # Threads see the idempotency key of the notification
+            futures = [
+                executor.submit(copy_context().run, send, service)
+                for service in self.notification_services
+            ]
+        for future in futures:
+            future.result()
+
+
+# Key of the notification being sent, CeleryNotificationService sets it
+# for the services of its task, see GuardedNotificationService
+notification_key: ContextVar[str | None] = ContextVar(
+    'notification_key', default=None
+)
+
+
+@contextmanager
+def idempotency_key(key: str | None) -> Iterator[None]:
+    """Sends notifications within the block under the idempotency key"""
+    token = notification_key.set(key)
+    try:
+        yield
+    finally:
+        notification_key.reset(token)
+
+
+@dataclass(unsafe_hash=True)
+class GuardedNotificationService(BaseNotificationService[ET]):
+    """
+    Guards a 'channel' of notifications:
+    - a recipient is notified once per idempotency key, repeated
+      notifications (retried tasks, relayed twice messages) are dropped
+    - recipients are rate limited by their token buckets of the channel,
+      notifications exceeding them are deferred with NotificationDeferred
+    Counts '<channel>:dropped' and '<channel>:deferred' notifications metrics
+    """
+
+    notification_service: BaseNotificationService
+    channel: str
+    rate_limiter: TokenBucket = field(compare=False)
+    idempotency_timeout: int = settings.NOTIFICATION_IDEMPOTENCY_TIMEOUT
+
+    def send_notification(
+        self,
+        message: str,
+        subject: str,
+        object: ET,
+    ) -> None:
+        with self._guard([object]) as allowed:
+            if allowed:
+                self.notification_service.send_notification(
+                    message=message,
+                    subject=subject,
+                    object=object,
+                )
+
+    def send_notification_group(
+        self,
+        message: str,
+        objects: Iterable[ET],
+        subject: str | None = None,
+    ) -> None:
+        with self._guard(objects) as allowed:
+            if allowed:
+                self.notification_service.send_notification_group(
+                    message=message,
+                    objects=allowed,
+                    subject=subject,
+                )
+
+    @contextmanager
+    def _guard(self, objects: Iterable[ET]) -> Iterator[list[ET]]:
+        """Yields recipients of 'objects' which may be notified"""
+        key = notification_key.get()
+        allowed, claimed = [], []
+        dropped, deferred, retry_after = 0, 0, 0.0
+        for obj in objects:
+            recipient = f'{self.channel}:{obj.__class__.__name__}:{obj.id}'
+            claim = f'notification:{key}:{recipient}'
+            if key is not None:
+                if not cache.add(claim, True, self.idempotency_timeout):
+                    dropped += 1
+                    continue
+                claimed.append(claim)
+            wait = self.rate_limiter.consume(recipient)
+            if wait:
+                if key is not None:
+                    cache.delete(claimed.pop())
+                deferred += 1
+                retry_after = max(retry_after, wait)
+                continue
+            allowed.append(obj)
+        try:
+            yield allowed
+        except Exception:
+            # Notifications which were not sent may be retried under the key
+            cache.delete_many(claimed)
+            raise
+        if dropped:
+            increment_metric(f'notifications:{self.channel}:dropped', dropped)
+        if deferred:
+            increment_metric(
+                f'notifications:{self.channel}:deferred', deferred
             )
+            raise NotificationDeferred(
+                channel=self.channel, count=deferred, retry_after=retry_after
+            )
+
+
+# Columns of recipients read by the notification services,
+# group chunks load only those the model has
+NOTIFICATION_FIELDS = (
+    'first_name',
+    'last_name',
+    'title',
+    'email',
+    'phone',
+    'notification_mode',
+)
+
+
+def _only_notification_fields(objects: QuerySet) -> QuerySet:
+    names = {field.name for field in objects.model._meta.concrete_fields}
+    return objects.only(
+        *(field for field in NOTIFICATION_FIELDS if field in names)
+    )
+
+
+@shared_task
+def summarize_notification_group(
+    sent_counts: list[int],
+    model_type: str,
+) -> dict[str, int]:
+    """Body of the notification group chord, sums up its chunks"""
+    summary = {'chunks': len(sent_counts), 'recipients': sum(sent_counts)}
+    getLogger('custom').info(
+        'Notification group sent',
+        extra={'info': f'model_type: {model_type}, {summary}'},
+    )
+    return summary
 
 
 @dataclass(unsafe_hash=True)
 class CeleryNotificationService(BaseNotificationService[ET], Task):
+    """
+    Sends notifications in Celery workers. Group notifications are split
+    into chunks of 'chunk_size' recipients sent in parallel as a chord,
+    a failed chunk is retried on its own and summarize_notification_group
+    reports the whole group once every chunk is sent. Notifications
+    deferred by rate limits are retried once the limits allow them,
+    under the idempotency key of the task so nobody is notified twice
+    """
+
     logger: Logger
     notification_service: BaseNotificationService
     name: str = 'CeleryNotificationTaskService'
+    chunk_size: int = settings.NOTIFICATION_CHUNK_SIZE
+    max_retries: int = settings.NOTIFICATION_MAX_RETRIES
+    default_retry_delay: int = settings.NOTIFICATION_RETRY_DELAY
 
     def send_notification(
         self,
@@ -161,7 +421,9 @@ class CeleryNotificationService(BaseNotificationService[ET], Task):
         self,
         message: str,
         objects: Iterable[ET],
+        subject: str | None = None,
     ) -> None:
+        objects = iter(objects)
         try:
             first_object = next(objects)
         except StopIteration:
@@ -170,43 +432,89 @@ class CeleryNotificationService(BaseNotificationService[ET], Task):
                 extra={'info': f'{objects}'},
             )
             return
-        self.delay(
-            message=message,
-            object_ids=[first_object.id] + [o.id for o in objects],
-            model_type=first_object.__class__.__name__,
-            group=True,
+        model_type = first_object.__class__.__name__
+        object_ids = chain([first_object.id], (obj.id for obj in objects))
+        chunks = [
+            self.s(
+                message=message,
+                object_ids=chunk,
+                model_type=model_type,
+                subject=subject,
+                group=True,
+            )
+            for chunk in chunked(object_ids, self.chunk_size)
+        ]
+        result = chord(group(chunks))(
+            summarize_notification_group.s(model_type=model_type)
+        )
+        self.logger.info(
+            'Notification group scheduled',
+            extra={'info': f'chunks: {len(chunks)}, id: {result.id}'},
         )
 
-    def run(self, message: str, group: bool = False, **kwargs) -> None:
-        if not group:
+    def run(self, message: str, group: bool = False, **kwargs) -> int | None:
+        # Retries of the task are sent under the key of its first run
+        key = kwargs.pop('idempotency_key', None) or self.request.id
+        with idempotency_key(key):
             try:
-                object = get_orm_models(
-                    list_ids=[kwargs.get('object_id')],
-                    model_type=kwargs.get('model_type'),
-                    first=True,
-                )
-            except IncorrectModelTypeError as e:
-                self.logger.error(
-                    msg=f'Invalid model type {e.model_type}',
-                )
-                raise ApplicationException(e)
-            self.notification_service.send_notification(
-                object=object,
-                message=message,
-                subject=kwargs.get('subject', 'User'),
+                if not group:
+                    return self._send(message=message, **kwargs)
+                return self._send_group(message=message, **kwargs)
+            except NotificationDeferred as e:
+                if self.request.retries >= self.max_retries:
+                    self.logger.warning(
+                        msg='Deferred notifications were dropped',
+                        extra={'info': f'{e}'},
+                    )
+                    increment_metric(
+                        f'notifications:{e.channel}:dropped', e.count
+                    )
+                    # Chunks of a group are summed up by the chord body
+                    return 0
+                raise self.retry(exc=e, countdown=math.ceil(e.retry_after))
+
+    def _send(self, message: str, **kwargs) -> None:
+        try:
+            object = get_orm_models(
+                list_ids=[kwargs.get('object_id')],
+                model_type=kwargs.get('model_type'),
+                first=True,
             )
-        else:
-            try:
-                objects = get_orm_models(
-                    model_type=kwargs.get('model_type'),
-                    list_ids=kwargs.get('object_ids'),
-                )
-            except IncorrectModelTypeError as e:
-                self.logger.error(
-                    msg=f'Invalid model type {e.model_type}',
-                )
-                raise ApplicationException(e)
+        except IncorrectModelTypeError as e:
+            self.logger.error(
+                msg=f'Invalid model type {e.model_type}',
+            )
+            raise ApplicationException(e)
+        self.notification_service.send_notification(
+            object=object,
+            message=message,
+            subject=kwargs.get('subject', 'User'),
+        )
+        return None
+
+    def _send_group(self, message: str, **kwargs) -> int:
+        try:
+            objects = get_orm_models(
+                model_type=kwargs.get('model_type'),
+                list_ids=kwargs.get('object_ids'),
+            )
+        except IncorrectModelTypeError as e:
+            self.logger.error(
+                msg=f'Invalid model type {e.model_type}',
+            )
+            raise ApplicationException(e)
+        # Every notification service iterates the same loaded chunk
+        objects = list(_only_notification_fields(objects))
+        try:
             self.notification_service.send_notification_group(
                 message=message,
                 objects=objects,
+                subject=kwargs.get('subject'),
+            )
+        except OSError as e:  # SMTPException and connection errors
+            self.logger.warning(
+                msg='Notification group chunk failed, retrying',
+                extra={'info': f'recipients: {len(objects)}, error: {e}'},
             )
+            raise self.retry(exc=e)
+        return len(objects)
@@ -1,33 +1,388 @@
-from typing import Any, Callable
+import hashlib
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Callable, Iterable
+from urllib.parse import urlencode
 
 from django.conf import settings
 from django.core.cache import cache
-from django.http import HttpRequest
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from ninja.renderers import JSONRenderer
+from pydantic import BaseModel
 
+from src.common.utils.lru import LRUCache
+from src.common.utils.metrics import increment_metric
 
-def generate_cache_key_from_request(request: HttpRequest) -> str:
-    """Construct cache key based on request URL path and query parameters"""
-    list_params = []
-    for param, val in request.GET.items():
-        list_params.append(f'{param}={val}')
-    return f'{request.path}' + ''.join(list_params)
+
+def generate_cache_key_from_request(
+    request: HttpRequest,
+    route: str,
+    per_user: bool = False,
+) -> str:
+    """
+    Construct canonical cache key based on API version, route name,
+    auth scope, request URL path and sorted query parameters
+    """
+    params = sorted(
+        (param, val)
+        for param in request.GET
+        for val in request.GET.getlist(param)
+    )
+    raw = f'{request.path}?{urlencode(params)}'
+    if per_user and request.user.is_authenticated:
+        scope = f'user:{request.user.pk}'
+    else:
+        scope = 'public'
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'response:{settings.API_VERSION}:{route}:{scope}:{digest}'
+
+
+def _get_tag_key(tag: str) -> str:
+    return f'tag:{tag}'
+
+
+def _init_tag_version(key: str) -> None:
+    # Versions start from the current time, so a tag evicted from the cache
+    # can not come back with a version some stale entry was stored with
+    cache.add(key, time.time_ns(), timeout=None)
+
+
+def get_tag_versions(tags: Iterable[str]) -> dict[str, int]:
+    """Current versions of the tags, fetched in one round trip"""
+    keys = {tag: _get_tag_key(tag) for tag in tags}
+    stored = cache.get_many(keys.values())
+    missing = [key for key in keys.values() if key not in stored]
+    if missing:
+        for key in missing:
+            _init_tag_version(key)
+        stored.update(cache.get_many(missing))
+    return {tag: stored[key] for tag, key in keys.items()}
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate every entry tagged with any of the tags by bumping
+    the tag versions, which costs one cache operation per tag
+    """
+    for tag in tags:
+        key = _get_tag_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            _init_tag_version(key)
+
+
+def invalidate_tags_on_commit(*tags: str) -> None:
+    """
+    Invalidate the tags once the current transaction is committed,
+    so entries can not be recomputed from data which is about to change
+    """
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    value: Any
+    fresh_until: float
+    versions: dict[str, int]
+
+    def is_fresh(self) -> bool:
+        return (
+            time.time() < self.fresh_until
+            and self.versions == get_tag_versions(self.versions)
+        )
+
+
+def _acquire_lock(key: str, timeout: int) -> str | None:
+    token = uuid.uuid4().hex
+    return token if cache.add(f'lock:{key}', token, timeout) else None
+
+
+def _release_lock(key: str, token: str) -> None:
+    # The lock may have expired and be taken by another process
+    if cache.get(f'lock:{key}') == token:
+        cache.delete(f'lock:{key}')
+
+
+def _get_or_compute(
+    key: str,
+    compute: Callable[[], tuple[Any, dict[str, int]]],
+    timeout: int,
+    metric: str,
+    stale_timeout: int = settings.CACHE_STALE_TIMEOUT,
+    lock_timeout: int = settings.CACHE_LOCK_TIMEOUT,
+) -> Any:
+    """
+    Single-flight recomputation of 'key', 'compute' returns the value
+    and the versions of the tags it depends on
+    """
+    entry: _CacheEntry | None = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        increment_metric(f'{metric}:hits')
+        return entry.value
+    token = _acquire_lock(key, lock_timeout)
+    if token is None:
+        if entry is not None:
+            increment_metric(f'{metric}:stale')
+            return entry.value
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            entry = cache.get(key)
+            if entry is None:
+                # The lock may be released without a value (the holder
+                # failed or its result is not cached), a waiter takes over
+                token = _acquire_lock(key, lock_timeout)
+                if token is None:
+                    continue
+                # The value is stored before the lock is released
+                entry = cache.get(key)
+                if entry is None:
+                    break
+                _release_lock(key, token)
+            increment_metric(f'{metric}:hits')
+            return entry.value
+    increment_metric(f'{metric}:misses')
+    try:
+        value, versions = compute()
+        entry = _CacheEntry(
+            value=value,
+            fresh_until=time.time() + timeout,
+            versions=versions,
+        )
+        cache.set(key, entry, timeout + stale_timeout)
+    finally:
+        if token is not None:
+            _release_lock(key, token)
+    return value
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int,
+    tags: Iterable[str] = (),
+    metric: str | None = None,
+    stale_timeout: int = settings.CACHE_STALE_TIMEOUT,
+    lock_timeout: int = settings.CACHE_LOCK_TIMEOUT,
+) -> Any:
+    """
+    Return the cached result of 'compute' protecting it from stampedes:
+    - only the process holding the lock of the key recomputes it
+    - while it does, others are served the stale value, which is kept for
+      'stale_timeout' seconds after it expires or its tags are invalidated
+    - without any value to serve, others wait for the lock holder, one
+      of them takes the lock over if it is released without a value,
+      and they compute the value themselves if it does not finish in time
+    """
+
+    def compute_with_versions() -> tuple[Any, dict[str, int]]:
+        # Versions are taken first, so changes made during the computation
+        # invalidate the new entry
+        versions = get_tag_versions(tags)
+        return compute(), versions
+
+    return _get_or_compute(
+        key=key,
+        compute=compute_with_versions,
+        timeout=timeout,
+        metric=f'cache:{metric or key}',
+        stale_timeout=stale_timeout,
+        lock_timeout=lock_timeout,
+    )
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class TokenBucket:
+    """
+    Token buckets shared by all processes through the cache, each of them
+    holds up to 'capacity' tokens and gains 'rate' tokens a second.
+    Buckets are updated under the lock of their key
+    """
+
+    capacity: float
+    rate: float
+    lock_timeout: int = settings.CACHE_LOCK_TIMEOUT
+
+    def consume(self, key: str, tokens: float = 1) -> float:
+        """
+        Takes 'tokens' from the bucket of the key, returns 0 if there were
+        enough of them or the number of seconds until there will be
+        """
+        token = _acquire_lock(f'bucket:{key}', self.lock_timeout)
+        deadline = time.monotonic() + self.lock_timeout
+        while token is None and time.monotonic() < deadline:
+            time.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            token = _acquire_lock(f'bucket:{key}', self.lock_timeout)
+        try:
+            now = time.time()
+            # Buckets expire once they would be full again
+            level, updated_at = cache.get(f'bucket:{key}', (self.capacity, now))
+            level = min(self.capacity, level + (now - updated_at) * self.rate)
+            wait = 0.0
+            if level < tokens:
+                wait = (tokens - level) / self.rate
+            else:
+                level -= tokens
+            cache.set(
+                f'bucket:{key}',
+                (level, now),
+                math.ceil((self.capacity - level) / self.rate) + 1,
+            )
+        finally:
+            if token is not None:
+                _release_lock(f'bucket:{key}', token)
+        return wait
+
+
+@dataclass(eq=False, repr=False, slots=True)
+class EntityCache:
+    """
+    Cache-aside storage of entities by id: the per-process LRU is checked
+    first, then the shared cache, then the entity is loaded.
+    LRU hits are served without a network round trip, changes made by
+    other processes are seen once the short timeout of the LRU runs out.
+    Entries of the shared cache keep the version of the entity tag
+    ('<name>:<id>') they were loaded under and are reloaded once
+    the tag is invalidated
+    """
+
+    name: str
+    local: LRUCache
+    timeout: int
+
+    def _get_key(self, id: Any) -> str:
+        return f'entity:{self.name}:{id}'
+
+    def _get_tag(self, id: Any) -> str:
+        return f'{self.name}:{id}'
+
+    def get_or_load(self, id: Any, load: Callable[[], Any]) -> Any:
+        key = self._get_key(id)
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry.value
+        versions = get_tag_versions([self._get_tag(id)])
+        entry = cache.get(key)
+        if entry is not None and entry.versions == versions:
+            increment_metric(f'entity-cache:{self.name}:shared-hits')
+        else:
+            increment_metric(f'entity-cache:{self.name}:misses')
+            value = load()
+            # Missing entities are not cached
+            if value is None:
+                return None
+            entry = _CacheEntry(
+                value=value,
+                fresh_until=time.time() + self.timeout,
+                versions=versions,
+            )
+            cache.set(key, entry, self.timeout)
+        self.local.set(key, entry)
+        return entry.value
+
+    def delete(self, *ids: Any) -> None:
+        keys = [self._get_key(id) for id in ids]
+        for key in keys:
+            self.local.delete(key)
+        cache.delete_many(keys)
+        invalidate_tags(*(self._get_tag(id) for id in ids))
+
+
+@lru_cache(maxsize=None)
+def get_entity_cache(name: str) -> EntityCache:
+    """The entity cache shared by services and signals of the process"""
+    return EntityCache(
+        name=name,
+        local=LRUCache(
+            maxsize=settings.ENTITY_LOCAL_CACHE_MAXSIZE,
+            timeout=settings.ENTITY_LOCAL_CACHE_TIMEOUT,
+        ),
+        timeout=settings.ENTITY_CACHE_TIMEOUT,
+    )
+
+
+def get_response_cache_timeout(route: str) -> int:
+    return settings.RESPONSE_CACHE_TIMEOUTS.get(
+        route, settings.DEFAULT_RESPONSE_CACHE_TIMEOUT
+    )
+
+
+class _UncachedResponse(Exception):
+    def __init__(self, response: Any) -> None:
+        self.response = response
 
 
-# TODO: to make somehow this class work
 class cache_handler:  # noqa
+    """
+    Cache successful responses of a ninja handler as serialized JSON.
+    Usage:
+        @router.get('', response=...)
+        @cache_handler(route='vacancy-list')
+        def handler(request, ...): ...
+    Responses of per_user routes are cached for every user separately,
+    other routes share their cache between all users.
+    'tags' maps a handler response to the tags it depends on, the entry
+    is stored with the tag versions and is recomputed once any of them
+    is bumped, by one process at a time as in get_or_compute
+    """
+
+    renderer = JSONRenderer()
+
     def __init__(
         self,
-        timeout: int = settings.DEFAULT_RESPONSE_CACHE_TIMEOUT
+        route: str,
+        timeout: int | None = None,
+        per_user: bool = False,
+        tags: Callable[[Any], Iterable[str]] | None = None,
     ) -> None:
-        self.timeout = timeout
+        self.route = route
+        self.timeout = (
+            timeout if timeout is not None
+            else get_response_cache_timeout(route)
+        )
+        self.per_user = per_user
+        self.tags = tags
+
+    def _to_response(self, content: bytes) -> HttpResponse:
+        return HttpResponse(content, content_type=self.renderer.media_type)
 
     def __call__(self, func: Callable) -> Callable:
-        def wrapper(request: HttpRequest, *args, **kwargs) -> Any | dict:
-            cache_key = generate_cache_key_from_request(request)
-            response = cache.get(cache_key)
-            if response:
-                return response
-            handler_response = func(request, *args, **kwargs)
-            cache.set(cache_key, self.timeout)
-            return handler_response
+        @wraps(func)
+        def wrapper(request: HttpRequest, *args, **kwargs) -> Any:
+            def compute() -> tuple[bytes, dict[str, int]]:
+                handler_response = func(request, *args, **kwargs)
+                # Errors are returned as Django responses and are not cached
+                if not isinstance(handler_response, BaseModel):
+                    raise _UncachedResponse(handler_response)
+                content = self.renderer.render(
+                    request,
+                    handler_response.model_dump(),
+                    response_status=200,
+                ).encode()
+                tags = (
+                    self.tags(handler_response)
+                    if self.tags is not None
+                    else ()
+                )
+                return content, get_tag_versions(tags)
+
+            cache_key = generate_cache_key_from_request(
+                request, route=self.route, per_user=self.per_user
+            )
+            try:
+                content = _get_or_compute(
+                    key=cache_key,
+                    compute=compute,
+                    timeout=self.timeout,
+                    metric=f'response-cache:{self.route}',
+                )
+            except _UncachedResponse as e:
+                return e.response
+            return self._to_response(content)
+
         return wrapper
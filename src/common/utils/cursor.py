@@ -0,0 +1,101 @@
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db.models import Field, Q, QuerySet
+
+from src.core.exceptions import InvalidCursor
+
+
+def _encode_value(value: Any) -> Any:
+    # DjangoJSONEncoder drops microseconds, which breaks timestamp keysets
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode values of the ordering fields into an opaque cursor"""
+    raw = json.dumps(list(values), default=_encode_value)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _get_ordering_field(queryset: QuerySet, name: str) -> Field:
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        return annotation.output_field
+    return queryset.model._meta.get_field(name)
+
+
+def decode_cursor(
+    cursor: str,
+    queryset: QuerySet,
+    ordering: Sequence[str],
+) -> list[Any]:
+    """
+    Decode the cursor and convert its values to python types
+    of the ordering fields (or annotations of the queryset),
+    raises InvalidCursor if it is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor(cursor)
+    try:
+        return [
+            _get_ordering_field(queryset, name.lstrip('-')).to_python(value)
+            for name, value in zip(ordering, values)
+        ]
+    except ValidationError:
+        raise InvalidCursor(cursor)
+
+
+def _build_keyset_query(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    Build a condition selecting rows placed after 'values' in 'ordering':
+    (a > x) OR (a = x AND b > y) OR ...
+    The leading field is also bound with >= so Postgres can start
+    the index range scan at the cursor position instead of filtering
+    """
+    query = Q()
+    equal = Q()
+    for name, value in zip(ordering, values):
+        field = name.lstrip('-')
+        lookup = 'lt' if name.startswith('-') else 'gt'
+        query |= equal & Q(**{f'{field}__{lookup}': value})
+        equal &= Q(**{field: value})
+    leading = ordering[0]
+    lookup = 'lte' if leading.startswith('-') else 'gte'
+    return Q(**{f'{leading.lstrip("-")}__{lookup}': values[0]}) & query
+
+
+def paginate_by_cursor(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[Any], str | None]:
+    """
+    Keyset pagination over a unique 'ordering' (the last field
+    must be unique, e.g. primary key), annotations may be ordered by too.
+    Returns models of the page and a cursor of the next page
+    or None if the page is the last one
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        values = decode_cursor(cursor, queryset, ordering)
+        queryset = queryset.filter(_build_keyset_query(ordering, values))
+    models = list(queryset[: limit + 1])
+    if len(models) <= limit:
+        return models, None
+    models = models[:limit]
+    last = models[-1]
+    next_cursor = encode_cursor(
+        [getattr(last, name.lstrip('-')) for name in ordering]
+    )
+    return models, next_cursor
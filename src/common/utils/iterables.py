@@ -0,0 +1,15 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+
+T = TypeVar('T')
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Splits the iterable into lists of 'size' items lazily,
+    the last list may be shorter
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,20 @@
+from django.core.cache import cache
+
+
+def _get_metric_key(name: str) -> str:
+    return f'metrics:{name}'
+
+
+def increment_metric(name: str, delta: int = 1) -> None:
+    """Increment a counter shared by all processes through the cache"""
+    key = _get_metric_key(name)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # The counter does not exist yet, another process may create it first
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_metric(name: str) -> int:
+    return cache.get(_get_metric_key(name), 0)
@@ -14,3 +14,15 @@ class CandidateDoesNotExist(NotFound):
     def __init__(self, candidate_id: int) -> None:
         self.candidate_id = candidate_id
         self.message = f'Candidate with id "{candidate_id}" does not exist'
+
+
+class VacancyAccessDenied(ApplicationException):
+    def __init__(self, vacancy_id: int) -> None:
+        self.vacancy_id = vacancy_id
+        self.message = f'Vacancy "{vacancy_id}" belongs to another employer'
+
+
+class InvalidCursor(ApplicationException):
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        self.message = f'Invalid pagination cursor: "{cursor}"'
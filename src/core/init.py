@@ -14,25 +14,18 @@ class InitConfig(AppConfig):
     def ready(self):
         from celery import current_app
 
-        from src.common.services.base import BaseNotificationService
         from src.common.services.notifications import CeleryNotificationService
         from src.common.container import container
 
         logger = container.resolve(Logger)
 
         # Init Celery worker
-        service = container.resolve(BaseNotificationService)
-        if service.__class__ == CeleryNotificationService:
-            logger.info(
-                'Using Celery worker',
-                extra={'info': f'__class__: {service.__class__}'},
-            )
-            current_app.register_task(service)  # type: ignore
-        else:
-            logger.warning(
-                msg='BaseNotificationService is not Celery task',
-                extra={'info': f'__class__: {service.__class__}'},
-            )
+        service = container.resolve(CeleryNotificationService)
+        logger.info(
+            'Using Celery worker',
+            extra={'info': f'__class__: {service.__class__}'},
+        )
+        current_app.register_task(service)  # type: ignore
         # Log information about cache
         cache_backend = settings.CACHES['default']['BACKEND']
         cache_location = settings.CACHES['default']['LOCATION']
@@ -25,9 +25,11 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'src.apps.users.apps.UsersConfig',
     'src.apps.vacancies.apps.VacanciesConfig',
     'src.apps.profiles.apps.ProfilesConfig',
+    'src.apps.notifications.apps.NotificationsConfig',
     'src.core.init.InitConfig',
     'rest_framework_simplejwt',
 ]
@@ -101,12 +103,98 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 EMAIL_FROM = 'kerelkobarabash@gmail.com'
+# Emails of a notification group sent over the connection at once
+EMAIL_BATCH_SIZE = 100
 
 CELERY_TIMEZONE = 'Europe/Kiev'
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 6
+CELERY_BEAT_SCHEDULE = {
+    'relay-outbox': {
+        'task': 'src.apps.notifications.tasks.relay_outbox',
+        'schedule': 5.0,
+    },
+    'flush-notification-digests': {
+        'task': 'src.apps.notifications.tasks.flush_notification_digests',
+        'schedule': 60.0,
+    },
+}
+
+API_VERSION = '1.0.0'
 
 DEFAULT_RESPONSE_CACHE_TIMEOUT = 60 * 10
+# Per-route timeouts of cached responses, keyed by the cache_handler route
+RESPONSE_CACHE_TIMEOUTS = {
+    'vacancy-list': 60,
+    'vacancy-detail': 60 * 5,
+}
+
+# Expired cache entries are served for CACHE_STALE_TIMEOUT seconds
+# while a single process holding the lock recomputes them
+CACHE_STALE_TIMEOUT = 60 * 5
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_POLL_INTERVAL = 0.05
+
+# Entities are cached in the shared cache and in a small LRU of every process.
+# Shared entries are checked against the entity tag before they are served,
+# LRU entries are trusted for ENTITY_LOCAL_CACHE_TIMEOUT seconds, which
+# bounds how long changes made by other processes may go unseen
+ENTITY_CACHE_TIMEOUT = 60 * 10
+ENTITY_LOCAL_CACHE_TIMEOUT = 10
+ENTITY_LOCAL_CACHE_MAXSIZE = 1024
+
+# Candidates are ranked by the match scores maintained in the background
+# ('precomputed') or scored on request in Python ('python') or the database
+# ('sql')
+CANDIDATE_RANKING_BACKEND = 'precomputed'
+# Applications are scored and upserted into MatchScore by batches
+MATCH_SCORE_BATCH_SIZE = 1000
+# The best candidates of a vacancy are ranked and cached at once
+CANDIDATE_RANKING_CACHE_SIZE = 1000
+CANDIDATE_RANKING_CACHE_TIMEOUT = 60 * 10
+
+# Jobseekers matching a vacancy are rated from a shortlist of at most
+# CANDIDATE_MATCHES_SHORTLIST_SIZE profiles, the best of them are cached
+CANDIDATE_MATCHES_SIZE = 100
+CANDIDATE_MATCHES_SHORTLIST_SIZE = 10_000
+CANDIDATE_MATCHES_CACHE_TIMEOUT = 60 * 10
+
+# Rows fetched from the database at once when querysets are streamed
+ITERATOR_CHUNK_SIZE = 2000
+# Recipients of group notifications are sent by chunks,
+# a failed chunk is retried NOTIFICATION_MAX_RETRIES times
+NOTIFICATION_CHUNK_SIZE = 500
+NOTIFICATION_MAX_RETRIES = 3
+NOTIFICATION_RETRY_DELAY = 60
+
+# Task calls are written to the outbox in the transaction of the change
+# and relayed to the broker by batches, see CELERY_BEAT_SCHEDULE
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+# Sent messages are kept for a week
+OUTBOX_RETENTION = 60 * 60 * 24 * 7
+
+# Notifications of recipients in the digest mode are sent together
+# once the oldest of them waited for the window or there are enough of them
+NOTIFICATION_DIGEST_WINDOW = 60 * 15
+NOTIFICATION_DIGEST_MAX_EVENTS = 20
+# Digests sent by a flush of the scheduled task
+NOTIFICATION_DIGEST_BATCH_SIZE = 100
+# Digests being sent are claimed for this long in case the sender dies
+NOTIFICATION_DIGEST_CLAIM_TIMEOUT = 60 * 5
+
+# A recipient is notified once per idempotency key for a day
+NOTIFICATION_IDEMPOTENCY_TIMEOUT = 60 * 60 * 24
+# Token buckets of recipients per channel: up to 'capacity' notifications
+# at once, then 'rate' notifications a second
+NOTIFICATION_RATE_LIMITS = {
+    'email': {'capacity': 20, 'rate': 20 / (60 * 60)},
+    'phone': {'capacity': 5, 'rate': 5 / (60 * 60)},
+}
+
+# Totals of paginated lists above the threshold are estimated by the planner
+COUNT_ESTIMATE_THRESHOLD = 10_000
+COUNT_CACHE_TIMEOUT = 30
 
 LOGGING = {
     'version': 1,
@@ -1,6 +1,9 @@
 from typing import Any
 
 import pytest
+from django.core.cache import cache
+
+from src.common.utils.cache import get_entity_cache
 
 
 @pytest.fixture
@@ -20,3 +23,10 @@ def dummy_vacancy() -> dict[str, Any]:
         'employer_id': 1
     }
     return data
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    cache.clear()
+    for name in ('vacancy', 'employer', 'jobseeker'):
+        get_entity_cache(name).local.clear()
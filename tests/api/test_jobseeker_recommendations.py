@@ -0,0 +1,106 @@
+import pytest
+
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.users.models import CustomUser
+from src.apps.vacancies.models import Vacancy
+from src.apps.vacancies.services.score import ScoreCalculator
+from tests.conftest import JobSeekerProfileFactory, VacancyFactory
+
+
+URL = '/api/v1/jobseekers/me/recommendations'
+
+vacancy_skills = [
+    ['python', 'django'],
+    ['python'],
+    ['python', 'django', 'sql'],
+    ['javascript'],
+    ['django', 'docker'],
+    [],
+]
+
+
+@pytest.fixture
+def candidate(db) -> JobSeekerProfile:
+    user = CustomUser.objects.create_user(username='candidate', password='test')
+    return JobSeekerProfileFactory(
+        user=user, skills=['python', 'django'], experience=3
+    )
+
+
+@pytest.fixture
+def vacancies(employer) -> list[Vacancy]:
+    return [
+        VacancyFactory(
+            employer=employer,
+            title=f'Vacancy {i}',
+            hard_skills=skills,
+            required_experience=i % 5,
+        )
+        for i, skills in enumerate(vacancy_skills * 3)
+    ]
+
+
+def get_expected_ids(
+    candidate: JobSeekerProfile, vacancies: list[Vacancy]
+) -> list[int]:
+    calculator = ScoreCalculator()
+    candidate_entity = candidate.to_entity()
+    skills = set(candidate.skills)
+    matching = [
+        vacancy.to_entity()
+        for vacancy in vacancies
+        if skills & set(vacancy.hard_skills)
+    ]
+    matching.sort(
+        key=lambda vacancy: (
+            -calculator.get_candidate_rating(
+                candidate=candidate_entity, vacancy=vacancy
+            ),
+            vacancy.id,
+        )
+    )
+    return [vacancy.id for vacancy in matching]
+
+
+def test_recommendations_are_paginated_by_rating(client, candidate, vacancies):
+    client.force_login(candidate.user)
+    expected_ids = get_expected_ids(candidate, vacancies)
+    ids = []
+    params = {'limit': 4}
+    while True:
+        response = client.get(URL, params)
+        assert response.status_code == 200
+        data = response.json()['data']
+        assert data['pagination']['total'] == len(expected_ids)
+        ids += [item['id'] for item in data['items']]
+        if not data['pagination']['next_cursor']:
+            break
+        params['cursor'] = data['pagination']['next_cursor']
+    assert ids == expected_ids
+
+
+def test_applied_and_closed_vacancies_are_not_recommended(
+    client, candidate, vacancies
+):
+    client.force_login(candidate.user)
+    applied, closed = vacancies[0], vacancies[1]
+    applied.interested_candidates.add(candidate)
+    closed.open = False
+    closed.save()
+    response = client.get(URL, {'limit': 100})
+    ids = [item['id'] for item in response.json()['data']['items']]
+    assert applied.id not in ids
+    assert closed.id not in ids
+
+
+def test_invalid_cursor(client, candidate):
+    client.force_login(candidate.user)
+    response = client.get(URL, {'cursor': 'invalid'})
+    assert response.status_code == 400
+
+
+def test_user_without_profile(client, db):
+    user = CustomUser.objects.create_user(username='user', password='test')
+    client.force_login(user)
+    response = client.get(URL)
+    assert response.status_code == 404
@@ -0,0 +1,135 @@
+import pytest
+from django.test import Client
+
+from src.apps.profiles.models.employers import EmployerProfile
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.users.models import CustomUser
+from src.apps.vacancies.models import Vacancy, VacancyInterest
+from src.apps.vacancies.services.score import ScoreCalculator
+from tests.conftest import (
+    EmployerProfileFactory,
+    JobSeekerProfileFactory,
+    VacancyFactory,
+)
+
+
+def create_employer(username: str) -> EmployerProfile:
+    user = CustomUser.objects.create_user(username=username, password='test')
+    return EmployerProfileFactory(user=user)
+
+
+@pytest.fixture
+def employer(db) -> EmployerProfile:
+    return create_employer('employer')
+
+
+@pytest.fixture
+def client(client, employer) -> Client:
+    """Matches are requested by the employer of the vacancy"""
+    client.force_login(employer.user)
+    return client
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    vacancy = VacancyFactory(
+        employer=employer,
+        hard_skills=['python', 'django'],
+        required_experience=2,
+    )
+    for i in range(30):
+        JobSeekerProfileFactory(
+            skills=[['python', 'django', 'sql'][i % 3], 'docker'][: i % 3],
+            experience=i % 5,
+            allow_notifications=i % 4 != 0,
+        )
+    return vacancy
+
+
+def get_ids(client, vacancy: Vacancy, **params) -> list[int]:
+    response = client.get(f'/api/v1/vacancies/{vacancy.id}/matches', params)
+    assert response.status_code == 200
+    return [item['id'] for item in response.json()['data']['items']]
+
+
+def get_expected_ids(vacancy: Vacancy) -> list[int]:
+    calculator = ScoreCalculator()
+    vacancy_entity = vacancy.to_entity()
+    candidates = [
+        candidate.to_entity()
+        for candidate in JobSeekerProfile.objects.filter(
+            allow_notifications=True,
+            experience__gte=vacancy.required_experience,
+            skills__overlap=vacancy.hard_skills,
+        ).exclude(interested_in=vacancy)
+    ]
+    candidates.sort(
+        key=lambda candidate: (
+            -calculator.get_candidate_rating(
+                candidate=candidate, vacancy=vacancy_entity
+            ),
+            candidate.id,
+        )
+    )
+    return [candidate.id for candidate in candidates]
+
+
+def test_matches_are_ranked(client, vacancy):
+    expected_ids = get_expected_ids(vacancy)
+    assert expected_ids
+    assert get_ids(client, vacancy, limit=5) == expected_ids[:5]
+    assert get_ids(client, vacancy, offset=5, limit=5) == expected_ids[5:10]
+
+
+def test_matches_are_served_from_cache(
+    client, vacancy, django_assert_max_num_queries
+):
+    get_ids(client, vacancy)
+    # Session, user, employer profile and page of candidates
+    with django_assert_max_num_queries(4):
+        get_ids(client, vacancy, offset=1)
+
+
+def test_applicants_are_not_matched(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    best = get_ids(client, vacancy)[0]
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyInterest.objects.create(vacancy=vacancy, candidate_id=best)
+    assert best not in get_ids(client, vacancy)
+
+
+def test_matches_follow_requirements(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    get_ids(client, vacancy)
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.required_skills = ['sql']
+        vacancy.save()
+    assert get_ids(client, vacancy, limit=100) == get_expected_ids(vacancy)
+
+
+def test_missing_vacancy(client, db):
+    response = client.get('/api/v1/vacancies/1/matches')
+    assert response.status_code == 404
+
+
+def test_anonymous_user_is_rejected(vacancy):
+    response = Client().get(f'/api/v1/vacancies/{vacancy.id}/matches')
+    assert response.status_code == 401
+
+
+def test_other_employer_is_rejected(vacancy):
+    other_client = Client()
+    other_client.force_login(create_employer('other').user)
+    response = other_client.get(f'/api/v1/vacancies/{vacancy.id}/matches')
+    assert response.status_code == 400
+
+
+def test_jobseeker_is_rejected(vacancy):
+    user = CustomUser.objects.create_user(username='jobseeker', password='test')
+    JobSeekerProfileFactory(user=user)
+    jobseeker_client = Client()
+    jobseeker_client.force_login(user)
+    response = jobseeker_client.get(f'/api/v1/vacancies/{vacancy.id}/matches')
+    assert response.status_code == 400
@@ -0,0 +1,145 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.apps.notifications.tasks import relay_outbox
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.profiles.models.skills import Skill
+from src.apps.vacancies.models import Vacancy, VacancyInterest
+from src.apps.vacancies.services.score import ScoreCalculator
+from src.apps.vacancies.tasks import update_match_scores
+from tests.conftest import JobSeekerProfileFactory, VacancyFactory
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    vacancy = VacancyFactory(
+        employer=employer,
+        hard_skills=['python', 'django'],
+        required_experience=2,
+    )
+    candidates = JobSeekerProfile.objects.bulk_create(
+        JobSeekerProfileFactory.build(
+            skills=['python', 'django', 'sql'][: i % 4],
+            experience=i % 5,
+        )
+        for i in range(30)
+    )
+    VacancyInterest.objects.bulk_create(
+        VacancyInterest(vacancy=vacancy, candidate=candidate)
+        for candidate in candidates
+    )
+    # Bulk created applications do not send signals
+    update_match_scores(vacancy_ids=[vacancy.id])
+    return vacancy
+
+
+def get_ids(client, vacancy: Vacancy, **params) -> list[int]:
+    response = client.get(f'/api/v1/vacancies/{vacancy.id}/filter', params)
+    assert response.status_code == 200
+    return [item['id'] for item in response.json()['data']['items']]
+
+
+def get_expected_ids(vacancy: Vacancy) -> list[int]:
+    calculator = ScoreCalculator()
+    vacancy_entity = vacancy.to_entity()
+    candidates = [
+        candidate.to_entity()
+        for candidate in vacancy.interested_candidates.all()
+    ]
+    candidates.sort(key=lambda candidate: candidate.id)
+    candidates.sort(
+        key=lambda candidate: calculator.get_candidate_rating(
+            candidate=candidate, vacancy=vacancy_entity
+        ),
+        reverse=True,
+    )
+    return [candidate.id for candidate in candidates]
+
+
+def test_pages_follow_ranking_of_all_candidates(client, vacancy):
+    expected_ids = get_expected_ids(vacancy)
+    first_page = get_ids(client, vacancy, offset=0, limit=10)
+    second_page = get_ids(client, vacancy, offset=10, limit=10)
+    assert first_page == expected_ids[:10]
+    assert second_page == expected_ids[10:20]
+
+
+def test_ranking_is_served_from_cache(
+    client, vacancy, django_assert_max_num_queries
+):
+    get_ids(client, vacancy, limit=5)
+    # Page of candidates and total count
+    with django_assert_max_num_queries(2):
+        get_ids(client, vacancy, offset=5, limit=5)
+
+
+def test_new_application_invalidates_ranking(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    get_ids(client, vacancy, limit=5)
+    with django_capture_on_commit_callbacks(execute=True):
+        best = JobSeekerProfileFactory(
+            skills=['python', 'django', 'sql', 'docker'], experience=10
+        )
+        VacancyInterest.objects.create(vacancy=vacancy, candidate=best)
+    relay_outbox()
+    assert get_ids(client, vacancy, limit=5)[0] == best.id
+
+
+def test_total_counts_ranked_candidates(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    def get_total() -> int:
+        response = client.get(f'/api/v1/vacancies/{vacancy.id}/filter')
+        return response.json()['data']['pagination']['total']
+
+    assert get_total() == 30
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyInterest.objects.create(
+            vacancy=vacancy, candidate=JobSeekerProfileFactory()
+        )
+    # The application is counted once it is scored
+    assert get_total() == 30
+    relay_outbox()
+    assert get_total() == 31
+
+
+def test_missing_vacancy(client, db):
+    response = client.get('/api/v1/vacancies/1/filter')
+    assert response.status_code == 404
+
+
+def test_skill_ids_follow_skills(vacancy):
+    candidate = vacancy.interested_candidates.filter(skills__len=3).first()
+    assert candidate.skill_ids == sorted(candidate.skill_ids)
+    assert {
+        Skill.objects.get(id=id).name for id in candidate.skill_ids
+    } == {'python', 'django', 'sql'}
+    vacancy.required_skills = ['Django', 'docker', 'django']
+    vacancy.save()
+    assert vacancy.required_skills == ['django', 'docker']
+    assert vacancy.skill_ids == sorted(
+        Skill.objects.filter(name__in=['django', 'docker']).values_list(
+            'id', flat=True
+        )
+    )
+
+
+def test_skill_ids_are_not_read_back_on_save(vacancy):
+    with CaptureQueriesContext(connection) as queries:
+        created = VacancyFactory(
+            employer=vacancy.employer, hard_skills=['sql', 'python']
+        )
+        created.title = 'Senior python developer'
+        created.save()
+    assert not [
+        query for query in queries
+        if query['sql'].startswith('SELECT') and 'skill_ids' in query['sql']
+    ]
+    # The inserted ids are returned, the updated ones are loaded on access
+    assert created.skill_ids == sorted(
+        Skill.objects.filter(name__in=['sql', 'python']).values_list(
+            'id', flat=True
+        )
+    )
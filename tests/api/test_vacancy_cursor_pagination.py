@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from src.apps.vacancies.models import Vacancy
+from tests.conftest import VacancyFactory
+
+
+@pytest.fixture
+def vacancies(employer) -> list[Vacancy]:
+    now = timezone.now()
+    return Vacancy.objects.bulk_create(
+        VacancyFactory.build(
+            employer=employer,
+            title=f'Vacancy {i}',
+            # pairs of vacancies share created_at to check the id tie-breaker
+            created_at=now + timedelta(minutes=i // 2),
+        )
+        for i in range(25)
+    )
+
+
+def test_cursor_pages_cover_the_whole_list_in_order(client, vacancies):
+    ids = []
+    cursor = ''
+    while cursor is not None:
+        response = client.get(
+            '/api/v1/vacancies', {'limit': 10, 'cursor': cursor}
+        )
+        assert response.status_code == 200
+        data = response.json()['data']
+        ids.extend(item['id'] for item in data['items'])
+        cursor = data['pagination']['next_cursor']
+    expected = sorted(vacancies, key=lambda v: (v.created_at, v.id))
+    assert ids == [vacancy.id for vacancy in expected]
+
+
+def test_invalid_cursor_is_rejected(client, vacancies):
+    response = client.get('/api/v1/vacancies', {'cursor': 'not-a-cursor'})
+    assert response.status_code == 400
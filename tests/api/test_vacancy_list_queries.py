@@ -0,0 +1,33 @@
+import pytest
+from django.core.cache import cache
+
+from src.apps.vacancies.models import Vacancy, VacancyInterest
+from tests.conftest import VacancyFactory
+
+
+@pytest.fixture
+def vacancies(employer, jobseeker) -> list[Vacancy]:
+    cache.clear()
+    vacancies = Vacancy.objects.bulk_create(
+        VacancyFactory.build_batch(
+            30, employer=employer, hard_skills=['python']
+        )
+    )
+    VacancyInterest.objects.bulk_create(
+        VacancyInterest(vacancy=vacancy, candidate=jobseeker)
+        for vacancy in vacancies
+    )
+    return vacancies
+
+
+@pytest.mark.parametrize('limit', [1, 10, 30])
+def test_vacancy_list_query_count_does_not_depend_on_page_size(
+    client, vacancies, django_assert_max_num_queries, limit
+):
+    # the page, the count estimate and the exact count for small results
+    with django_assert_max_num_queries(3):
+        response = client.get('/api/v1/vacancies', {'limit': limit})
+    assert response.status_code == 200
+    items = response.json()['data']['items']
+    assert len(items) == limit
+    assert all(item['interested_candidates'] == [] for item in items)
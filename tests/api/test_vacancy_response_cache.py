@@ -0,0 +1,136 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from src.apps.vacancies.models import Vacancy
+from src.apps.vacancies.services.base import BaseVacancyService
+from src.common.container import container
+from src.common.utils.cache import invalidate_tags
+from src.common.utils.metrics import get_metric
+from tests.conftest import VacancyFactory
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    return VacancyFactory(employer=employer, hard_skills=['python', 'django'])
+
+
+def test_list_is_served_from_cache(
+    client, vacancy, django_assert_num_queries
+):
+    url = '/api/v1/vacancies?required_skills=python&required_skills=django'
+    response = client.get(url)
+    assert response.status_code == 200
+    with django_assert_num_queries(0):
+        cached_response = client.get(
+            '/api/v1/vacancies?required_skills=python&required_skills=django'
+        )
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert get_metric('response-cache:vacancy-list:misses') == 1
+    assert get_metric('response-cache:vacancy-list:hits') == 1
+
+
+def test_cache_key_does_not_depend_on_parameter_order(
+    client, vacancy, django_assert_num_queries
+):
+    client.get('/api/v1/vacancies?limit=10&search=python')
+    with django_assert_num_queries(0):
+        response = client.get('/api/v1/vacancies?search=python&limit=10')
+    assert response.status_code == 200
+    assert response.json()['data']['items'][0]['id'] == vacancy.id
+
+
+def test_different_parameters_are_cached_separately(client, vacancy):
+    client.get('/api/v1/vacancies')
+    response = client.get('/api/v1/vacancies?search=accountant')
+    assert response.json()['data']['items'] == []
+    assert get_metric('response-cache:vacancy-list:misses') == 2
+
+
+def test_detail_is_served_from_cache(
+    client, vacancy, django_assert_num_queries
+):
+    response = client.get(f'/api/v1/vacancies/{vacancy.id}')
+    assert response.status_code == 200
+    assert response.json()['data']['title'] == vacancy.title
+    with django_assert_num_queries(0):
+        cached_response = client.get(f'/api/v1/vacancies/{vacancy.id}')
+    assert cached_response.content == response.content
+
+
+def test_missing_vacancy_is_not_cached(client, db):
+    assert client.get('/api/v1/vacancies/1').status_code == 404
+    assert client.get('/api/v1/vacancies/1').status_code == 404
+    assert get_metric('response-cache:vacancy-detail:hits') == 0
+
+
+def test_new_vacancy_updates_cached_total(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    response = client.get('/api/v1/vacancies')
+    assert response.json()['data']['pagination']['total'] == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyFactory(employer=vacancy.employer, title='Django developer')
+    response = client.get('/api/v1/vacancies')
+    assert response.json()['data']['pagination']['total'] == 2
+
+
+def test_invalidated_list_is_recomputed_by_lock_holder(
+    client, vacancy, django_assert_num_queries
+):
+    response = client.get('/api/v1/vacancies')
+    invalidate_tags('vacancy-list')
+    # Another process holds the lock, the stale response is served
+    with patch('src.common.utils.cache._acquire_lock', return_value=None):
+        with django_assert_num_queries(0):
+            stale_response = client.get('/api/v1/vacancies')
+    assert stale_response.content == response.content
+    assert get_metric('response-cache:vacancy-list:stale') == 1
+
+
+def test_vacancy_update_invalidates_cached_responses(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    client.get('/api/v1/vacancies')
+    client.get(f'/api/v1/vacancies/{vacancy.id}')
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.title = 'Django developer'
+        vacancy.save()
+    response = client.get('/api/v1/vacancies')
+    assert response.json()['data']['items'][0]['title'] == 'Django developer'
+    response = client.get(f'/api/v1/vacancies/{vacancy.id}')
+    assert response.json()['data']['title'] == 'Django developer'
+
+
+def test_employer_update_invalidates_cached_vacancy(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    client.get(f'/api/v1/vacancies/{vacancy.id}')
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.employer.company_name = 'Renamed'
+        vacancy.employer.save()
+    response = client.get(f'/api/v1/vacancies/{vacancy.id}')
+    assert response.json()['data']['employer']['company_name'] == 'Renamed'
+
+
+def test_unrelated_vacancy_keeps_cached_detail(
+    client, vacancy, django_capture_on_commit_callbacks
+):
+    client.get(f'/api/v1/vacancies/{vacancy.id}')
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyFactory(title='Other')
+    client.get(f'/api/v1/vacancies/{vacancy.id}')
+    assert get_metric('response-cache:vacancy-detail:hits') == 1
+
+
+def test_vacancy_entity_is_served_from_memory(
+    client, vacancy, django_assert_num_queries
+):
+    service = container.resolve(BaseVacancyService)
+    service.get(id=vacancy.id)
+    # The shared entry is evicted, the entity tag is still valid
+    cache.delete(f'entity:vacancy:{vacancy.id}')
+    with django_assert_num_queries(0):
+        assert service.get(id=vacancy.id).title == vacancy.title
@@ -0,0 +1,52 @@
+import pytest
+
+from src.apps.vacancies.models import Vacancy
+from tests.conftest import VacancyFactory
+
+
+@pytest.fixture
+def vacancies(employer) -> dict[str, Vacancy]:
+    data = {
+        'description': VacancyFactory.build(
+            title='Team lead',
+            description='We need a python developer for our team',
+        ),
+        'title': VacancyFactory.build(
+            title='Python developer',
+            description='Backend position',
+        ),
+        'skills': VacancyFactory.build(
+            title='Backend engineer',
+            description='Web services',
+            hard_skills=['python', 'developer tools'],
+        ),
+        'typo': VacancyFactory.build(
+            title='Pyhton developer',
+            description='Backend position',
+        ),
+        'unrelated': VacancyFactory.build(
+            title='Accountant',
+            description='Finance department',
+        ),
+    }
+    for vacancy in data.values():
+        vacancy.employer = employer
+    Vacancy.objects.bulk_create(data.values())
+    return data
+
+
+def test_search_ranks_title_matches_first(client, vacancies):
+    response = client.get('/api/v1/vacancies', {'search': 'python developer'})
+    assert response.status_code == 200
+    ids = [item['id'] for item in response.json()['data']['items']]
+    assert ids[0] == vacancies['title'].id
+    assert ids.index(vacancies['skills'].id) < ids.index(
+        vacancies['description'].id
+    )
+    assert vacancies['unrelated'].id not in ids
+
+
+def test_search_tolerates_typos_in_title(client, vacancies):
+    response = client.get('/api/v1/vacancies', {'search': 'python developer'})
+    ids = [item['id'] for item in response.json()['data']['items']]
+    assert vacancies['typo'].id in ids
@@ -0,0 +1,55 @@
+import pytest
+
+from src.apps.vacancies.models import Vacancy
+from tests.conftest import VacancyFactory
+
+
+@pytest.fixture
+def vacancies(employer) -> dict[str, Vacancy]:
+    skills = {
+        'all': (['python', 'django', 'sql'], ['communication']),
+        'soft': (['python'], ['communication', 'leadership']),
+        'one': (['django'], []),
+        'none': (['java'], []),
+    }
+    data = {
+        name: VacancyFactory.build(
+            employer=employer,
+            title=name,
+            hard_skills=hard_skills,
+            soft_skills=soft_skills,
+        )
+        for name, (hard_skills, soft_skills) in skills.items()
+    }
+    Vacancy.objects.bulk_create(data.values())
+    return data
+
+
+def get_titles(client, **params) -> set[str]:
+    response = client.get('/api/v1/vacancies', params)
+    assert response.status_code == 200
+    return {item['title'] for item in response.json()['data']['items']}
+
+
+def test_all_skills_are_matched_across_hard_and_soft_skills(client, vacancies):
+    titles = get_titles(
+        client, required_skills=['Python', 'communication']
+    )
+    assert titles == {'all', 'soft'}
+
+
+def test_any_skill_is_matched(client, vacancies):
+    titles = get_titles(
+        client, required_skills=['django', 'leadership'], skills_match='any'
+    )
+    assert titles == {'all', 'soft', 'one'}
+
+
+def test_minimum_number_of_matched_skills(client, vacancies):
+    titles = get_titles(
+        client,
+        required_skills=['python', 'django', 'leadership'],
+        skills_match='any',
+        skills_min_match=2,
+    )
+    assert titles == {'all', 'soft'}
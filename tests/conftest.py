@@ -0,0 +1,71 @@
+import factory
+import pytest
+
+from src.core.celery import app as celery_app
+from src.apps.profiles.models.employers import EmployerProfile
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.models import Vacancy
+
+
+class EmployerProfileFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = EmployerProfile
+
+    first_name = 'Test'
+    last_name = 'Employer'
+    email = factory.Sequence(lambda n: f'employer{n}@test.com')
+    company_name = 'Test'
+
+
+class JobSeekerProfileFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = JobSeekerProfile
+
+    first_name = factory.Sequence(lambda n: f'Candidate {n}')
+    last_name = 'Test'
+    email = factory.Sequence(lambda n: f'candidate{n}@test.com')
+    phone = '+380000000000'
+    about_me = 'test'
+    skills = factory.LazyFunction(lambda: ['python'])
+
+
+class VacancyFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Vacancy
+
+    employer = factory.SubFactory(EmployerProfileFactory)
+    title = 'Python developer'
+    description = 'test'
+    slug = factory.Sequence(lambda n: f'vacancy-{n}')
+
+
+@pytest.fixture(autouse=True)
+def celery_eager():
+    """Tasks are run in place, brokers and result backends are never reached"""
+    settings = {
+        'CELERY_BROKER_URL': 'memory://',
+        'CELERY_BROKER_READ_URL': 'memory://',
+        'CELERY_BROKER_WRITE_URL': 'memory://',
+        'CELERY_RESULT_BACKEND': 'cache+memory://',
+        'CELERY_TASK_ALWAYS_EAGER': True,
+        'CELERY_TASK_EAGER_PROPAGATES': True,
+    }
+    saved = {key: celery_app.conf.get(key) for key in settings}
+    celery_app.conf.update(settings)
+    yield
+    celery_app.conf.update(saved)
+
+
+@pytest.fixture
+def employer(db) -> EmployerProfile:
+    return EmployerProfileFactory()
+
+
+@pytest.fixture
+def jobseeker(db) -> JobSeekerProfile:
+    return JobSeekerProfileFactory()
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    return VacancyFactory(employer=employer)
@@ -14,6 +14,11 @@ class FakeJobSeekerService(BaseJobSeekerService):
     ) -> list[JobSeekerEntity]:
         return self.jobseekers[offset:limit]
 
+    def get_list_by_cursor(
+        self, filters: JobSeekerFilters, cursor: str, limit: int = 20
+    ) -> tuple[list[JobSeekerEntity], str | None]:
+        return self.jobseekers[:limit], None
+
     def get(self, id: int) -> JobSeekerEntity | None:
         for j in self.jobseekers:
             if j.id == id:
@@ -35,3 +40,7 @@ class FakeJobSeekerService(BaseJobSeekerService):
 
     def get_by_user_id(self, user_id: int) -> JobSeekerEntity:
         ...
+
+    def get_by_ids(self, ids: list[int]) -> list[JobSeekerEntity]:
+        jobseekers = {j.id: j for j in self.jobseekers}
+        return [jobseekers[id] for id in ids if id in jobseekers]
@@ -22,6 +22,14 @@ class FakeVacancyService(BaseVacancyService):
     ) -> list[VacancyEntity]:
         return self.vacancies[offset:limit]
 
+    def get_list_by_cursor(
+        self,
+        filters: VacancyFilters,
+        cursor: str,
+        limit: int = 20,
+    ) -> tuple[list[VacancyEntity], str | None]:
+        return self.vacancies[:limit], None
+
     def get(self, id: int) -> VacancyEntity | None:
         for v in self.vacancies:
             if v.id == id:
@@ -50,3 +58,11 @@ class FakeVacancyService(BaseVacancyService):
             if v.id == vacancy_id:
                 return v.interested_candidates[offset:limit]
         return []
+
+    def get_candidates_for_ranking(
+        self, vacancy_id: int
+    ) -> list[JobSeekerEntity]:
+        for v in self.vacancies:
+            if v.id == vacancy_id:
+                return v.interested_candidates
+        return []
@@ -0,0 +1,94 @@
+import pytest
+from django.core import mail
+
+from src.common.container import container
+from src.apps.notifications.models import OutboxMessage
+from src.apps.notifications.tasks import relay_outbox
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.models import VacancyInterest
+from src.apps.vacancies.services.statuses import BaseApplicationStatusService
+from src.apps.vacancies.tasks import notify_application_status
+from tests.conftest import JobSeekerProfileFactory, VacancyFactory
+
+
+@pytest.fixture
+def interest(employer, jobseeker) -> VacancyInterest:
+    vacancy = VacancyFactory(employer=employer, company_name='Acme')
+    interest = VacancyInterest.objects.create(
+        vacancy=vacancy, candidate=jobseeker, status='viewed'
+    )
+    return VacancyInterest.objects.get(pk=interest.pk)
+
+
+def test_status_change_is_notified_from_outbox(
+    interest, django_assert_num_queries
+):
+    interest.status = 'invited'
+    # The update and the outbox message, the old status is not read again
+    with django_assert_num_queries(2):
+        interest.save(update_fields=['status', 'updated_at'])
+    assert not mail.outbox
+    relay_outbox()
+    assert [message.to for message in mail.outbox] == [
+        [interest.candidate.email]
+    ]
+    assert 'Acme' in mail.outbox[0].body
+
+
+def test_unchanged_status_is_not_notified(interest):
+    interest.cover_letter = 'changed'
+    interest.save()
+    assert not OutboxMessage.objects.filter(
+        task=notify_application_status.name
+    ).exists()
+
+
+def test_new_applications_are_not_notified(interest):
+    VacancyInterest.objects.filter(pk=interest.pk).update(status='new')
+    interest.refresh_from_db()
+    interest.status = 'viewed'
+    interest.save()
+    assert not OutboxMessage.objects.filter(
+        task=notify_application_status.name
+    ).exists()
+
+
+def test_bulk_transition_notifies_changed_applications_once(
+    interest, django_assert_max_num_queries
+):
+    candidates = JobSeekerProfile.objects.bulk_create(
+        JobSeekerProfileFactory.build_batch(6)
+    )
+    statuses = ['new', 'viewed', 'invited'] * 2
+    interests = VacancyInterest.objects.bulk_create(
+        VacancyInterest(
+            vacancy=interest.vacancy, candidate=candidate, status=status
+        )
+        for candidate, status in zip(candidates, statuses)
+    )
+    ids = [interest.id] + [interest.id for interest in interests]
+    service = container.resolve(BaseApplicationStatusService)
+    # The update and the outbox message within a savepoint
+    with django_assert_max_num_queries(4):
+        changed_ids = service.transition(interest_ids=ids, status='invited')
+    assert sorted(changed_ids) == sorted(
+        [interest.id]
+        + [i.id for i, status in zip(interests, statuses) if status != 'invited']
+    )
+    statuses_after = VacancyInterest.objects.filter(id__in=ids).values_list(
+        'status', flat=True
+    )
+    assert set(statuses_after) == {'invited'}
+    message = OutboxMessage.objects.get(task=notify_application_status.name)
+    assert sorted(message.kwargs['interest_ids']) == sorted(
+        [interest.id]
+        + [i.id for i, status in zip(interests, statuses) if status == 'viewed']
+    )
+    relay_outbox()
+    assert sorted(email for m in mail.outbox for email in m.to) == sorted(
+        [interest.candidate.email, candidates[1].email, candidates[4].email]
+    )
+    # The group keeps the subject of the vacancy
+    assert {m.subject for m in mail.outbox} == {
+        'Обновление по вакансии "Python developer"'
+    }
@@ -0,0 +1,142 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponseBadRequest
+from django.test import RequestFactory
+
+from src.common.utils.cache import (
+    cache_handler,
+    get_or_compute,
+    invalidate_tags,
+)
+from src.common.utils.metrics import get_metric
+
+
+class Computation:
+    def __init__(self, delay: float = 0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self) -> int:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.calls
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    cache.clear()
+
+
+def test_fresh_value_is_not_recomputed():
+    compute = Computation()
+    assert get_or_compute('key', compute, timeout=60) == 1
+    assert get_or_compute('key', compute, timeout=60) == 1
+    assert compute.calls == 1
+    assert get_metric('cache:key:hits') == 1
+
+
+def test_expired_value_is_recomputed():
+    compute = Computation()
+    get_or_compute('key', compute, timeout=60)
+    with patch('time.time', return_value=time.time() + 61):
+        assert get_or_compute('key', compute, timeout=60) == 2
+
+
+def test_invalidated_value_is_recomputed():
+    compute = Computation()
+    get_or_compute('key', compute, timeout=60, tags=['tag'])
+    invalidate_tags('tag')
+    assert get_or_compute('key', compute, timeout=60, tags=['tag']) == 2
+
+
+def test_stale_value_is_served_while_another_process_recomputes():
+    compute = Computation()
+    get_or_compute('key', compute, timeout=60, tags=['tag'])
+    invalidate_tags('tag')
+    cache.add('lock:key', 'another process')
+    assert get_or_compute('key', compute, timeout=60, tags=['tag']) == 1
+    assert compute.calls == 1
+    assert get_metric('cache:key:stale') == 1
+
+
+def test_concurrent_misses_compute_once():
+    compute = Computation(delay=0.2)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                get_or_compute('key', compute, timeout=60)
+            )
+        )
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert compute.calls == 1
+    assert results == [1] * 10
+
+
+def test_waiters_take_over_when_the_holder_fails():
+    calls = []
+
+    def compute() -> int:
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        if len(calls) == 1:
+            raise ConnectionError('database is unavailable')
+        return len(calls)
+
+    results, errors = [], []
+
+    def request() -> None:
+        try:
+            results.append(get_or_compute('key', compute, timeout=60))
+        except ConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Waiters do not wait for the lock timeout, one of them recomputes
+    assert time.monotonic() - start < 1
+    assert len(errors) == 1
+    assert len(calls) == 2
+    assert results == [2] * 4
+
+
+def test_uncached_responses_do_not_hold_up_waiters():
+    calls = []
+
+    @cache_handler(route='test')
+    def handler(request):
+        calls.append(request)
+        time.sleep(0.2)
+        return HttpResponseBadRequest('Invalid cursor')
+
+    statuses = []
+    threads = [
+        threading.Thread(
+            target=lambda: statuses.append(
+                handler(RequestFactory().get('/test?cursor=x')).status_code
+            )
+        )
+        for _ in range(3)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Every request computes its own error, one after another
+    assert time.monotonic() - start < 2
+    assert statuses == [400] * 3
+    assert len(calls) == 3
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+from django.db.models import F, Value
+
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.models import Vacancy
+from src.apps.vacancies.services.match_scores import BaseMatchScoreService
+from src.apps.vacancies.services.ranking import (
+    PrecomputedCandidateRanker,
+    ScoreCandidateRanker,
+    SQLCandidateRanker,
+)
+from src.apps.vacancies.services.base import BaseVacancyService
+from src.apps.vacancies.services.score import ScoreCalculator
+from src.common.container import container
+from src.apps.vacancies.tasks import update_match_scores
+
+from tests.conftest import JobSeekerProfileFactory, VacancyFactory
+from tests.services.conftest import available_skills
+
+
+calculators = [
+    ScoreCalculator(),
+    ScoreCalculator(
+        required_experience_score=7.7,
+        incr_score_if_experience_higher=False,
+        skill_matched_score=0.3,
+        skill_didnt_match_score=-0.1,
+    ),
+]
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    vacancy = VacancyFactory(
+        employer=employer,
+        hard_skills=random.sample(available_skills, k=5),
+        required_experience=2,
+    )
+    for _ in range(50):
+        candidate = JobSeekerProfileFactory(
+            skills=random.sample(available_skills, k=random.randint(0, 8)),
+            experience=random.randint(0, 6),
+        )
+        vacancy.interested_candidates.add(candidate)
+    return vacancy
+
+
+@pytest.mark.parametrize('calculator', calculators)
+def test_sql_ratings_are_equal_to_python_ratings(vacancy, calculator):
+    vacancy_entity = vacancy.to_entity()
+    score = calculator.get_rating_expression(
+        candidate_skill_ids=F('skill_ids'),
+        candidate_experience=F('experience'),
+        vacancy_skill_ids=vacancy_entity.skill_ids,
+        vacancy_required_experience=Value(vacancy.required_experience),
+    )
+    for candidate in JobSeekerProfile.objects.annotate(score=score):
+        assert candidate.score == calculator.get_candidate_rating(
+            candidate=candidate.to_entity(), vacancy=vacancy_entity
+        )
+
+
+@pytest.mark.parametrize('calculator', calculators)
+@pytest.mark.parametrize('offset,limit', [(0, 10), (10, 10), (45, 10)])
+def test_sql_ranking_is_equal_to_python_ranking(
+    vacancy, calculator, offset, limit
+):
+    python_ranker = ScoreCandidateRanker(
+        vacancy_service=container.resolve(BaseVacancyService),
+        score_calculator=calculator,
+    )
+    sql_ranker = SQLCandidateRanker(score_calculator=calculator)
+    vacancy_entity = vacancy.to_entity()
+    assert sql_ranker.rank(
+        vacancy=vacancy_entity, offset=offset, limit=limit
+    ) == python_ranker.rank(vacancy=vacancy_entity, offset=offset, limit=limit)
+
+
+@pytest.mark.parametrize('offset,limit', [(0, 10), (10, 10), (45, 10)])
+def test_precomputed_ranking_is_equal_to_sql_ranking(vacancy, offset, limit):
+    update_match_scores(vacancy_ids=[vacancy.id])
+    precomputed_ranker = PrecomputedCandidateRanker(
+        match_score_service=container.resolve(BaseMatchScoreService)
+    )
+    sql_ranker = SQLCandidateRanker(score_calculator=ScoreCalculator())
+    vacancy_entity = vacancy.to_entity()
+    assert precomputed_ranker.rank(
+        vacancy=vacancy_entity, offset=offset, limit=limit
+    ) == sql_ranker.rank(vacancy=vacancy_entity, offset=offset, limit=limit)
@@ -0,0 +1,74 @@
+from typing import Iterable
+
+import pytest
+
+from src.core.celery import app as celery_app
+from src.common.container import container
+from src.common.services.base import BaseNotificationService
+from src.common.services.notifications import (
+    CeleryNotificationService,
+    summarize_notification_group,
+)
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from tests.conftest import JobSeekerProfileFactory
+
+
+class RecordingNotificationService(BaseNotificationService):
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.groups: list[list[str]] = []
+
+    def send_notification(self, message: str, subject: str, object) -> None:
+        pass
+
+    def send_notification_group(
+        self, message: str, objects: Iterable, subject: str | None = None
+    ) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('SMTP server is unavailable')
+        self.groups.append([obj.email for obj in objects])
+
+
+@pytest.fixture
+def jobseekers(db) -> list[JobSeekerProfile]:
+    return JobSeekerProfileFactory.create_batch(5)
+
+
+@pytest.fixture
+def celery_service(monkeypatch):
+    service = container.resolve(CeleryNotificationService)
+    monkeypatch.setattr(service, 'chunk_size', 2)
+    return service
+
+
+def test_group_is_sent_by_chunks(
+    celery_service, jobseekers, monkeypatch, django_assert_max_num_queries
+):
+    recorder = RecordingNotificationService()
+    monkeypatch.setattr(celery_service, 'notification_service', recorder)
+    # One query per chunk, loaded columns are enough for the services
+    with django_assert_max_num_queries(3):
+        celery_service.send_notification_group(
+            message='test', objects=jobseekers
+        )
+    assert [len(chunk) for chunk in recorder.groups] == [2, 2, 1]
+    assert sorted(sum(recorder.groups, [])) == sorted(
+        jobseeker.email for jobseeker in jobseekers
+    )
+
+
+def test_failed_chunk_is_retried(celery_service, jobseekers, monkeypatch):
+    # Eager tasks are retried in place unless their errors are propagated
+    celery_app.conf.update({'CELERY_TASK_EAGER_PROPAGATES': False})
+    recorder = RecordingNotificationService(failures=1)
+    monkeypatch.setattr(celery_service, 'notification_service', recorder)
+    celery_service.send_notification_group(message='test', objects=jobseekers)
+    assert sum(len(chunk) for chunk in recorder.groups) == len(jobseekers)
+
+
+def test_group_summary():
+    assert summarize_notification_group([2, 2, 1], 'JobSeekerEntity') == {
+        'chunks': 3,
+        'recipients': 5,
+    }
@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Iterable
+
+import pytest
+
+from src.common.services.base import BaseNotificationService
+from src.common.services.notifications import (
+    ComposedNotificationService,
+    idempotency_key,
+    notification_key,
+)
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+
+
+class RecordingNotificationService(BaseNotificationService):
+    def __init__(self, delay: float = 0, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.chunks: list[list[int]] = []
+        self.keys: list[str | None] = []
+        self.threads: set[int] = set()
+
+    def send_notification(self, message: str, subject: str, object) -> None:
+        self.send_notification_group(message=message, objects=[object])
+
+    def send_notification_group(
+        self, message: str, objects: Iterable, subject: str | None = None
+    ) -> None:
+        time.sleep(self.delay)
+        self.threads.add(threading.get_ident())
+        self.keys.append(notification_key.get())
+        if self.error is not None:
+            raise self.error
+        self.chunks.append([obj.id for obj in objects])
+
+
+def generate_jobseekers(count: int) -> Iterable[JobSeekerEntity]:
+    return (JobSeekerEntity(id=i) for i in range(count))
+
+
+def test_every_service_gets_recipients_of_a_generator():
+    services = (RecordingNotificationService(), RecordingNotificationService())
+    composed = ComposedNotificationService(services, chunk_size=2)
+    composed.send_notification_group(
+        message='test', objects=generate_jobseekers(5)
+    )
+    for service in services:
+        assert service.chunks == [[0, 1], [2, 3], [4]]
+
+
+def test_services_are_sent_through_at_once():
+    services = tuple(RecordingNotificationService(delay=0.2) for _ in range(3))
+    composed = ComposedNotificationService(services)
+    start = time.monotonic()
+    with idempotency_key('apply:1'):
+        composed.send_notification(
+            message='test', subject='Test', object=JobSeekerEntity(id=1)
+        )
+    assert time.monotonic() - start < 0.5
+    assert len(set.union(*(service.threads for service in services))) == 3
+    assert all(service.keys == ['apply:1'] for service in services)
+
+
+def test_error_is_raised_after_every_service_finished():
+    failing = RecordingNotificationService(error=ConnectionError('SMTP'))
+    slow = RecordingNotificationService(delay=0.1)
+    composed = ComposedNotificationService((failing, slow))
+    with pytest.raises(ConnectionError):
+        composed.send_notification_group(
+            message='test', objects=generate_jobseekers(3)
+        )
+    assert slow.chunks == [[0, 1, 2]]
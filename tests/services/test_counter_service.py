@@ -0,0 +1,47 @@
+from logging import getLogger
+
+import pytest
+from django.core.cache import cache
+
+from src.apps.profiles.filters import EmployerFilter
+from src.apps.profiles.models.employers import EmployerProfile
+from src.common.services.counters import EstimatedCounterService, TotalCount
+from tests.conftest import EmployerProfileFactory
+
+
+@pytest.fixture
+def employers(db) -> list[EmployerProfile]:
+    cache.clear()
+    return EmployerProfile.objects.bulk_create(
+        EmployerProfileFactory.build(company_name='Test' if i % 2 else 'Other')
+        for i in range(10)
+    )
+
+
+def test_small_results_are_counted_exactly(employers):
+    service = EstimatedCounterService(logger=getLogger(), threshold=1000)
+    total = service.count(
+        EmployerProfile.objects.filter(company_name='Test'),
+        filters=EmployerFilter(company_name='Test'),
+    )
+    assert total == TotalCount(value=5, exact=True)
+
+
+def test_large_results_are_estimated(employers):
+    service = EstimatedCounterService(logger=getLogger(), threshold=0)
+    total = service.count(
+        EmployerProfile.objects.filter(company_name='Test'),
+        filters=EmployerFilter(company_name='Test'),
+    )
+    assert total.exact is False
+    assert total.value >= 0
+
+
+def test_counts_are_cached_by_filters(employers, django_assert_num_queries):
+    service = EstimatedCounterService(logger=getLogger(), threshold=1000)
+    queryset = EmployerProfile.objects.filter(company_name='Test')
+    filters = EmployerFilter(company_name='Test')
+    service.count(queryset, filters=filters)
+    with django_assert_num_queries(0):
+        total = service.count(queryset, filters=filters)
+    assert total.value == 5
@@ -0,0 +1,84 @@
+from logging import Logger
+from smtplib import SMTPServerDisconnected
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from src.common.container import container
+from src.common.services import notifications
+from src.common.services.notifications import EmailNotificationService
+from src.common.utils.metrics import get_metric
+
+
+class FlakyEmailBackend(EmailBackend):
+    """Loses the connection on the first 'failures' sends"""
+
+    failures = 0
+
+    def send_messages(self, messages):
+        if FlakyEmailBackend.failures:
+            FlakyEmailBackend.failures -= 1
+            raise SMTPServerDisconnected('Connection unexpectedly closed')
+        return super().send_messages(messages)
+
+
+@pytest.fixture
+def connections(monkeypatch) -> list[EmailBackend]:
+    opened = []
+
+    def get_connection(**kwargs):
+        opened.append(FlakyEmailBackend(**kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(notifications, 'get_connection', get_connection)
+    return opened
+
+
+@pytest.fixture
+def email_service(connections) -> EmailNotificationService:
+    FlakyEmailBackend.failures = 0
+    return EmailNotificationService(
+        container.resolve(Logger), batch_size=2
+    )
+
+
+def test_group_is_sent_by_batches_over_one_connection(
+    email_service, connections, jobseeker_entity, jobseeker_entity_group
+):
+    batches = get_metric('email:batches')
+    email_service.send_notification_group(
+        message='Hi all!', objects=jobseeker_entity_group
+    )
+    email_service.send_notification(
+        message='Hello', object=jobseeker_entity, subject='Test'
+    )
+    assert len(mail.outbox) == 6
+    assert len(connections) == 1
+    assert get_metric('email:batches') - batches == 4
+
+
+def test_broken_connection_is_reopened(
+    email_service, connections, jobseeker_entity_group
+):
+    reconnects = get_metric('email:reconnects')
+    FlakyEmailBackend.failures = 1
+    email_service.send_notification_group(
+        message='Hi all!', objects=jobseeker_entity_group
+    )
+    assert len(mail.outbox) == 5
+    assert len(connections) == 2
+    assert get_metric('email:reconnects') - reconnects == 1
+
+
+def test_batch_failing_after_reconnect_is_raised(
+    email_service, jobseeker_entity
+):
+    failed = get_metric('email:failed')
+    FlakyEmailBackend.failures = 2
+    with pytest.raises(SMTPServerDisconnected):
+        email_service.send_notification(
+            message='Hello', object=jobseeker_entity, subject='Test'
+        )
+    assert not mail.outbox
+    assert get_metric('email:failed') - failed == 1
@@ -0,0 +1,88 @@
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+
+from src.common.utils.cache import EntityCache, invalidate_tags
+from src.common.utils.lru import LRUCache
+
+
+@pytest.fixture
+def entity_cache() -> EntityCache:
+    cache.clear()
+    return EntityCache(
+        name='test',
+        local=LRUCache(maxsize=2, timeout=10),
+        timeout=60,
+    )
+
+
+def test_lru_evicts_least_recently_used_entry():
+    lru = LRUCache(maxsize=2, timeout=10)
+    lru.set('a', 1)
+    lru.set('b', 2)
+    lru.get('a')
+    lru.set('c', 3)
+    assert lru.get('b') is None
+    assert lru.get('a') == 1
+    assert lru.get('c') == 3
+    assert lru.stats.evictions == 1
+    assert lru.stats.hits == 3
+    assert lru.stats.misses == 1
+
+
+def test_lru_entries_expire():
+    lru = LRUCache(maxsize=2, timeout=10)
+    lru.set('a', 1)
+    with patch('time.monotonic', return_value=time.monotonic() + 11):
+        assert lru.get('a') is None
+    assert lru.stats.expirations == 1
+    assert len(lru) == 0
+
+
+def test_entity_is_loaded_once(entity_cache):
+    load = Mock(return_value='entity')
+    assert entity_cache.get_or_load(1, load) == 'entity'
+    assert entity_cache.get_or_load(1, load) == 'entity'
+    load.assert_called_once()
+    assert entity_cache.local.stats.hits == 1
+
+
+def test_entity_is_shared_between_processes(entity_cache):
+    entity_cache.get_or_load(1, Mock(return_value='entity'))
+    # Another process has its own LRU but the same shared cache
+    entity_cache.local.clear()
+    load = Mock()
+    assert entity_cache.get_or_load(1, load) == 'entity'
+    load.assert_not_called()
+
+
+def test_missing_entity_is_not_cached(entity_cache):
+    load = Mock(return_value=None)
+    entity_cache.get_or_load(1, load)
+    entity_cache.get_or_load(1, load)
+    assert load.call_count == 2
+
+
+def test_deleted_entity_is_reloaded(entity_cache):
+    entity_cache.get_or_load(1, Mock(return_value='old'))
+    entity_cache.delete(1)
+    assert entity_cache.get_or_load(1, Mock(return_value='new')) == 'new'
+
+
+def test_local_hits_do_not_look_up_tags(entity_cache):
+    entity_cache.get_or_load(1, Mock(return_value='entity'))
+    with patch('src.common.utils.cache.get_tag_versions') as get_tag_versions:
+        assert entity_cache.get_or_load(1, Mock()) == 'entity'
+    get_tag_versions.assert_not_called()
+
+
+def test_entity_changed_by_another_process_is_reloaded(entity_cache):
+    entity_cache.get_or_load(1, Mock(return_value='old'))
+    # Another process invalidates the entity tag, the local LRU is kept
+    invalidate_tags('test:1')
+    assert entity_cache.get_or_load(1, Mock(return_value='new')) == 'old'
+    # and is trusted until its entries expire
+    with patch('time.monotonic', return_value=time.monotonic() + 11):
+        assert entity_cache.get_or_load(1, Mock(return_value='new')) == 'new'
@@ -0,0 +1,100 @@
+import pytest
+
+from src.apps.notifications.tasks import relay_outbox
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.models import MatchScore, Vacancy, VacancyInterest
+from src.apps.vacancies.services.score import ScoreCalculator
+from tests.conftest import JobSeekerProfileFactory, VacancyFactory
+
+
+@pytest.fixture
+def vacancy(employer) -> Vacancy:
+    return VacancyFactory(
+        employer=employer,
+        hard_skills=['python', 'django'],
+        required_experience=2,
+    )
+
+
+@pytest.fixture
+def candidate(db) -> JobSeekerProfile:
+    return JobSeekerProfileFactory(skills=['python', 'sql'], experience=1)
+
+
+def get_expected_score(vacancy: Vacancy, candidate: JobSeekerProfile) -> float:
+    vacancy.refresh_from_db()
+    candidate.refresh_from_db()
+    return ScoreCalculator().get_candidate_rating(
+        candidate=candidate.to_entity(), vacancy=vacancy.to_entity()
+    )
+
+
+def get_score(vacancy: Vacancy, candidate: JobSeekerProfile) -> float:
+    return MatchScore.objects.get(vacancy=vacancy, candidate=candidate).score
+
+
+def test_application_is_scored(
+    vacancy, candidate, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.interested_candidates.add(candidate)
+    relay_outbox()
+    assert get_score(vacancy, candidate) == get_expected_score(
+        vacancy, candidate
+    )
+
+
+def test_scores_follow_candidate_changes(
+    vacancy, candidate, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyInterest.objects.create(vacancy=vacancy, candidate=candidate)
+    relay_outbox()
+    score = get_score(vacancy, candidate)
+    with django_capture_on_commit_callbacks(execute=True):
+        candidate.skills = ['python', 'django']
+        candidate.experience = 5
+        candidate.save()
+    relay_outbox()
+    assert get_score(vacancy, candidate) > score
+    assert get_score(vacancy, candidate) == get_expected_score(
+        vacancy, candidate
+    )
+
+
+def test_scores_follow_vacancy_requirements(
+    vacancy, candidate, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyInterest.objects.create(vacancy=vacancy, candidate=candidate)
+        vacancy.required_experience = 1
+        vacancy.save()
+    relay_outbox()
+    assert get_score(vacancy, candidate) == get_expected_score(
+        vacancy, candidate
+    )
+
+
+def test_untracked_changes_are_not_rescored(
+    vacancy, candidate, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        VacancyInterest.objects.create(vacancy=vacancy, candidate=candidate)
+    relay_outbox()
+    computed_at = MatchScore.objects.get().computed_at
+    candidate.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        candidate.about_me = 'changed'
+        candidate.save()
+    relay_outbox()
+    assert MatchScore.objects.get().computed_at == computed_at
+
+
+def test_withdrawn_application_is_unscored(
+    vacancy, candidate, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.interested_candidates.add(candidate)
+    relay_outbox()
+    vacancy.interested_candidates.remove(candidate)
+    assert not MatchScore.objects.exists()
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from src.common.container import container
+from src.common.services.exceptions import NotificationDeferred
+from src.common.services.notifications import CeleryNotificationService
+from src.apps.notifications.models import DigestEntry, NotificationMode
+from src.apps.notifications.services.digests import BaseDigestService
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from tests.conftest import JobSeekerProfileFactory
+
+
+@pytest.fixture
+def jobseekers(db) -> list[JobSeekerProfile]:
+    modes = [NotificationMode.DIGEST] * 2 + [NotificationMode.INSTANT]
+    return [
+        JobSeekerProfileFactory(notification_mode=mode) for mode in modes
+    ]
+
+
+@pytest.fixture
+def digest_service(monkeypatch) -> BaseDigestService:
+    service = container.resolve(BaseDigestService)
+    monkeypatch.setattr(service, 'max_events', 3)
+    return service
+
+
+def get_recipients() -> list[str]:
+    return sorted(email for message in mail.outbox for email in message.to)
+
+
+def test_digest_recipients_are_not_notified_at_once(jobseekers):
+    celery_service = container.resolve(CeleryNotificationService)
+    celery_service.send_notification_group(message='test', objects=jobseekers)
+    celery_service.send_notification(
+        message='test', subject='Test', object=jobseekers[0]
+    )
+    assert get_recipients() == [jobseekers[2].email]
+    assert DigestEntry.objects.filter(object_id=jobseekers[0].id).count() == 2
+    assert DigestEntry.objects.filter(object_id=jobseekers[1].id).count() == 1
+
+
+def test_digest_is_sent_once_it_has_enough_events(jobseekers, digest_service):
+    for i in range(3):
+        digest_service.add(
+            object=jobseekers[0], subject=f'Subject {i}', message=f'Event {i}'
+        )
+    digest_service.add(object=jobseekers[1], subject='Subject', message='Event')
+    assert digest_service.flush() == 1
+    assert get_recipients() == [jobseekers[0].email]
+    assert all(f'Event {i}' in mail.outbox[0].body for i in range(3))
+    assert list(
+        DigestEntry.objects.values_list('object_id', flat=True)
+    ) == [jobseekers[1].id]
+
+
+def test_digest_is_sent_after_the_window(jobseekers, digest_service):
+    digest_service.add(object=jobseekers[1], subject='Subject', message='Event')
+    assert digest_service.flush() == 0
+    DigestEntry.objects.update(
+        created_at=timezone.now() - timedelta(seconds=digest_service.window)
+    )
+    assert digest_service.flush() == 1
+    assert get_recipients() == [jobseekers[1].email]
+    assert not DigestEntry.objects.exists()
+
+
+def test_deferred_digest_does_not_hold_up_others(
+    jobseekers, digest_service, monkeypatch
+):
+    sent = []
+
+    def send_notification(message, subject, object):
+        if object.id == jobseekers[0].id:
+            raise NotificationDeferred(channel='email', count=1, retry_after=60)
+        sent.append(object.email)
+
+    monkeypatch.setattr(
+        digest_service.notification_service,
+        'send_notification',
+        send_notification,
+    )
+    for jobseeker in jobseekers[:2]:
+        for i in range(3):
+            digest_service.add(
+                object=jobseeker, subject='Subject', message=f'Event {i}'
+            )
+    assert digest_service.flush() == 1
+    assert sent == [jobseekers[1].email]
+    # Entries of the deferred digest are kept and skipped until the delay
+    assert set(DigestEntry.objects.values_list('object_id', flat=True)) == {
+        jobseekers[0].id
+    }
+    assert digest_service.flush() == 0
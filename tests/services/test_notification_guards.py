@@ -0,0 +1,150 @@
+from typing import Iterable
+
+import pytest
+
+from src.core.celery import app as celery_app
+from src.common.container import container
+from src.common.services.base import BaseNotificationService
+from src.common.services.exceptions import NotificationDeferred
+from src.common.services.notifications import (
+    CeleryNotificationService,
+    GuardedNotificationService,
+    idempotency_key,
+)
+from src.common.utils.cache import TokenBucket
+from src.common.utils.metrics import get_metric
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from tests.conftest import JobSeekerProfileFactory
+
+
+class RecordingNotificationService(BaseNotificationService):
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.sent: list[str] = []
+
+    def send_notification(self, message: str, subject: str, object) -> None:
+        self.send_notification_group(message=message, objects=[object])
+
+    def send_notification_group(
+        self, message: str, objects: Iterable, subject: str | None = None
+    ) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('SMTP server is unavailable')
+        self.sent.extend(obj.email for obj in objects)
+
+
+class FakeTokenBucket(TokenBucket):
+    """Makes recipients wait for 'waits' seconds on their first takes"""
+
+    def __init__(self, waits: list[float] = ()) -> None:
+        self.waits = list(waits)
+
+    def consume(self, key: str, tokens: float = 1) -> float:
+        return self.waits.pop(0) if self.waits else 0.0
+
+
+@pytest.fixture
+def jobseekers(db) -> list[JobSeekerProfile]:
+    return JobSeekerProfileFactory.create_batch(3)
+
+
+def get_guarded_service(
+    recorder: RecordingNotificationService, **kwargs
+) -> GuardedNotificationService:
+    return GuardedNotificationService(
+        notification_service=recorder,
+        channel='email',
+        rate_limiter=kwargs.pop('rate_limiter', FakeTokenBucket()),
+        **kwargs,
+    )
+
+
+def test_recipients_are_notified_once_per_key(jobseekers):
+    recorder = RecordingNotificationService()
+    service = get_guarded_service(recorder)
+    dropped = get_metric('notifications:email:dropped')
+    for _ in range(2):
+        with idempotency_key('apply:1'):
+            service.send_notification_group(message='test', objects=jobseekers)
+            service.send_notification(
+                message='test', subject='Test', object=jobseekers[0]
+            )
+    with idempotency_key('apply:2'):
+        service.send_notification(
+            message='test', subject='Test', object=jobseekers[0]
+        )
+    assert sorted(recorder.sent) == sorted(
+        [jobseeker.email for jobseeker in jobseekers] + [jobseekers[0].email]
+    )
+    assert get_metric('notifications:email:dropped') - dropped == 5
+
+
+def test_failed_notifications_may_be_retried(jobseekers):
+    recorder = RecordingNotificationService(failures=1)
+    service = get_guarded_service(recorder)
+    for _ in range(2):
+        with idempotency_key('apply:1'):
+            try:
+                service.send_notification_group(
+                    message='test', objects=jobseekers
+                )
+            except ConnectionError:
+                pass
+    assert len(recorder.sent) == len(jobseekers)
+
+
+def test_rate_limited_recipients_are_deferred(jobseekers):
+    recorder = RecordingNotificationService()
+    service = get_guarded_service(
+        recorder, rate_limiter=TokenBucket(capacity=2, rate=1 / 60)
+    )
+    deferred = get_metric('notifications:email:deferred')
+    for _ in range(2):
+        service.send_notification(
+            message='test', subject='Test', object=jobseekers[0]
+        )
+    with pytest.raises(NotificationDeferred) as e:
+        service.send_notification_group(message='test', objects=jobseekers)
+    assert 0 < e.value.retry_after <= 60
+    assert recorder.sent == [jobseekers[0].email] * 2 + [
+        jobseeker.email for jobseeker in jobseekers[1:]
+    ]
+    assert get_metric('notifications:email:deferred') - deferred == 1
+
+
+def test_deferred_recipients_are_retried_by_celery(jobseekers, monkeypatch):
+    # Eager tasks are retried in place unless their errors are propagated
+    celery_app.conf.update({'CELERY_TASK_EAGER_PROPAGATES': False})
+    celery_service = container.resolve(CeleryNotificationService)
+    recorder = RecordingNotificationService()
+    service = get_guarded_service(
+        recorder, rate_limiter=FakeTokenBucket(waits=[0, 0, 1])
+    )
+    monkeypatch.setattr(celery_service, 'notification_service', service)
+    celery_service.send_notification_group(message='test', objects=jobseekers)
+    # The retry does not notify the others again
+    assert sorted(recorder.sent) == sorted(
+        jobseeker.email for jobseeker in jobseekers
+    )
+
+
+def test_dropped_group_chunks_are_summed_up(jobseekers, monkeypatch, caplog):
+    celery_app.conf.update({'CELERY_TASK_EAGER_PROPAGATES': False})
+    celery_service = container.resolve(CeleryNotificationService)
+    recorder = RecordingNotificationService()
+    # The last recipient is rate limited on every retry of the chunk
+    service = get_guarded_service(
+        recorder, rate_limiter=FakeTokenBucket(waits=[0, 0, 1, 1, 1])
+    )
+    monkeypatch.setattr(celery_service, 'notification_service', service)
+    monkeypatch.setattr(celery_service, 'max_retries', 2)
+    with caplog.at_level('INFO', logger='custom'):
+        celery_service.send_notification_group(
+            message='test', objects=jobseekers
+        )
+    assert len(recorder.sent) == len(jobseekers) - 1
+    messages = [record.getMessage() for record in caplog.records]
+    assert 'Deferred notifications were dropped' in messages
+    # The chord body sums up the dropped chunk as nobody notified
+    assert 'Notification group sent' in messages
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+from src.common.container import container
+from src.apps.notifications.models import OutboxMessage
+from src.apps.notifications.services.outbox import BaseOutboxService
+
+
+calls: list[dict] = []
+
+
+@shared_task(name='tests.record_call')
+def record_call(**kwargs) -> None:
+    calls.append(kwargs)
+
+
+@pytest.fixture
+def outbox_service(db) -> BaseOutboxService:
+    calls.clear()
+    return container.resolve(BaseOutboxService)
+
+
+def test_rolled_back_transaction_publishes_nothing(outbox_service):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            outbox_service.publish(task=record_call.name, value=1)
+            raise RuntimeError
+    assert not OutboxMessage.objects.exists()
+    assert outbox_service.relay() == 0
+    assert not calls
+
+
+def test_relay_sends_pending_messages_once(outbox_service, monkeypatch):
+    monkeypatch.setattr(outbox_service, 'batch_size', 2)
+    for value in range(3):
+        outbox_service.publish(task=record_call.name, value=value)
+    assert outbox_service.relay() == 2
+    assert outbox_service.relay() == 1
+    assert outbox_service.relay() == 0
+    assert calls == [{'value': 0}, {'value': 1}, {'value': 2}]
+    assert not OutboxMessage.objects.filter(sent_at__isnull=True).exists()
+
+
+def test_failed_message_is_retried_until_max_attempts(
+    outbox_service, monkeypatch
+):
+    monkeypatch.setattr(outbox_service, 'max_attempts', 2)
+    outbox_service.publish(task='tests.missing_task')
+    assert outbox_service.relay() == 0
+    message = OutboxMessage.objects.get()
+    assert message.attempts == 1
+    assert 'tests.missing_task' in message.last_error
+    outbox_service.relay()
+    # Given up on after 'max_attempts' failures
+    assert outbox_service.relay() == 0
+    assert OutboxMessage.objects.get().attempts == 2
+
+
+def test_purge_deletes_old_sent_messages(outbox_service):
+    now = timezone.now()
+    old = timedelta(seconds=outbox_service.retention + 1)
+    OutboxMessage.objects.bulk_create(
+        [
+            OutboxMessage(task=record_call.name, sent_at=now - old),
+            OutboxMessage(task=record_call.name, sent_at=now),
+            OutboxMessage(task=record_call.name),
+        ]
+    )
+    assert outbox_service.purge() == 1
+    assert OutboxMessage.objects.count() == 2
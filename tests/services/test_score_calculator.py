@@ -0,0 +1,124 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.apps.profiles.entities.jobseekers import JobSeekerEntity
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.services.ranking import ScoreCandidateRanker
+from src.apps.vacancies.services.score import ScoreCalculator
+
+from tests.services.conftest import available_skills
+
+
+# Skills no vacancy requires are scored as well
+skill_ids = {
+    skill: id for id, skill in enumerate(available_skills + ['cobol'], start=1)
+}
+
+
+def get_skill_ids(skills: list[str]) -> list[int]:
+    return sorted(skill_ids[skill] for skill in skills)
+
+
+def generate_candidates(count: int) -> list[JobSeekerEntity]:
+    candidates = []
+    for i in range(1, count + 1):
+        skills = random.sample(list(skill_ids), k=random.randint(0, 8))
+        candidates.append(
+            JobSeekerEntity(
+                id=i,
+                skills=skills,
+                skill_ids=get_skill_ids(skills),
+                experience=random.choice([None, 0, 1, 3, 5, 10]),
+            )
+        )
+    return candidates
+
+
+def generate_vacancies(count: int) -> list[VacancyEntity]:
+    vacancies = []
+    for i in range(1, count + 1):
+        skills = random.sample(available_skills, k=random.randint(0, 6))
+        vacancies.append(
+            VacancyEntity(
+                id=i,
+                required_skills=skills,
+                skill_ids=get_skill_ids(skills),
+                required_experience=random.randint(0, 5),
+            )
+        )
+    return vacancies
+
+
+@pytest.mark.parametrize(
+    'calculator',
+    [
+        ScoreCalculator(),
+        ScoreCalculator(
+            required_experience_score=7.7,
+            incr_score_if_experience_higher=False,
+            skill_matched_score=0.3,
+            skill_didnt_match_score=-0.1,
+        ),
+    ],
+)
+def test_batch_ratings_are_equal_to_scalar_ratings(calculator):
+    vacancies = generate_vacancies(5)
+    candidates = generate_candidates(200)
+    ratings = calculator.get_ratings(vacancies, candidates)
+    assert ratings.shape == (5, 200)
+    for row, vacancy in enumerate(vacancies):
+        for column, candidate in enumerate(candidates):
+            assert ratings[row, column] == calculator.get_candidate_rating(
+                candidate=candidate, vacancy=vacancy
+            )
+
+
+def test_batch_ratings_of_no_candidates():
+    calculator = ScoreCalculator()
+    vacancy = generate_vacancies(1)[0]
+    assert calculator.get_candidates_ratings(vacancy, []).shape == (0,)
+
+
+class FakeRankingVacancyService:
+    def __init__(self, candidates: list[JobSeekerEntity]) -> None:
+        self.candidates = candidates
+
+    def get_candidates_for_ranking(
+        self, vacancy_id: int
+    ) -> list[JobSeekerEntity]:
+        return self.candidates
+
+
+@pytest.mark.parametrize('limit', [1, 10, 1000, 5000])
+def test_ranker_returns_best_candidates_ordered_by_score_and_id(limit):
+    calculator = ScoreCalculator()
+    vacancy = generate_vacancies(1)[0]
+    candidates = generate_candidates(1000)
+    random.shuffle(candidates)
+    ranker = ScoreCandidateRanker(
+        vacancy_service=FakeRankingVacancyService(candidates),  # type: ignore
+        score_calculator=calculator,
+    )
+    expected = sorted(
+        candidates,
+        key=lambda candidate: (
+            -calculator.get_candidate_rating(
+                candidate=candidate, vacancy=vacancy
+            ),
+            candidate.id,
+        ),
+    )
+    assert ranker.rank(vacancy=vacancy, offset=0, limit=limit) == [
+        candidate.id for candidate in expected[:limit]
+    ]
+
+
+def test_batch_ratings_of_large_pool():
+    calculator = ScoreCalculator()
+    ratings = calculator.get_candidates_ratings(
+        generate_vacancies(1)[0], generate_candidates(50_000)
+    )
+    assert ratings.shape == (50_000,)
+    assert np.isfinite(ratings).all()
@@ -0,0 +1,65 @@
+import pytest
+from django.core import mail
+
+from src.common.container import container
+from src.apps.notifications.tasks import relay_outbox
+from src.apps.profiles.models.jobseekers import JobSeekerProfile
+from src.apps.vacancies.entities import VacancyEntity
+from src.apps.vacancies.usecases.create_vacancy import CreateVacancyUseCase
+from tests.conftest import JobSeekerProfileFactory
+
+
+@pytest.fixture
+def jobseekers(db) -> dict[str, JobSeekerProfile]:
+    profiles = {
+        'python': (['python', 'sql'], True),
+        'django': (['Django'], True),
+        'javascript': (['javascript'], True),
+        'silent': (['python'], False),
+    }
+    return {
+        name: JobSeekerProfileFactory(
+            skills=skills, allow_notifications=allow_notifications
+        )
+        for name, (skills, allow_notifications) in profiles.items()
+    }
+
+
+def get_recipients() -> set[str]:
+    return {email for message in mail.outbox for email in message.to}
+
+
+def test_only_matching_jobseekers_are_notified(
+    employer, jobseekers, django_capture_on_commit_callbacks
+):
+    use_case = container.resolve(CreateVacancyUseCase)
+    with django_capture_on_commit_callbacks(execute=True):
+        use_case.execute(
+            employer_id=employer.id,
+            entity=VacancyEntity(
+                title='Python developer',
+                description='test',
+                required_skills=['python', 'django'],
+            ),
+        )
+    # Nobody is notified before the outbox is relayed
+    assert not mail.outbox
+    relay_outbox()
+    assert get_recipients() == {
+        jobseekers['python'].email,
+        jobseekers['django'].email,
+    }
+    assert all('Python developer' in message.body for message in mail.outbox)
+
+
+def test_vacancy_without_skills_notifies_nobody(
+    employer, jobseekers, django_capture_on_commit_callbacks
+):
+    use_case = container.resolve(CreateVacancyUseCase)
+    with django_capture_on_commit_callbacks(execute=True):
+        use_case.execute(
+            employer_id=employer.id,
+            entity=VacancyEntity(title='Manager', description='test'),
+        )
+    relay_outbox()
+    assert not mail.outbox
@@ -22,7 +22,7 @@ def test_filter_candidates_in_use_case_execute(
 ) -> None:
     vacancy = filter_candidates_in_vacancy_use_case.vacancy_service.get(id=1)
     assert vacancy is not None
-    candidates = filter_candidates_in_vacancy_use_case.execute(vacancy_id=1)
+    candidates, _ = filter_candidates_in_vacancy_use_case.execute(vacancy_id=1)
     assert isinstance(candidates, list)
     if len(candidates) > 0:
         c = candidates[0]
@@ -42,7 +42,7 @@ def test_filter_candidates_in_vacancy_use_case(
     if len(vacancy.interested_candidates) < 5:
         assert False, 'not enough candidates to test the function'
     # usecase result
-    usecase_result = filter_candidates_in_vacancy_use_case.execute(
+    usecase_result, _ = filter_candidates_in_vacancy_use_case.execute(
         vacancy_id=1
     )
     # VacancyCriteria result